@@ -0,0 +1,51 @@
+#! /usr/bin/env python
+#
+# Copyright (C) 2016 Rich Lewis <rl403@cam.ac.uk>
+# License: 3-clause BSD
+
+""" Benchmark the time taken to import scikit-chem.
+
+Each import is timed in a fresh interpreter, and the slowest modules imported
+are reported using `python -X importtime`.
+
+Usage:
+    python benchmark_import.py [n_runs] [n_slowest]
+"""
+
+import subprocess
+import sys
+import time
+
+
+def time_import(module='skchem'):
+    start = time.time()
+    subprocess.check_call([sys.executable, '-c', 'import ' + module])
+    return time.time() - start
+
+
+def slowest_modules(module='skchem', n_slowest=10):
+    res = subprocess.run([sys.executable, '-X', 'importtime', '-c',
+                          'import ' + module], stderr=subprocess.PIPE,
+                         universal_newlines=True, check=True)
+    timings = []
+    # lines are of the form 'import time: self [us] | cumulative | name'
+    for line in res.stderr.splitlines()[1:]:
+        _, cumulative, name = line.split('|')
+        timings.append((int(cumulative), name.rstrip()))
+    return sorted(timings, reverse=True)[:n_slowest]
+
+
+def main(n_runs=5, n_slowest=10):
+    time_import('rdkit.Chem')  # warm the file system cache
+    baseline = min(time_import('rdkit.Chem') for _ in range(n_runs))
+    skchem = min(time_import() for _ in range(n_runs))
+    print('import rdkit.Chem: {:.3f}s'.format(baseline))
+    print('import skchem:     {:.3f}s'.format(skchem))
+    print()
+    print('{:>12}  {}'.format('cumul. (us)', 'module'))
+    for cumulative, name in slowest_modules(n_slowest=n_slowest):
+        print('{:>12}  {}'.format(cumulative, name))
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
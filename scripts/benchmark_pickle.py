@@ -0,0 +1,85 @@
+#! /usr/bin/env python
+#
+# Copyright (C) 2016 Rich Lewis <rl403@cam.ac.uk>
+# License: 3-clause BSD
+
+""" Benchmark the cost of sending molecules between processes.
+
+Compares pickling `skchem.Mol` (binary serialization, with properties) with
+the default RDKit pickling (binary serialization without properties, plus the
+instance dictionary), for pickling alone and for a round trip through a
+process pool.
+
+Usage:
+    python benchmark_pickle.py [n_mols] [n_jobs]
+"""
+
+import multiprocessing
+import pickle
+import sys
+import time
+
+import rdkit.Chem
+from rdkit.Chem import AllChem
+
+import skchem
+
+
+SMILES = ['CC(=O)Oc1ccccc1C(=O)O', 'CN1C=NC2=C1C(=O)N(C(=O)N2C)C',
+          'CC(C)Cc1ccc(cc1)C(C)C(=O)O', 'OC[C@H]1OC(O)[C@H](O)[C@@H](O)[C@@H]1O',
+          'c1ccc2c(c1)oc1ccccc12', 'CN(C)CC(Br)c1ccccc1']
+
+
+class LegacyMol(skchem.Mol):
+
+    """ A molecule pickled with the default RDKit pickling. """
+
+    __reduce__ = rdkit.Chem.Mol.__reduce__
+    __setstate__ = rdkit.Chem.Mol.__setstate__
+
+
+def make_mols(n_mols, cls=skchem.Mol):
+    mols = []
+    for i in range(n_mols):
+        mol = skchem.Mol.from_smiles(SMILES[i % len(SMILES)],
+                                     name='mol_{}'.format(i)).add_hs()
+        AllChem.EmbedMolecule(mol, randomSeed=i)
+        mol.props['source'] = 'benchmark'
+        mol.atoms.props  # create a view, as happens in normal use
+        mols.append(cls.from_super(mol))
+    return mols
+
+
+def identity(mol):
+    return mol
+
+
+def bench(name, mols, n_jobs):
+    start = time.time()
+    data = [pickle.dumps(mol, protocol=pickle.HIGHEST_PROTOCOL)
+            for mol in mols]
+    dumps = time.time() - start
+    start = time.time()
+    res = [pickle.loads(d) for d in data]
+    loads = time.time() - start
+
+    with multiprocessing.Pool(n_jobs) as pool:
+        start = time.time()
+        pool.map(identity, mols, chunksize=max(1, len(mols) // (4 * n_jobs)))
+        ipc = time.time() - start
+
+    print('{:<8} {:>10.1f} {:>10.3f} {:>10.3f} {:>10.3f} {:>8}'.format(
+        name, sum(len(d) for d in data) / len(data), dumps, loads, ipc,
+        str(res[0].name == mols[0].name)))
+
+
+def main(n_mols=10000, n_jobs=2):
+    print('{:<8} {:>10} {:>10} {:>10} {:>10} {:>8}'.format(
+        'pickling', 'bytes/mol', 'dumps (s)', 'loads (s)', 'pool (s)',
+        'name'))
+    bench('rdkit', make_mols(n_mols, LegacyMol), n_jobs)
+    bench('skchem', make_mols(n_mols), n_jobs)
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
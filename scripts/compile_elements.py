@@ -0,0 +1,25 @@
+#! /usr/bin/env python
+#
+# Copyright (C) 2016 Rich Lewis <rl403@cam.ac.uk>
+# License: 3-clause BSD
+
+""" Compile the element data to the binary table loaded by scikit-chem.
+
+This should be run whenever `skchem/resource/atom_data.csv` is changed.
+
+Usage:
+    python compile_elements.py
+"""
+
+from skchem.resource import resource, ElementTable
+
+
+def main():
+    table = ElementTable.from_csv(resource('atom_data.csv'))
+    table.save(resource('atom_data.npz'))
+    print('Compiled {} columns for {} elements.'.format(len(table.columns),
+                                                        len(table) - 1))
+
+
+if __name__ == '__main__':
+    main()
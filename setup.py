@@ -79,7 +79,7 @@ def setup_package():
         cmdclass={'test': PyTest},
         package_data = {
             'skchem.target_prediction': ['data/PIDGIN_models.pkl.gz'],
-            'skchem.resource': ['atom_data.csv'],
+            'skchem.resource': ['atom_data.csv', 'atom_data.npz'],
             'skchem.standardizers': ['default_config.xml']},
         include_package_data=True,
         install_requires=REQUIREMENTS,
@@ -5,27 +5,35 @@
 
 """ A cheminformatics library to integrate with the Scientific Python Stack """
 
+from functools import partial
+import importlib
 import logging
 
 from . import core
 from . import filters
-from . import data
 from . import features
+from . import forcefields
 from . import io
-from . import vis
-from . import cross_validation
 from . import standardizers
-from . import interact
 from . import pandas_ext
 from . import pipeline
+from . import search
 
 from .core import Mol
+from .utils.lazy import make_lazy
 from .io import read_sdf, read_smiles
 
 __version__ = '0.0.6'
 
 __all__ = ['core', 'filters', 'data', 'features', 'io', 'vis',
-           'cross_validation', 'standardizers', 'interact', 'pipeline']
+           'cross_validation', 'standardizers', 'interact', 'pipeline',
+           'search']
 
 LOGGER = logging.getLogger(__name__)
 LOGGER.addHandler(logging.NullHandler())
+
+# subpackages with heavy dependencies (h5py, fuel, matplotlib, scikit-learn,
+# ipywidgets) are only imported when first accessed
+make_lazy(__name__, {
+    name: partial(importlib.import_module, '.' + name, __name__)
+    for name in ('data', 'vis', 'cross_validation', 'interact')})
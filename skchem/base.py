@@ -9,19 +9,32 @@
 
 Base classes for scikit-chem objects.
 """
+import os
 import subprocess
 from abc import ABCMeta, abstractmethod
 import multiprocessing
-from tempfile import NamedTemporaryFile
+import threading
+from tempfile import NamedTemporaryFile, mkdtemp
+import shutil
 import time
 import logging
-
+try:
+    import queue
+except ImportError:  # py2 compat
+    import Queue as queue
+try:
+    from concurrent.futures import Future
+except ImportError:  # py2 compat, without the `futures` backport
+    Future = None
+
+import numpy as np
 import pandas as pd
+from rdkit import Chem
 
 from .utils import NamedProgressBar, DummyProgressBar
 from . import core
 from .utils import (iterable_to_series, optional_second_method, nanarray,
-                    squeeze, yaml_dump, json_dump)
+                    squeeze, yaml_dump, json_dump, RaggedArray)
 from . import io
 
 LOGGER = logging.getLogger(__name__)
@@ -191,10 +204,12 @@ class Transformer(BaseTransformer):
         elif not isinstance(mols, pd.Series):
             mols = iterable_to_series(mols)
 
-        res = pd.DataFrame(self._transform_series(mols),
-                           index=mols.index,
-                           columns=self.columns)
+        return self._assemble(self._transform_series(mols), mols.index)
+
+    def _assemble(self, results, index):
+        """ Assemble the results of `_transform_mol` for molecules. """
 
+        res = pd.DataFrame(results, index=index, columns=self.columns)
         return squeeze(res, axis=1)
 
     @property
@@ -228,6 +243,160 @@ class BatchTransformer(BaseTransformer):
         """ Transform a series of molecules to an np.ndarray. """
         pass
 
+    def coalescer(self, batch_size=64, timeout=0.05):
+        """ Return a `BatchCoalescer` for single molecule calls.
+
+        Args:
+            batch_size (int):
+                The maximum number of molecules to transform in one batch.
+            timeout (float):
+                The maximum time in seconds to wait for a batch to fill.
+
+        Returns:
+            BatchCoalescer
+        """
+        return BatchCoalescer(self, batch_size=batch_size, timeout=timeout)
+
+
+class BatchCoalescer(object):
+
+    """ Coalesce single molecule transforms into batch transforms.
+
+    Each call to `transform` on a `BatchTransformer` launches a batch job,
+    for example an external process.  A coalescer collects molecules
+    submitted from many threads (or an asyncio event loop) until either
+    `batch_size` molecules are waiting or `timeout` seconds have passed since
+    the first arrived, runs a single batch transform, and hands each caller
+    its own row.
+
+    Args:
+        transformer (BatchTransformer):
+            The transformer to use.
+        batch_size (int):
+            The maximum number of molecules to transform in one batch.
+        timeout (float):
+            The maximum time in seconds to wait for a batch to fill.
+
+    Examples:
+        >>> import skchem
+        >>> std = skchem.standardizers.ChemAxonStandardizer() # doctest:+SKIP
+        >>> with std.coalescer(batch_size=32) as coalescer: # doctest:+SKIP
+        ...     m = coalescer.transform(skchem.Mol.from_smiles('CC.CCC'))
+    """
+
+    def __init__(self, transformer, batch_size=64, timeout=0.05):
+        if Future is None:
+            raise ImportError('The futures backport is required to coalesce '
+                              'batches on Python 2.')
+        self.transformer = transformer
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker = None
+        self._closed = False
+
+    def submit(self, mol):
+        """ Submit a molecule for transformation.
+
+        Args:
+            mol (skchem.Mol):
+                The molecule to transform.
+
+        Returns:
+            concurrent.futures.Future:
+                A future for the transformed row.
+        """
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError('Cannot submit to a closed coalescer.')
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run)
+                self._worker.daemon = True
+                self._worker.start()
+            self._queue.put((mol, future))
+        return future
+
+    def transform(self, mol):
+        """ Transform a molecule, blocking until its batch has finished. """
+        return self.submit(mol).result()
+
+    def atransform(self, mol, loop=None):
+        """ Transform a molecule from an asyncio event loop.
+
+        Args:
+            mol (skchem.Mol):
+                The molecule to transform.
+            loop (asyncio.AbstractEventLoop):
+                The event loop to use. If `None`, use the current event loop.
+
+        Returns:
+            asyncio.Future:
+                An awaitable for the transformed row.
+        """
+        import asyncio
+        return asyncio.wrap_future(self.submit(mol), loop=loop)
+
+    def close(self):
+        """ Transform any waiting molecules, and stop the worker thread. """
+        with self._lock:
+            self._closed = True
+            worker = self._worker
+            if worker is not None:
+                self._queue.put(None)
+        if worker is not None:
+            worker.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _next_batch(self):
+        """ Wait for a molecule, then gather a batch around it. """
+        item = self._queue.get()
+        if item is None:
+            return None
+        batch = [item]
+        deadline = time.time() + self.timeout
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.time()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 \
+                    else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                # finish this batch, then stop
+                self._queue.put(None)
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        """ Worker loop: transform batches until closed. """
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            mols, futures = zip(*batch)
+            LOGGER.debug('Transforming coalesced batch of %s', len(mols))
+            v = self.transformer.verbose
+            self.transformer.verbose = False
+            try:
+                res = self.transformer.transform(
+                    pd.Series(mols, index=range(len(mols))))
+            except Exception as e:
+                for future in futures:
+                    future.set_exception(e)
+                continue
+            finally:
+                self.transformer.verbose = v
+            for i, future in enumerate(futures):
+                future.set_result(res.iloc[i])
+
 
 class AtomTransformer(BaseTransformer):
     """ Transformer that will produce a Panel.
@@ -239,6 +408,10 @@ class AtomTransformer(BaseTransformer):
         Transformer
     """
 
+    # whether ragged results are packed as flattened per molecule blocks
+    # (see `RaggedArray`), rather than concatenated atom rows
+    _ragged_packed = False
+
     def __init__(self, max_atoms=100, **kwargs):
         self.max_atoms = max_atoms
         self.major_axis = pd.RangeIndex(self.max_atoms, name='atom_idx')
@@ -256,15 +429,19 @@ class AtomTransformer(BaseTransformer):
         return 'batch', 'atom_idx', self.minor_axis.name
 
     @optional_second_method
-    def transform(self, mols):
+    def transform(self, mols, ragged=False):
         """ Transform objects according to the objects transform protocol.
 
         Args:
             mols (skchem.Mol or pd.Series or iterable):
                 The mol objects to transform.
+            ragged (bool):
+                Whether to return a `RaggedArray` of the unpadded per molecule
+                arrays rather than a Panel padded to `max_atoms`.  Only used
+                when transforming multiple molecules.
 
         Returns:
-            pd.Series or pd.DataFrame
+            pd.Series or pd.DataFrame or pd.Panel or RaggedArray
         """
         if isinstance(mols, core.Atom):
             # just squeeze works on series
@@ -280,8 +457,27 @@ class AtomTransformer(BaseTransformer):
         elif not isinstance(mols, pd.Series):
             mols = iterable_to_series(mols)
 
-        res = pd.Panel(self._transform_series(mols),
-                       items=mols.index,
+        if ragged:
+            return self._transform_series_ragged(mols)
+
+        return self._assemble(self._transform_series(mols), mols.index)
+
+    def _pad(self, arrays):
+        """ Pad the results of `_transform_mol` into a 3D array. """
+
+        res = nanarray((len(arrays), self.max_atoms, len(self.minor_axis)))
+        for i, ans in enumerate(arrays):
+            res[i, :len(ans), :len(self.minor_axis)] = ans
+        return res
+
+    def _assemble(self, results, index):
+        """ Assemble the results of `_transform_mol` for molecules. """
+
+        if not isinstance(results, np.ndarray):
+            results = self._pad(results)
+
+        res = pd.Panel(results,
+                       items=index,
                        major_axis=self.major_axis,
                        minor_axis=self.minor_axis)
 
@@ -321,6 +517,35 @@ class AtomTransformer(BaseTransformer):
                     res[i, :len(ans), :len(self.minor_axis)] = ans
         return res
 
+    def _transform_mol_ragged(self, mol):
+        """ Transform a Mol to an unpadded array, of length `len(mol.atoms)`.
+        """
+        return self._transform_mol(mol)
+
+    def _transform_series_ragged(self, ser):
+        """ Transform a Series<Mol> to a RaggedArray. """
+
+        if isinstance(self, BatchTransformer):
+            # batch transformers only produce padded results, so trim them
+            return RaggedArray.from_padded(self._transform_series(ser),
+                                           [len(mol.atoms) for mol in ser],
+                                           index=ser.index,
+                                           packed=self._ragged_packed)
+
+        LOGGER.debug('Transforming series of length %s with %s jobs',
+                     len(ser), self.n_jobs)
+        bar = self.optional_bar(max_value=len(ser))
+
+        if self.n_jobs == 1:
+            arrays = [self._transform_mol_ragged(mol) for mol in bar(ser)]
+        else:
+            cpy = self.copy()
+            with multiprocessing.Pool(self.n_jobs) as pool:
+                arrays = list(bar(pool.imap(cpy._transform_mol_ragged, ser)))
+        return RaggedArray.from_arrays(arrays, index=ser.index,
+                                       packed=self._ragged_packed)
+
+
 class External(object):
     """ Mixin for wrappers of external CLI tools.
 
@@ -354,16 +579,44 @@ class External(object):
         pass
 
 
+def _set_blocking(fd):
+
+    """ Clear `O_NONBLOCK` on a file descriptor (`os.set_blocking` is Python 3
+    only). """
+
+    import fcntl
+    flags = fcntl.fcntl(fd, fcntl.F_GETFL)
+    fcntl.fcntl(fd, fcntl.F_SETFL, flags & ~os.O_NONBLOCK)
+
+
 class CLIWrapper(External, BaseTransformer):
     """ CLI wrapper.
 
     Concrete classes inheriting from this must implement `_cli_args`,
-    `monitor_progress`, `_parse_outfile`, `_parse_errors`."""
+    `monitor_progress`, `_parse_outfile`, `_parse_errors`.
+
+    Args:
+        error_on_fail (bool):
+            Whether to raise an error if a molecule fails to transform.
+        warn_on_fail (bool):
+            Whether to warn if a molecule fails to transform.
+        streaming (bool):
+            Whether to stream molecules to and from the external tool through
+            named pipes rather than temporary files.  Writing the input,
+            running the tool and parsing the output are then overlapped.  Only
+            available on POSIX systems, for tools whose `_parse_outfile` can
+            consume a stream.
+    """
+
+    _streamable = True  # whether _parse_outfile can consume a file-like
 
-    def __init__(self, error_on_fail=False, warn_on_fail=True, **kwargs):
+    def __init__(self, error_on_fail=False, warn_on_fail=True, streaming=False,
+                 **kwargs):
         super(CLIWrapper, self).__init__(**kwargs)
         self.error_on_fail = error_on_fail
         self.warn_on_fail = warn_on_fail
+        self._streaming = False
+        self.streaming = streaming
 
     @property
     def n_jobs(self):
@@ -377,8 +630,28 @@ class CLIWrapper(External, BaseTransformer):
         else:
             self._n_jobs = val
 
-    def _transform_series(self, ser):
-        """ Transform a series. """
+    @property
+    def streaming(self):
+        """ bool: whether to stream data through named pipes. """
+        return self._streaming
+
+    @streaming.setter
+    def streaming(self, val):
+        if val and not hasattr(os, 'mkfifo'):
+            raise NotImplementedError('Streaming requires named pipes, which '
+                                      'are not available on this platform.')
+        if val and not self._streamable:
+            raise NotImplementedError('{} cannot parse streamed output.'.format(
+                self.__class__.__name__))
+        self._streaming = bool(val)
+
+    def _run_files(self, ser):
+        """ Run the tool through temporary files.
+
+        Returns:
+            tuple(object, str): the parsed output and the stderr.
+        """
+
         with NamedTemporaryFile(suffix='.sdf') as infile, \
                 NamedTemporaryFile() as outfile:
             io.write_sdf(ser, infile.name)
@@ -395,7 +668,121 @@ class CLIWrapper(External, BaseTransformer):
             p.wait()
             res = self._parse_outfile(outfile.name)
 
-        errs = p.stderr.read().decode()
+        return res, p.stderr.read().decode()
+
+    @staticmethod
+    def _write_stream(ser, path, bar, opened, stop):
+        """ Write a series of molecules to a path as sdf, one by one, until
+        `stop` is set.  `opened` is set once the path is open (or failed to
+        open).
+
+        The index is used as the molecule name, as for `io.write_sdf`, but the
+        molecules themselves are not modified. """
+
+        try:
+            try:
+                f = open(path, 'w')
+            finally:
+                opened.set()
+            with f:
+                for i, (idx, mol) in enumerate(zip(ser.index, ser)):
+                    if stop.is_set():
+                        break
+                    block = Chem.MolToMolBlock(mol)
+                    f.write(str(idx))
+                    f.write(block[block.find('\n'):])
+                    f.write('$$$$\n')
+                    bar.update(i + 1)
+        except (IOError, OSError) as e:
+            # the tool went away before reading everything.  This will be
+            # reported through the output and stderr.
+            LOGGER.debug('Stopped streaming input: %s', e)
+
+    def _run_streaming(self, ser):
+        """ Run the tool through named pipes.
+
+        A writer thread feeds the input pipe whilst the output pipe is parsed
+        as records arrive.  We hold our own end of the output pipe open until
+        the process exits, and then stop the writer, opening the input pipe
+        and draining what the tool did not read, so that neither side can
+        block forever if the tool fails.
+
+        Returns:
+            tuple(object, str): the parsed output and the stderr.
+        """
+
+        tmp_dir = mkdtemp()
+        keep = {}  # our own ends of the pipes, closed once the tool exits
+        try:
+            infile = os.path.join(tmp_dir, 'in.sdf')
+            outfile = os.path.join(tmp_dir, 'out')
+            os.mkfifo(infile)
+            os.mkfifo(outfile)
+
+            # a writer on the output pipe stops us seeing EOF before the tool
+            # has started writing.
+            keep['reader'] = os.open(outfile, os.O_RDONLY | os.O_NONBLOCK)
+            keep['out'] = os.open(outfile, os.O_WRONLY)
+            _set_blocking(keep['reader'])
+
+            args = self._cli_args(infile, outfile)
+            p = subprocess.Popen(args, stderr=subprocess.PIPE)
+
+            bar = self.optional_bar(max_value=len(ser))
+            opened, stop = threading.Event(), threading.Event()
+            writer = threading.Thread(target=self._write_stream,
+                                      args=(ser, infile, bar, opened, stop))
+            writer.daemon = True
+            writer.start()
+
+            errs = []
+
+            def watch():
+                errs.append(p.communicate()[1])
+                # release our end so the reader sees EOF
+                os.close(keep.pop('out'))
+                # stop the writer.  If the tool never opened its input (or
+                # stopped reading it), the writer is waiting for a reader:
+                # give it one, and read what is left until it closes.
+                stop.set()
+                keep['in'] = os.open(infile, os.O_RDONLY | os.O_NONBLOCK)
+                _set_blocking(keep['in'])
+                opened.wait()
+                while os.read(keep['in'], 65536):
+                    pass
+                os.close(keep.pop('in'))
+
+            watcher = threading.Thread(target=watch)
+            watcher.daemon = True
+            watcher.start()
+
+            try:
+                # the stream closes the reading end from here on
+                with os.fdopen(keep.pop('reader'), 'rb') as out_stream:
+                    res = self._parse_outfile(out_stream)
+            except Exception:
+                p.kill()
+                raise
+            finally:
+                watcher.join()
+                writer.join()
+                bar.finish()
+
+        finally:
+            for fd in keep.values():
+                os.close(fd)
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        return res, errs[0].decode()
+
+    def _transform_series(self, ser):
+        """ Transform a series. """
+
+        if self.streaming:
+            res, errs = self._run_streaming(ser)
+        else:
+            res, errs = self._run_files(ser)
+
         errs = self._parse_errors(errs)
         # set the index of results to that of the input, with the failed
         # indices removed
@@ -432,7 +819,9 @@ class CLIWrapper(External, BaseTransformer):
 
     @abstractmethod
     def _parse_outfile(self, outfile):
-        """ Parse the file written and return a series. """
+        """ Parse the file written and return a series.
+
+        `outfile` is a path, or a binary file-like object if streaming. """
         pass
 
     @abstractmethod
@@ -18,7 +18,7 @@ from rdkit.Chem.rdchem import GetPeriodicTable
 from rdkit.Chem.AtomPairs.Utils import NumPiElectrons
 
 from .base import ChemicalObject, PropertyView, ChemicalObjectView
-from ..resource import PERIODIC_TABLE
+from ..resource import ELEMENTS
 
 
 RD_PT = GetPeriodicTable()
@@ -257,7 +257,7 @@ class Atom(Chem.rdchem.Atom, ChemicalObject):
 
         """ float: the Van der Waals radius in angstroms. """
 
-        return PERIODIC_TABLE.van_der_waals_radius[self.atomic_number]
+        return ELEMENTS.van_der_waals_radius[self.atomic_number]
 
     @property
     def van_der_waals_volume(self):
@@ -266,7 +266,7 @@ class Atom(Chem.rdchem.Atom, ChemicalObject):
 
         $\frac{4}{3} \pi r_v^3 $ """
 
-        return PERIODIC_TABLE.van_der_waals_volume[self.atomic_number]
+        return ELEMENTS.van_der_waals_volume[self.atomic_number]
 
     _cov_dict = {
         6: {'SP': 0.60, 'SP2': 0.67, 'SP3': 0.77},
@@ -290,21 +290,21 @@ class Atom(Chem.rdchem.Atom, ChemicalObject):
             hstate = 'SP3' if hstate == 'UNSPECIFIED' else hstate
             return self._cov_dict[self.atomic_number][hstate]
         else:
-            return PERIODIC_TABLE.covalent_radius[self.atomic_number]
+            return ELEMENTS.covalent_radius[self.atomic_number]
 
     @property
     def ionisation_energy(self):
 
         """ float: the first ionisation energy in eV. """
 
-        return PERIODIC_TABLE.first_ionisation_energy[self.atomic_number]
+        return ELEMENTS.first_ionisation_energy[self.atomic_number]
 
     @property
     def electron_affinity(self):
 
         """ float: the first electron affinity in eV. """
 
-        return PERIODIC_TABLE.electron_affinity[self.atomic_number]
+        return ELEMENTS.electron_affinity[self.atomic_number]
 
     @property
     def principal_quantum_number(self):
@@ -319,21 +319,21 @@ class Atom(Chem.rdchem.Atom, ChemicalObject):
 
         """ float: the atomic polarisability in 10^{-20} m^3. """
 
-        return PERIODIC_TABLE.atomic_polarisability[self.atomic_number]
+        return ELEMENTS.atomic_polarisability[self.atomic_number]
 
     @property
     def pauling_electronegativity(self):
 
         """ float: the pauling electronegativity on Pauling scale. """
 
-        return PERIODIC_TABLE.pauling_electronegativity[self.atomic_number]
+        return ELEMENTS.pauling_electronegativity[self.atomic_number]
 
     @property
     def sanderson_electronegativity(self):
 
         """ float: the sanderson electronegativity on Pauling scale. """
 
-        return PERIODIC_TABLE.sanderson_electronegativity[self.atomic_number]
+        return ELEMENTS.sanderson_electronegativity[self.atomic_number]
 
     @property
     def kier_hall_electronegativity(self):
@@ -352,7 +352,7 @@ class Atom(Chem.rdchem.Atom, ChemicalObject):
 
         """ float: the mcgowan volume parameter"""
 
-        return PERIODIC_TABLE.mcgowan_parameter[self.atomic_number]
+        return ELEMENTS.mcgowan_parameter[self.atomic_number]
 
     @property
     def kier_hall_alpha_contrib(self):
@@ -375,7 +375,7 @@ class Atom(Chem.rdchem.Atom, ChemicalObject):
 
         """ The hexcode to use as a color for the atom. """
 
-        return PERIODIC_TABLE.hexcode[self.atomic_number]
+        return ELEMENTS.hexcode[self.atomic_number]
 
     @property
     def props(self):
@@ -421,6 +421,9 @@ class AtomView(ChemicalObjectView):
     def __len__(self):
         return self.owner.GetNumAtoms()
 
+    def _rdkit_objects(self):
+        return iter(self.owner.GetAtoms())
+
     @property
     def symbol(self):
 
@@ -617,7 +620,7 @@ class AtomView(ChemicalObjectView):
         """ np.array<float>: the Van der Waals radius of the atoms in the
         view. """
 
-        return PERIODIC_TABLE.van_der_waals_radius[self.atomic_number].values
+        return ELEMENTS.van_der_waals_radius[self.atomic_number]
 
     @property
     def van_der_waals_volume(self):
@@ -625,7 +628,7 @@ class AtomView(ChemicalObjectView):
         """ np.array<float>: the Van der Waals volume of the atoms in the
         view. """
 
-        return PERIODIC_TABLE.van_der_waals_volume[self.atomic_number].values
+        return ELEMENTS.van_der_waals_volume[self.atomic_number]
 
     @property
     def covalent_radius(self):
@@ -640,8 +643,7 @@ class AtomView(ChemicalObjectView):
         """ np.array<float>: the first ionisation energy of the atoms in the
         view. """
 
-        return PERIODIC_TABLE.first_ionisation_energy[
-            self.atomic_number].values
+        return ELEMENTS.first_ionisation_energy[self.atomic_number]
 
     @property
     def electron_affinity(self):
@@ -649,7 +651,7 @@ class AtomView(ChemicalObjectView):
         """ np.array<float>: the electron affinity of the atoms in the
         view. """
 
-        return PERIODIC_TABLE.electron_affinity[self.atomic_number].values
+        return ELEMENTS.electron_affinity[self.atomic_number]
 
     @property
     def principal_quantum_number(self):
@@ -666,7 +668,7 @@ class AtomView(ChemicalObjectView):
         """ np.array<float>: the atomic polarisability of the atoms in the
         view. """
 
-        return PERIODIC_TABLE.atomic_polarisability[self.atomic_number].values
+        return ELEMENTS.atomic_polarisability[self.atomic_number]
 
     @property
     def pauling_electronegativity(self):
@@ -674,8 +676,7 @@ class AtomView(ChemicalObjectView):
         """ np.array<float>: the pauling electronegativity of the atoms in the
         view. """
 
-        return PERIODIC_TABLE.pauling_electronegativity[
-            self.atomic_number].values
+        return ELEMENTS.pauling_electronegativity[self.atomic_number]
 
     @property
     def sanderson_electronegativity(self):
@@ -683,8 +684,7 @@ class AtomView(ChemicalObjectView):
         """ np.array<float>: the sanderson electronegativity of the atoms in
         the view. """
 
-        return PERIODIC_TABLE.sanderson_electronegativity[
-            self.atomic_number].values
+        return ELEMENTS.sanderson_electronegativity[self.atomic_number]
 
     @property
     def kier_hall_electronegativity(self):
@@ -700,7 +700,7 @@ class AtomView(ChemicalObjectView):
         """ np.array<float>: the mcgowan parameter of the atoms in the
         iew. """
 
-        return PERIODIC_TABLE.mcgowan_parameter[self.atomic_number].values
+        return ELEMENTS.mcgowan_parameter[self.atomic_number]
 
     @property
     def kier_hall_alpha_contrib(self):
@@ -725,7 +725,7 @@ class AtomView(ChemicalObjectView):
 
         """ The hexcode to use as a color for the atoms in the view. """
 
-        return PERIODIC_TABLE.hexcode[self.atomic_number].values
+        return ELEMENTS.hexcode[self.atomic_number]
 
     def adjacency_matrix(self, bond_orders=False, force=True):
 
@@ -77,6 +77,12 @@ class ChemicalObjectView(object):
 
         return list(self)
 
+    def _rdkit_objects(self):
+        """ Iterate over the underlying RDKit objects in the view, without
+        wrapping them.  Subclasses may override this for speed. """
+
+        return iter(self)
+
     def __repr__(self):
         return '<{class_} values="{values}" at {address}>'.format(
             class_=self.__class__.__name__,
@@ -218,7 +224,11 @@ class PropertyView(View):
             except ValueError:
                 return value
 
-    def __setitem__(self, key, value):
+    @classmethod
+    def _check_key(cls, key):
+
+        """ Warn if a key is not a `str` or is private, returning it as a
+        `str`. """
 
         if not isinstance(key, str):
             msg = 'RDKit property keys can only be of type `str`.' \
@@ -226,11 +236,21 @@ class PropertyView(View):
             warnings.warn(msg)
             key = str(key)
 
-        if key[0] == '_' or key in self._reserved:
-            msg = '`{value}` is a private RDKit property key. '
-            'Using this may have unintended consequences.'.format(value=value)
+        if key[0] == '_' or key in cls._reserved:
+            msg = '`{key}` is a private RDKit property key. ' \
+                  'Using this may have unintended consequences.'.format(
+                      key=key)
             warnings.warn(msg)
 
+        return key
+
+    def __setitem__(self, key, value):
+        self._set(self._check_key(key), value)
+
+    def _set(self, key, value):
+
+        """ Set a property with a checked key, typed by its value. """
+
         if isinstance(value, str):
             self._owner.SetProp(key, value)
         elif isinstance(value, (int, np.int64, np.int32)):
@@ -248,58 +268,177 @@ class PropertyView(View):
         self._owner.ClearProp(index)
 
 
+def _infer_column(values):
+
+    """ Convert a column of property values to the narrowest of int, float
+    or object dtypes, inferred for the column as a whole. """
+
+    try:
+        return pd.to_numeric(values)
+    except (ValueError, TypeError):
+        return values
+
+
+def extract_props(objs, clear=False):
+
+    """ Extract the properties of many chemical objects in a single pass.
+
+    Unlike a `PropertyView`, which infers the type of each value on access,
+    the type of each property is inferred once for all of the objects: a
+    property is numeric only if it is numeric for every object with it set.
+
+    Args:
+        objs (iterable):
+            The chemical objects, such as `skchem.Mol`s or `skchem.Atom`s.
+        clear (bool):
+            Whether to remove the properties from the objects as they are
+            extracted.
+
+    Returns:
+        pd.DataFrame:
+            The properties, one column per property key in order of first
+            occurrence, missing where an object does not have the property.
+
+    Examples:
+        >>> import skchem
+        >>> ms = [skchem.Mol.from_smiles(smi) for smi in ('C', 'CC', 'CCC')]
+        >>> for m, (a, b) in zip(ms, [('1', 'x'), ('2', '3'), ('3', None)]):
+        ...     m.props['a'] = a
+        ...     if b:
+        ...         m.props['b'] = b
+        >>> props = extract_props(ms, clear=True)
+        >>> props.a.dtype
+        dtype('int64')
+        >>> props.b.iloc[:2].tolist()
+        ['x', '3']
+        >>> len(ms[0].props)
+        0
+    """
+
+    columns = {}
+    n_objs = 0
+    for i, obj in enumerate(objs):
+        # one call for all the props, leaving string values as they are
+        props = obj.GetPropsAsDict(False, False, False)
+        for key in PropertyView._reserved:
+            props.pop(key, None)
+        for key, value in props.items():
+            positions, values = columns.setdefault(key, ([], []))
+            positions.append(i)
+            values.append(value)
+        if clear:
+            for key in props:
+                obj.ClearProp(key)
+        n_objs = i + 1
+
+    index = pd.RangeIndex(n_objs)
+    res = {}
+    for key, (positions, values) in columns.items():
+        if len(positions) < n_objs:
+            col = np.full(n_objs, None, dtype=object)
+            col[positions] = values
+        else:
+            col = np.array(values, dtype=object)
+        col = _infer_column(col)
+        res[key] = pd.Series(col, index=index, dtype=col.dtype)
+    return pd.DataFrame(res, index=index, columns=list(res))
+
+
 class MolPropertyView(View):
 
     """ Mol property wrapper.
 
-    This provides properties for the atom and bond views. """
+    This provides properties for the atom and bond views.  Properties are read
+    and written a whole column at a time, directly on the underlying RDKit
+    objects, with the type of each column inferred as a whole. """
 
     def __init__(self, obj_view):
         self._obj_view = obj_view
 
+    def _objs(self):
+        return list(self._obj_view._rdkit_objects())
+
     def keys(self):
         """ The available property keys on the object. """
 
-        res = set()
-        for atom in self._obj_view:
-            res = res.union(set(atom.props.keys()))
+        res = {}
+        for obj in self._obj_view._rdkit_objects():
+            for key in obj.GetPropNames():
+                if key[:1] != '_' and key not in PropertyView._reserved:
+                    res[key] = None
         return list(res)
 
+    def _column(self, key, default=None):
+
+        """ The values of a property, and whether any object has it set. """
+
+        objs = self._objs()
+        key = str(key)
+        col = np.full(len(objs), default, dtype=object)
+        found = False
+        for i, obj in enumerate(objs):
+            if obj.HasProp(key):
+                col[i] = obj.GetProp(key)
+                found = True
+        col = _infer_column(col)
+        return pd.Series(col, index=self._obj_view.index, name=key,
+                         dtype=col.dtype), found
+
     def get(self, key, default=None):
-        return pd.Series((a.props.get(key, default) for a in self._obj_view),
-                         index=self._obj_view.index)
+        return self._column(key, default)[0]
 
     def __getitem__(self, key):
-        if key not in self.keys():
+        res, found = self._column(key)
+        if not found:
             raise KeyError('No atoms have the property set.')
-        return self.get(key, None)
+        return res
 
     def __setitem__(self, key, value):
-        if isinstance(value, (pd.Series, dict)):
-            print('got dict or series')
-            for idx, val in pd.compat.iteritems(value):
-                self._obj_view[int(idx)].props[key] = val
+        objs = self._objs()
+        if isinstance(value, pd.Series):
+            objs = [objs[int(idx)] for idx in value.index]
+            value = value.values
+        elif isinstance(value, dict):
+            objs = [objs[int(idx)] for idx in value.keys()]
+            value = list(value.values())
         else:
-            assert len(self._obj_view) == len(value), \
+            assert len(objs) == len(value), \
                 "Must pass same number of values as atoms."
-            for atom, val in zip(self._obj_view, value):
-                atom.props[key] = val
+
+        key = PropertyView._check_key(key)
+        value = np.asarray(value)
+        if value.dtype.kind in 'biu':
+            setter, value = 'SetIntProp', value.astype(int).tolist()
+        elif value.dtype.kind == 'f':
+            setter, value = 'SetDoubleProp', value.tolist()
+        elif value.dtype.kind in 'US':
+            setter, value = 'SetProp', value.astype(str).tolist()
+        else:
+            # mixed values are typed one by one
+            for obj, val in zip(objs, value):
+                PropertyView(obj)._set(key, val)
+            return
+
+        for obj, val in zip(objs, value):
+            getattr(obj, setter)(key, val)
 
     def __delitem__(self, key):
-        for atom in self._obj_view:
-            atom.props.remove(key)
+        for obj in self._obj_view._rdkit_objects():
+            obj.ClearProp(key)
 
     def to_frame(self):
 
         """ Return a DataFrame of the properties of the view's objects. """
 
-        return pd.DataFrame(dict(self), index=self._obj_view.index)
+        res = extract_props(self._obj_view._rdkit_objects())
+        res.index = self._obj_view.index
+        return res
 
     def to_dict(self):
 
         """ Return a dict of the properties of the view's objects. """
 
-        return {k: v.tolist() for k, v in self.items()}
+        return {k: v.tolist() for k, v in self.to_frame().items()}
 
     def __str__(self):
         return str(self.to_dict())
@@ -148,6 +148,9 @@ class BondView(ChemicalObjectView):
     def __len__(self):
         return self.owner.GetNumBonds()
 
+    def _rdkit_objects(self):
+        return iter(self.owner.GetBonds())
+
     @property
     def atom_idxs(self):
 
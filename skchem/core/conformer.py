@@ -20,6 +20,76 @@ import numpy as np
 from .base import ChemicalObject, ChemicalObjectView
 
 
+def get_positions(conf):
+
+    """ Fetch the positions of a conformer in a single call.
+
+    Args:
+        conf (rdkit.Chem.Conformer):
+            The conformer.
+
+    Returns:
+        np.ndarray: the `(n_atoms, 3)` positions.
+    """
+
+    if hasattr(conf, 'GetPositions'):
+        return conf.GetPositions()
+    # older rdkit
+    return np.array([list(conf.GetAtomPosition(i))
+                     for i in range(conf.GetNumAtoms())]).reshape(-1, 3)
+
+
+def set_positions(conf, pos):
+
+    """ Store the positions of a conformer in a single call.
+
+    Args:
+        conf (rdkit.Chem.Conformer):
+            The conformer.
+        pos (np.ndarray):
+            The `(n_atoms, 3)` positions.
+    """
+
+    pos = np.ascontiguousarray(pos, dtype=np.float64)
+    if hasattr(conf, 'SetPositions'):
+        conf.SetPositions(pos)
+    else:
+        # older rdkit
+        for i, v in enumerate(pos):
+            conf.SetAtomPosition(i, v)
+
+
+def _centre(pos, mass=None):
+
+    """ The (mass weighted) centres of positions.
+
+    Works on `(n_atoms, 3)` or stacked `(n_conformers, n_atoms, 3)`
+    positions. """
+
+    if mass is None:
+        return pos.mean(axis=-2)
+    return np.tensordot(pos, mass, axes=([-2], [0])) / mass.sum()
+
+
+def _inertia_tensor(pos, mass):
+
+    """ The inertia tensors of (stacked) positions about the origin. """
+
+    r2 = (mass * (pos ** 2).sum(axis=-1)).sum(axis=-1)
+    outer = np.einsum('n,...ni,...nj->...ij', mass, pos, pos)
+    return r2[..., np.newaxis, np.newaxis] * np.eye(3) - outer
+
+
+def _canonicalize(pos, mass):
+
+    """ Centre (stacked) positions on their centre of mass, and align them
+    with their principal axes of inertia. """
+
+    pos = pos - _centre(pos, mass)[..., np.newaxis, :]
+    _, eig_vects = np.linalg.eigh(_inertia_tensor(pos, mass))
+    return np.matmul(pos, eig_vects)
+
+
 class Conformer(rdkit.Chem.rdchem.Conformer, ChemicalObject):
 
     """ Class representing a Conformer in scikit-chem. """
@@ -43,7 +113,7 @@ class Conformer(rdkit.Chem.rdchem.Conformer, ChemicalObject):
 
         # cant slice this array sadly.
 
-        return np.array([self.GetAtomPosition(i) for i in range(len(self))])
+        return get_positions(self)
 
     @positions.setter
     def positions(self, val):
@@ -57,15 +127,14 @@ class Conformer(rdkit.Chem.rdchem.Conformer, ChemicalObject):
 
         self.Set3D(bool((val[:, 2] != 0).any()))
 
-        return [self.SetAtomPosition(i, v) for i, v in enumerate(val)]
+        set_positions(self, val)
 
     @property
     def centre_of_mass(self):
 
         """ np.array: the centre of mass of the comformer. """
 
-        atomic_mass = self.owner.atoms.atomic_mass
-        return atomic_mass.dot(self.positions) / atomic_mass.sum()
+        return _centre(self.positions, self.owner.atoms.atomic_mass)
 
     @property
     def geometric_centre(self):
@@ -87,22 +156,15 @@ class Conformer(rdkit.Chem.rdchem.Conformer, ChemicalObject):
             Conformer
         """
 
-        if centre_of_mass:
-            self.positions -= self.centre_of_mass
-        else:
-            self.positions -= self.geometric_centre
+        pos = self.positions
+        mass = self.owner.atoms.atomic_mass if centre_of_mass else None
+        self.positions = pos - _centre(pos, mass)
 
     def _inertia_tensor(self):
 
         """ Calculate the inertia tensor. """
 
-        mass = self.owner.atoms.atomic_mass
-        pos = self.positions
-
-        return np.array([[((pos[:, (i % 3) - 1] ** 2 +
-                            pos[:, (j % 3) - 2] ** 2 if (i == j)
-                            else - pos[:, i] * pos[:, j]) * mass).sum()
-                          for i in range(3)] for j in range(3)])
+        return _inertia_tensor(self.positions, self.owner.atoms.atomic_mass)
 
     def align_with_principal_axes(self):
 
@@ -113,10 +175,11 @@ class Conformer(rdkit.Chem.rdchem.Conformer, ChemicalObject):
 
     def canonicalize(self):
 
-        """ Center the reference frame at the centre of mass and """
+        """ Center the reference frame at the centre of mass and align with
+        the principal axes of inertia. """
 
-        self.centre_representation(centre_of_mass=True)
-        self.align_with_principal_axes()
+        self.positions = _canonicalize(self.positions,
+                                       self.owner.atoms.atomic_mass)
 
     @property
     def id(self):
@@ -225,7 +288,37 @@ class ConformerView(ChemicalObjectView):
     @property
     def positions(self):
 
-        return np.array([conformer.positions for conformer in self])
+        """ np.ndarray: the `(n_conformers, n_atoms, 3)` positions of all the
+        conformers.
+
+        Note:
+            As for `Conformer.positions`, this is a copy of the data.
+        """
+
+        confs = self.owner.GetConformers()
+        if not len(confs):
+            return np.empty((0, self.owner.GetNumAtoms(), 3))
+        return np.stack([get_positions(conf) for conf in confs])
+
+    @positions.setter
+    def positions(self, val):
+
+        assert val.shape[0] == len(self), 'Positions must be given for each ' \
+                                          'conformer.'
+        for conformer, pos in zip(self, val):
+            conformer.positions = pos
+
+    def canonicalize(self):
+
+        """ Canonicalize all conformers at once.
+
+        Each conformer is centred at its centre of mass and aligned with its
+        principal axes of inertia, as `Conformer.canonicalize`, but with the
+        calculation vectorized across the conformers. """
+
+        if len(self):
+            self.positions = _canonicalize(self.positions,
+                                           self.owner.atoms.atomic_mass)
 
     @property
     def is_3d(self):
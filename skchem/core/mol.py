@@ -9,7 +9,7 @@
 Defining molecules in scikit-chem.
 """
 
-import copy
+from collections import defaultdict
 
 import rdkit.Chem
 import rdkit.Chem.inchi
@@ -351,17 +351,27 @@ class Mol(rdkit.Chem.rdchem.Mol, ChemicalObject):
 
         return res
 
-    def to_binary(self):
+    # the properties to serialize: all but those computed by RDKit, which are
+    # recalculated when required
+    _pickle_props = (rdkit.Chem.PropertyPickleOptions.MolProps |
+                     rdkit.Chem.PropertyPickleOptions.AtomProps |
+                     rdkit.Chem.PropertyPickleOptions.BondProps |
+                     rdkit.Chem.PropertyPickleOptions.PrivateProps)
+
+    def to_binary(self, props=True):
 
         """  Serialize the molecule to binary encoding.
 
-        Returns:
-            bytes: the molecule in bytes.
+        Args:
+            props (bool):
+                Whether to serialize the properties of the molecule, and of
+                its atoms and bonds (including the name).
 
-        Notes:
-            Due to limitations in RDKit, not all data is serialized.  Notably,
-            properties are not, so e.g. compound names are not saved."""
+        Returns:
+            bytes: the molecule in bytes."""
 
+        if props:
+            return self.ToBinary(self._pickle_props)
         return self.ToBinary()
 
     @classmethod
@@ -377,11 +387,64 @@ class Mol(rdkit.Chem.rdchem.Mol, ChemicalObject):
 
         return cls(binary)
 
-    def copy(self):
+    def __reduce__(self):
+
+        """ Pickle the molecule as its binary serialization, including its
+        properties and conformers, and any attributes other than views and
+        cached values. """
+
+        state = {key: value for key, value in self.__dict__.items()
+                 if key not in self._views and key not in self._caches and
+                 key != '_Mol__two_d'}
+        return self.__class__, (self.to_binary(),), state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+    # views, which are recreated when required rather than copied or pickled
+    _views = ('_atoms', '_bonds', '_props', '_conformers')
+
+    # values derived from the molecule, cached on it by descriptors
+    _caches = ('cache', '_h_depleted', '_h_enriched')
 
-        """ Return a copy of the molecule. """
+    def copy(self, cache=False):
 
-        return Mol.from_super(copy.deepcopy(self))
+        """ Return a copy of the molecule.
+
+        The molecule is copied with the RDKit copy constructor, so its
+        properties and conformers are copied.  Other attributes are copied
+        shallowly.
+
+        Args:
+            cache (bool):
+                Whether to copy the values cached on the molecule by
+                descriptors.  The cached values themselves are shared with the
+                original.
+
+        Returns:
+            skchem.Mol: The copy.
+
+        Examples:
+            >>> import skchem
+            >>> m = skchem.Mol.from_smiles('CCO', name='ethanol')
+            >>> c = m.copy()
+            >>> c.name, c is m
+            ('ethanol', False)
+        """
+
+        res = self.__class__(self)
+        for key, value in self.__dict__.items():
+            if key in self._views or key in res.__dict__:
+                continue
+            if key in self._caches:
+                if not cache:
+                    continue
+                if key == 'cache':
+                    value = defaultdict(dict, ((name, dict(values))
+                                               for name, values
+                                               in value.items()))
+            res.__dict__[key] = value
+        return res
 
     def __repr__(self):
         try:
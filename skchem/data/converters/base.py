@@ -43,6 +43,47 @@ DEFAULT_PYTABLES_KW = {
     'complevel': 9
 }
 
+# fast h5py compression filters for chunked conversion.  Those other than
+# gzip and lzf require hdf5plugin.
+CODECS = ('gzip-1', 'lzf', 'lz4', 'blosc', 'zstd', None)
+
+
+def codec_kws(codec):
+
+    """ The h5py dataset keywords for a compression codec.
+
+    Args:
+        codec (str):
+            One of 'gzip-1' (fast gzip), 'lzf', 'lz4', 'blosc' (lz4 with byte
+            shuffling), 'zstd' or `None` for no compression.
+
+    Returns:
+        dict:
+            The keywords to pass to `h5py.Group.create_dataset`.
+    """
+
+    if codec is None:
+        return {}
+    elif codec == 'gzip-1':
+        return {'compression': 'gzip', 'compression_opts': 1}
+    elif codec == 'lzf':
+        return {'compression': 'lzf'}
+    elif codec in ('lz4', 'blosc', 'zstd'):
+        try:
+            import hdf5plugin
+        except ImportError:
+            raise ImportError('hdf5plugin is required for the {} '
+                              'codec.'.format(codec))
+        if codec == 'lz4':
+            return dict(hdf5plugin.LZ4())
+        elif codec == 'blosc':
+            return dict(hdf5plugin.Blosc(cname='lz4', clevel=5,
+                                         shuffle=hdf5plugin.Blosc.SHUFFLE))
+        return dict(hdf5plugin.Zstd())
+    raise ValueError('Codec {} not recognized. Use one of {}.'.format(
+        codec, CODECS))
+
+
 def contiguous_order(to_order, splits):
     """ Determine a contiguous order from non-overlapping splits, and put data in that order.
 
@@ -136,7 +177,8 @@ class Converter(object):
     def __init__(self, directory, output_directory, output_filename='default.h5'):
         raise NotImplemented
 
-    def run(self, ms, y, output_path, splits=None, features=None, pytables_kws=DEFAULT_PYTABLES_KW):
+    def run(self, ms, y, output_path, splits=None, features=None, pytables_kws=DEFAULT_PYTABLES_KW,
+            chunk_size=None, codec='gzip-1', batch_size=128):
 
         """
            Args:
@@ -150,10 +192,21 @@ class Converter(object):
             The features to calculate. Defaults are used if `None`.
         splits (iterable<(name, split)>):
             An iterable of name, split tuples. Splits are provided as boolean arrays of the whole data.
+        chunk_size (int):
+            If given, calculate the features for this many molecules at a time, appending each chunk to
+            resizable HDF5 datasets, rather than calculating them for all the molecules at once.
+        codec (str):
+            The compression codec for the features in chunked mode, see `codec_kws`.
+        batch_size (int):
+            The number of rows of each HDF5 chunk of the features in chunked mode.  This should match the
+            size of the minibatches the data is read in.
         """
 
         self.output_path = output_path
         self.pytables_kws = pytables_kws
+        self.chunk_size = chunk_size
+        self.codec = codec
+        self.batch_size = batch_size
         self.features = features if features is not None else default_features()
         self.feature_names = [feat.key for feat in self.features]
         self.task_names = ['y']
@@ -226,18 +279,59 @@ class Converter(object):
 
     def save_features(self, ms):
 
-        """ Save all features for the dataset. """
-        logger.debug('Saving features')
-        for feat in self.features:
-            self._save_feature(ms, feat)
-
-    def _save_feature(self, ms, feat):
+        """ Save all features for the dataset.
 
-        """ Calculate and save a feature to the data file. """
-        logger.info('Calculating %s', feat.key)
+        The features are calculated together, so that work shared between them is done once per molecule.
+        """
+        logger.debug('Saving features')
+        union = features.FeatureUnion([(feat.key, feat.fper) for feat in self.features],
+                                      n_jobs=max([feat.fper.n_jobs for feat in self.features] or [1]))
+        logger.info('Calculating %s', ', '.join(union.names))
+
+        if self.chunk_size:
+            return self._save_features_chunked(ms, union)
+
+        for feat, fps in zip(self.features, union.transform(ms).values()):
+            self.save_frame(fps, name=feat.key, prefix='feats')
+
+    def _save_features_chunked(self, ms, union):
+
+        """ Calculate and save the features to the data file, a chunk of molecules at a time. """
+
+        dsets = {}
+        for start in range(0, len(ms), self.chunk_size):
+            chunk = ms.iloc[start:start + self.chunk_size]
+            res = union.transform(chunk)
+            for feat, fps in zip(self.features, res.values()):
+                values = np.asarray(fps.values)
+                if len(values) != len(chunk):
+                    # rows are written by position, so must not be dropped
+                    raise ValueError('{} returned {} rows for a chunk of {} molecules.'.format(
+                        feat.key, len(values), len(chunk)))
+                if feat.key not in dsets:
+                    dsets[feat.key] = self._create_appendable('/feats/{}'.format(feat.key), values, fps)
+                dset = dsets[feat.key]
+                dset.resize(start + len(values), axis=0)
+                dset[start:] = values
+            logger.debug('Written %s rows of features', start + len(values))
 
-        fps = feat.fper.transform(ms)
-        self.save_frame(fps, name=feat.key, prefix='feats')
+        for feat in self.features:
+            if feat.key in dsets:
+                self.data_file[feat.key] = h5py.SoftLink('/feats/{}'.format(feat.key))
+                for i, label in enumerate(feat.axis_names[:dsets[feat.key].ndim]):
+                    self.data_file[feat.key].dims[i].label = label
+
+    def _create_appendable(self, path, values, fps):
+
+        """ Create a resizable dataset for a feature, chunked by `batch_size` rows. """
+
+        shape = values.shape[1:]
+        chunks = (max(1, min(self.batch_size, self.chunk_size)),) + tuple(max(1, n) for n in shape)
+        dset = self.data_file.create_dataset(path, shape=(0,) + shape, maxshape=(None,) + shape,
+                                             dtype=values.dtype, chunks=chunks, **codec_kws(self.codec))
+        if isinstance(fps, pd.DataFrame):
+            dset.attrs['columns'] = [str(c).encode() for c in fps.columns]
+        return dset
 
     def save_splits(self):
 
@@ -53,9 +53,12 @@ class ChEMBLConverter(Converter):
                 key='G',
                 axis_names=['batch', 'atom_idx', 'atom_idx']),
         Feature(fper=features.SpacialDistanceTransformer(max_atoms=100),
-                key='G_d'))
+                key='G_d',
+                axis_names=['batch', 'atom_idx', 'atom_idx']))
 
-        self.run(ms, y, output_path, features=feats, splits=splits)
+        # ChEMBL is too large to featurize in memory at once
+        self.run(ms, y, output_path, features=feats, splits=splits,
+                 chunk_size=10000)
 
 
     def parse_infile(self, filename):
@@ -5,8 +5,14 @@
 
 import warnings
 import tempfile
+import threading
 import os
+try:
+    import queue
+except ImportError:  # py2 compat
+    import Queue as queue
 
+import numpy as np
 import pandas as pd
 import h5py
 from fuel.datasets import H5PYDataset
@@ -14,6 +20,59 @@ from fuel.utils import find_in_data_path
 from fuel import config
 
 
+def _read_rows(dataset, rows):
+
+    """ Read rows (in increasing order) of an HDF5 dataset, as a slice if they
+    are contiguous. """
+
+    if len(rows) and rows[-1] - rows[0] + 1 == len(rows):
+        return dataset[rows[0]:rows[-1] + 1]
+    return dataset[rows.tolist()]
+
+
+def _prefetch(iterable, n_prefetch):
+
+    """ Iterate over an iterable, evaluated ahead in a background thread. """
+
+    buf = queue.Queue(maxsize=n_prefetch)
+    stop = threading.Event()
+    end = object()
+
+    def put(item):
+        # time out periodically, so the thread stops if iteration does
+        while not stop.is_set():
+            try:
+                buf.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def fill():
+        try:
+            for item in iterable:
+                if stop.is_set():
+                    return
+                put((item, None))
+        except Exception as e:  # pylint: disable=broad-except
+            put((None, e))
+        put((end, None))
+
+    thread = threading.Thread(target=fill)
+    thread.daemon = True
+    thread.start()
+    try:
+        while True:
+            item, err = buf.get()
+            if err is not None:
+                raise err
+            if item is end:
+                return
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
 class Dataset(H5PYDataset):
 
     """ Abstract base class providing an interface to the skchem data format."""
@@ -74,6 +133,94 @@ class Dataset(H5PYDataset):
         for set_name in sets:
             yield cls.load_set(set_name, sources)
 
+    @classmethod
+    def set_indices(cls, set_name):
+
+        """ The row indices of a set.
+
+        Args:
+            set_name (str):
+                The set name, or 'all' for all rows.
+
+        Returns:
+            np.array:
+                The indices of the rows of the set, in increasing order.
+        """
+
+        with h5py.File(find_in_data_path(cls.filename), 'r') as f:
+            if set_name == 'all':
+                return np.arange(len(f[cls.get_all_sources(f)[0]]))
+            return np.sort(f[set_name + '_indices'][()])
+
+    @classmethod
+    def iter_batches(cls, set_name, sources=(), batch_size=128, shuffle=False,
+                     chunk_size=None, random_state=None, n_prefetch=2):
+
+        """ Iterate over minibatches of a set, read lazily from disk.
+
+        The rows of the set are read a chunk of consecutive rows at a time, in
+        a background thread which reads ahead while the batches of the last
+        chunk are used, so that only a few chunks are ever held in memory.
+        When shuffling, the order of the chunks, and the order of the rows
+        within each chunk, are shuffled.
+
+        Args:
+            set_name (str):
+                The set name, or 'all' for all rows.
+            sources (tuple[str]):
+                The sources to return data for.
+            batch_size (int):
+                The number of rows of each batch.
+            shuffle (bool):
+                Whether to shuffle the rows (by chunk).
+            chunk_size (int):
+                The number of rows to read at once.  Batches do not span chunks,
+                so this should be a multiple of `batch_size`.  If `None`, use
+                `16 * batch_size`.
+            random_state (int or np.random.RandomState):
+                The random state to use for shuffling.
+            n_prefetch (int):
+                The number of chunks to read ahead.
+
+        Returns:
+            iterable<tuple[np.array]>:
+                The requested sources for each batch.
+
+        Example:
+            for X, y in Dataset.iter_batches('train', sources=('G', 'y'),
+                                             batch_size=64, shuffle=True):
+                model.train_on_batch(X, y)
+        """
+
+        if sources == 'all':
+            sources = cls.available_sources()
+        if chunk_size is None:
+            chunk_size = 16 * batch_size
+        if not isinstance(random_state, np.random.RandomState):
+            random_state = np.random.RandomState(random_state)
+
+        idx = cls.set_indices(set_name)
+        chunks = [idx[i:i + chunk_size] for i in range(0, len(idx), chunk_size)]
+        if shuffle:
+            chunks = [chunks[i] for i in random_state.permutation(len(chunks))]
+
+        with h5py.File(find_in_data_path(cls.filename), 'r') as f:
+            datasets = [f[source] for source in sources]
+
+            def read_chunks():
+                for rows in chunks:
+                    yield [_read_rows(ds, rows) for ds in datasets]
+
+            for data in _prefetch(read_chunks(), n_prefetch):
+                n_rows = len(data[0]) if data else 0
+                order = random_state.permutation(n_rows) if shuffle else None
+                for i in range(0, n_rows, batch_size):
+                    if order is None:
+                        yield tuple(d[i:i + batch_size] for d in data)
+                    else:
+                        batch = order[i:i + batch_size]
+                        yield tuple(d[batch] for d in data)
+
     @classmethod
     def read_frame(cls, key, *args, **kwargs):
 
@@ -87,15 +234,37 @@ class Dataset(H5PYDataset):
                 - smiles: for the smiles
                 - features/{feat_name}: for the features
                 - targets/{targ_name}: for the targets
+            start (int):
+                The row to start reading from.  Keyword only.
+            stop (int):
+                The row to stop reading at.  Keyword only.
+            columns (list[str]):
+                The columns to read.  Only these are read from disk for data
+                stored in table format; for other data, the rows are read in
+                full before selecting the columns.  Keyword only.
 
         Returns:
             pd.Series or pd.DataFrame or pd.Panel
                 The data as a dataframe.
         """
 
+        # keyword only, so positional arguments still go to `pd.read_hdf`
+        start = kwargs.pop('start', None)
+        stop = kwargs.pop('stop', None)
+        columns = kwargs.pop('columns', None)
+
+        path = find_in_data_path(cls.filename)
         with warnings.catch_warnings():
             warnings.simplefilter('ignore')
-            data = pd.read_hdf(find_in_data_path(cls.filename), key, *args, **kwargs)
+            try:
+                data = pd.read_hdf(path, key, start=start, stop=stop,
+                                   columns=columns, *args, **kwargs)
+            except TypeError:
+                if columns is None:
+                    raise
+                # fixed format stores cannot select columns
+                data = pd.read_hdf(path, key, start=start, stop=stop, *args,
+                                   **kwargs)[columns]
         if isinstance(data, pd.Panel):
             data = data.transpose(2, 1, 0)
         return data
@@ -17,6 +17,9 @@ from .fingerprints import (AtomPairFeaturizer,
                            FeatureInvariantsFeaturizer)
 from .chemaxon import (ChemAxonAtomFeaturizer, ChemAxonFeaturizer, ChemAxonNMRPredictor)
 from .atom import (AtomFeaturizer, GraphDistanceTransformer, SpacialDistanceTransformer)
+from .graph import GraphFeaturizer, GraphBatch
+from .descriptors import DescriptorFeaturizer
+from .union import FeatureUnion
 
 __all__ = [
     'PhysicochemicalFeaturizer',
@@ -33,13 +36,18 @@ __all__ = [
     'ChemAxonFeaturizer',
     'ChemAxonAtomFeaturizer',
     'GraphDistanceTransformer',
-    'SpacialDistanceTransformer'
+    'SpacialDistanceTransformer',
+    'GraphFeaturizer',
+    'GraphBatch',
+    'DescriptorFeaturizer',
+    'FeatureUnion'
 ]
 
 DEFAULTS = {
     'atom': AtomFeaturizer,
     'graph_distance': GraphDistanceTransformer,
     'spacial_distance': SpacialDistanceTransformer,
+    'graph': GraphFeaturizer,
     'morgan': MorganFeaturizer,
     'atom_pair': AtomPairFeaturizer,
     'topological_torsion': TopologicalTorsionFeaturizer,
@@ -48,6 +56,7 @@ DEFAULTS = {
     'conn_inv': ConnectivityInvariantsFeaturizer,
     'feat_inv': FeatureInvariantsFeaturizer,
     'physicochemical': PhysicochemicalFeaturizer,
+    'descriptors': DescriptorFeaturizer,
     'chemaxon': ChemAxonFeaturizer,
     'chemaxon_atom': ChemAxonAtomFeaturizer
 }
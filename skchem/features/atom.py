@@ -10,21 +10,22 @@ Module specifying atom based descriptor generators.
 """
 
 import functools
-from abc import ABCMeta
+from abc import ABCMeta, abstractmethod
 
 import pandas as pd
 import numpy as np
 
-from rdkit import Chem
 from rdkit.Chem import Crippen
 from rdkit.Chem import Lipinski
 from rdkit.Chem import rdMolDescriptors, rdPartialCharges
 from rdkit.Chem.rdchem import HybridizationType
 
 from ..core import Mol
-from ..resource import PERIODIC_TABLE, ORGANIC
+from ..resource import ELEMENTS, ORGANIC
 from ..base import AtomTransformer, Featurizer
 from ..utils import nanarray
+from .descriptors.caching import cache
+from .descriptors.fundamentals import distance_matrix, geometric_matrix
 
 
 def element(a):
@@ -202,17 +203,17 @@ def pauling_electronegativity(a):
 
 def first_ionization(a):
 
-    return PERIODIC_TABLE.loc[a.atomic_number, 'first_ionisation_energy']
+    return ELEMENTS.first_ionisation_energy[a.atomic_number]
 
 
 def group(a):
 
-    return PERIODIC_TABLE.loc[a.atomic_number, 'group']
+    return ELEMENTS.group[a.atomic_number]
 
 
 def period(a):
 
-    return PERIODIC_TABLE.loc[a.atomic_number, 'period']
+    return ELEMENTS.period[a.atomic_number]
 
 
 def is_hybridized(a, hybrid_type=HybridizationType.SP3):
@@ -300,11 +301,15 @@ class DistanceTransformer(AtomTransformer, Featurizer):
 
     """ Base class implementing Distance Matrix transformers.
 
-    Concrete classes inheriting from this should implement `_transform_mol`.
+    Concrete classes inheriting from this should implement
+    `_transform_mol_ragged`, returning the `(n_atoms, n_atoms)` matrix.
     """
 
     __metaclass__ = ABCMeta
 
+    # the ragged matrices are stored as blocks, whatever their sizes
+    _ragged_packed = True
+
     @property
     def minor_axis(self):
         return pd.RangeIndex(self.max_atoms, name='atom_idx')
@@ -312,8 +317,17 @@ class DistanceTransformer(AtomTransformer, Featurizer):
     def _transform_atom(self, atom):
         return NotImplemented
 
-    def transform(self, mols):
-        res = super(DistanceTransformer, self).transform(mols)
+    @abstractmethod
+    def _transform_mol_ragged(self, mol):
+        pass
+
+    def _transform_mol(self, mol):
+        res = nanarray((len(mol.atoms), self.max_atoms))
+        res[:, :len(mol.atoms)] = self._transform_mol_ragged(mol)
+        return res
+
+    def transform(self, mols, **kwargs):
+        res = super(DistanceTransformer, self).transform(mols, **kwargs)
         if isinstance(mols, Mol):
             res = res.iloc[:len(mols.atoms), :len(mols.atoms)]
         return res
@@ -342,10 +356,10 @@ class SpacialDistanceTransformer(DistanceTransformer):
     def name(self):
         return 'spacial_dist'
 
-    def _transform_mol(self, mol):
-        res = nanarray((len(mol.atoms), self.max_atoms))
-        res[:, :len(mol.atoms)] = Chem.Get3DDistanceMatrix(mol)
-        return res
+    def _transform_mol_ragged(self, mol):
+        # shared with other features calculated in the same cache scope
+        with cache.scope(mol):
+            return geometric_matrix(mol)
 
 
 class GraphDistanceTransformer(DistanceTransformer):
@@ -370,7 +384,7 @@ class GraphDistanceTransformer(DistanceTransformer):
     def name(self):
         return 'graph_dist'
 
-    def _transform_mol(self, mol):
-        res = nanarray((len(mol.atoms), self.max_atoms))
-        res[:len(mol.atoms), :len(mol.atoms)] = Chem.GetDistanceMatrix(mol)
-        return res
+    def _transform_mol_ragged(self, mol):
+        # shared with other features calculated in the same cache scope
+        with cache.scope(mol):
+            return distance_matrix(mol)
@@ -317,9 +317,10 @@ class ChemAxonBaseFeaturizer(CLIWrapper, Featurizer):
 
     _optimal_feats = []  # override this
 
-    def __init__(self, features='optimal', verbose=True):
+    def __init__(self, features='optimal', streaming=False, verbose=True):
         self._features = None
-        super(ChemAxonBaseFeaturizer, self).__init__(verbose=verbose)
+        super(ChemAxonBaseFeaturizer, self).__init__(streaming=streaming,
+                                                     verbose=verbose)
         self.features = features
 
     @property
@@ -497,6 +498,7 @@ class ChemAxonNMRPredictor(ChemAxonBaseFeaturizer, BatchTransformer,
 
     _feat_columns = {'cnmr': ['cnmr'], 'hnmr': ['hnmr']}
     _optimal_feats = ['cnmr']
+    _streamable = False  # the output is read twice
 
     @property
     def name(self):
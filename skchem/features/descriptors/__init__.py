@@ -10,12 +10,14 @@ Molecular descriptors for scikit-chem.
 """
 
 from . import (autocorrelation)
+from .featurizer import DescriptorFeaturizer, DESCRIPTORS
 #     charge, connectivity, cpsa, estate, fragment, geometric,
 #     information, moe, morse, properties, rdf, ring, shape, spectral,
 #     topological, whim
 # )
 #
-__all__ = ['autocorrelation'] # 'charge', 'connectivity', 'cpsa', 'estate',
+__all__ = ['autocorrelation', 'DescriptorFeaturizer', 'DESCRIPTORS']
+#           'charge', 'connectivity', 'cpsa', 'estate',
 #            'fragment', 'geometric', 'information', 'moe', 'morse',
 #            'properties', 'rdf', 'ring', 'shape', 'spectral', 'topological',
 #            'whim']
@@ -10,17 +10,155 @@ Autocorrelation descriptors for scikit-chem.
 """
 
 from functools import partial
+from collections import OrderedDict, namedtuple
 
 from .caching import cache
-from .fundamentals import adjacency_matrix, distance_matrix, atom_props
+from .fundamentals import (adjacency_matrix, distance_matrix, atom_props,
+                           lag_matrix, lag_tensor)
 
 import numpy as np
+import pandas as pd
 
 
-@cache.inject(distance_matrix, atom_props)
-def moreau_broto_autocorrelation(mol, dist_mat, prop, prop_name='atomic_mass',
+PROPS = ('atomic_mass', 'van_der_waals_volume', 'sanderson_electronegativity',
+         'polarisability', 'ionisation_energy', 'intrinsic_state')
+
+KS = tuple(range(1, 9))
+
+LagMoments = namedtuple('LagMoments', 'n_atoms n_pairs s1 s2 s11 mean ss')
+LagMoments.__doc__ = r""" Sums of atomic properties over the atom pairs at each
+lag, from which the autocorrelation descriptors are calculated.
+
+For a property $w$ and the one-hot lag tensor $L$ (with $d_{ki}$ the number
+of atoms at lag $k$ from atom $i$), the fields are (with a leading batch
+dimension if calculated for several molecules):
+
+- n_atoms: the number of atoms.
+- n_pairs: the number of ordered atom pairs at each lag, of shape `(K,)`.
+- s1: $\sum_i d_{ki} w_i$, of shape `(K, P)`.
+- s2: $\sum_i d_{ki} w_i^2$, of shape `(K, P)`.
+- s11: $\sum_i \sum_j L_{kij} w_i w_j$, of shape `(K, P)`.
+- mean: the mean of the properties, of shape `(P,)`.
+- ss: the sum of squared deviations of the properties, of shape `(P,)`.
+"""
+
+
+def _moments(lags, props, mask):
+
+    """ Calculate the lag moments for all lags and properties at once.
+
+    Args:
+        lags (np.ndarray):
+            The one-hot lag tensor, of shape `(..., K, A, A)`.
+        props (np.ndarray):
+            The atomic properties, of shape `(..., A, P)`, zero for padding.
+        mask (np.ndarray):
+            Whether each atom is real (rather than padding), of shape
+            `(..., A)`.
+
+    Returns:
+        LagMoments
+    """
+
+    n_atoms = mask.sum(-1)
+    mean = props.sum(-2) / n_atoms[..., np.newaxis]
+    deviations = (props - mean[..., np.newaxis, :]) * mask[..., np.newaxis]
+    degree = lags.sum(-1)
+    lagged = props[..., np.newaxis, :, :]
+    return LagMoments(n_atoms=n_atoms,
+                      n_pairs=degree.sum(-1),
+                      s1=np.matmul(degree, props),
+                      s2=np.matmul(degree, props ** 2),
+                      s11=(np.matmul(lags, lagged) * lagged).sum(-2),
+                      mean=mean,
+                      ss=(deviations ** 2).sum(-2))
+
+
+def _ats(moments, ks, centred=False):
+    weight = np.where(np.asarray(tuple(ks)) == 0, 1., 0.5)[:, np.newaxis]
+    res = weight * moments.s11
+    return res / moments.n_pairs[..., np.newaxis] if centred else res
+
+
+def _moran(moments):
+    mean = moments.mean[..., np.newaxis, :]
+    n_pairs = moments.n_pairs[..., np.newaxis]
+    # sum of the products of the deviations from the mean
+    num = moments.s11 - 2 * mean * moments.s1 + mean ** 2 * n_pairs
+    denom = moments.ss / moments.n_atoms[..., np.newaxis]
+    return num / n_pairs / denom[..., np.newaxis, :]
+
+
+def _geary(moments):
+    n_pairs = moments.n_pairs[..., np.newaxis]
+    # half the sum of the squared differences of the pairs
+    num = moments.s2 - moments.s11
+    denom = moments.ss / (moments.n_atoms[..., np.newaxis] - 1)
+    return num / n_pairs / denom[..., np.newaxis, :]
+
+
+def _props(mol, prop_names, c_scaled):
+    return np.column_stack([atom_props(mol, prop_name=prop_name,
+                                       c_scaled=c_scaled)
+                            for prop_name in prop_names])
+
+
+@cache
+@cache.inject(lag_matrix)
+def lag_moments(mol, lags, prop_names=PROPS, c_scaled=False, ks=KS):
+
+    """ The lag moments of atomic properties, calculated for all the lags and
+    properties in a single contraction.
+
+    Args:
+        mol (skchem.Mol):
+            The molecule for which to calculate the moments.
+        prop_names (tuple<str>):
+            The atomic properties.
+        c_scaled (bool):
+            Whether the properties should be scaled against sp3 carbon.
+        ks (tuple):
+            The lags.
+
+    Returns:
+        LagMoments
+    """
+
+    props = _props(mol, prop_names, c_scaled)
+    return _moments(lags, props, np.ones(len(props)))
+
+
+def _uses_lag_moments(func):
+
+    """ Record that a descriptor is calculated from the cached lag moments, as
+    `cache.inject` would, so that `cache.dependencies` resolves them. """
+
+    func.injected = (lag_moments,)
+    func.injected_kwds = cache.extract_kwargs(func)
+    return func
+
+
+def _prop_moments(mol, prop_name, c_scaled, ks):
+
+    """ Get the lag moments for a single property.
+
+    The moments of the default properties are calculated together, so that
+    the descriptors for each of them share a contraction. """
+
+    prop_names = PROPS if prop_name in PROPS else (prop_name,)
+    moments = lag_moments(mol, prop_names=prop_names, c_scaled=c_scaled,
+                          ks=tuple(ks))
+    i = prop_names.index(prop_name)
+    col = slice(i, i + 1)
+    return moments._replace(s1=moments.s1[:, col], s2=moments.s2[:, col],
+                            s11=moments.s11[:, col], mean=moments.mean[col],
+                            ss=moments.ss[col])
+
+
+@_uses_lag_moments
+def moreau_broto_autocorrelation(mol, prop_name='atomic_mass',
                                  c_scaled=False, centred=False,
-                                 ks=range(1, 9)):
+                                 ks=KS):
 
     """ The Moreau-Broto autocorrelation.
 
@@ -59,15 +197,13 @@ def moreau_broto_autocorrelation(mol, dist_mat, prop, prop_name='atomic_mass',
         array([ 1088.99...,   817.12...,   865.02...,   528.59...])
     """
 
-    div = np.array([(dist_mat == k).sum() for k in ks]) if centred else 1
-
-    return np.array([(1 if k == 0 else 0.5) * prop.dot(dist_mat == k).dot(prop)
-                     for k in ks]) / div
+    moments = _prop_moments(mol, prop_name, c_scaled, ks)
+    return _ats(moments, ks, centred=centred)[:, 0]
 
 
-@cache.inject(distance_matrix, atom_props)
-def moran_coefficient(mol, dist_mat, prop, prop_name='atomic_mass',
-                      c_scaled=False, ks=range(1, 9)):
+@_uses_lag_moments
+def moran_coefficient(mol, prop_name='atomic_mass', c_scaled=False,
+                      ks=KS):
 
     """ Moran coefficient for lags ks.
 
@@ -92,22 +228,13 @@ def moran_coefficient(mol, dist_mat, prop, prop_name='atomic_mass',
         float
     """
 
-    prop = prop - prop.mean()
-
-    res = []
-
-    for k in ks:
-        geodesic = dist_mat == k
-        num = prop.dot(geodesic).dot(prop) / geodesic.sum()
-        denom = (prop ** 2).sum() / len(prop)
-        res.append(num / denom)
-
-    return np.array(res)
+    moments = _prop_moments(mol, prop_name, c_scaled, ks)
+    return _moran(moments)[:, 0]
 
 
-@cache.inject(distance_matrix, atom_props)
-def geary_coefficient(mol, dist_mat, prop, prop_name='atomic_mass',
-                      c_scaled=False, ks=range(1, 9)):
+@_uses_lag_moments
+def geary_coefficient(mol, prop_name='atomic_mass', c_scaled=False,
+                      ks=KS):
 
     """ The geary coefficient for *ks* lags.
 
@@ -133,18 +260,101 @@ def geary_coefficient(mol, dist_mat, prop, prop_name='atomic_mass',
 
     """
 
-    res = []
-    for k in ks:
-        geodesic = dist_mat == k
-        num = 0.5 * ((prop - prop[:, np.newaxis]) ** 2 * geodesic).sum() / geodesic.sum()
-        denom = ((prop - prop.mean()) ** 2).sum() / (len(prop) - 1)
-        res.append(num / denom)
+    moments = _prop_moments(mol, prop_name, c_scaled, ks)
+    return _geary(moments)[:, 0]
+
+
+def _batch_moments(mols, prop_names, c_scaled, ks):
+
+    """ Calculate the lag moments for a batch of molecules, padded to the
+    size of the largest. """
+
+    n_atoms = max(len(mol.atoms) for mol in mols)
+    dist_mat = np.full((len(mols), n_atoms, n_atoms), -1.)
+    props = np.zeros((len(mols), n_atoms, len(prop_names)))
+    mask = np.zeros((len(mols), n_atoms))
+    for i, mol in enumerate(mols):
+        n = len(mol.atoms)
+        dist_mat[i, :n, :n] = distance_matrix(mol)
+        props[i, :n] = _props(mol, prop_names, c_scaled)
+        mask[i, :n] = 1
+    return _moments(lag_tensor(dist_mat, ks), props, mask)
 
-    return np.array(res)
+
+def autocorrelation_descriptors(mols, prop_names=PROPS, c_scaled=False,
+                                ks=KS, block_size=None):
+
+    """ Calculate the Moreau-Broto (raw and centred), Moran and Geary
+    autocorrelations for all lags and properties at once.
+
+    Args:
+        mols (skchem.Mol or iterable<skchem.Mol>):
+            The molecules for which to calculate the descriptors.
+        prop_names (tuple<str>):
+            The atomic properties.
+        c_scaled (bool):
+            Whether the properties should be scaled against sp3 carbon.
+        ks (iterable):
+            The lags.
+        block_size (int):
+            If given, the molecules are sorted by size and calculated in
+            blocks of this many, padded to the largest in the block.
+            Otherwise, the molecules are calculated one at a time, sharing
+            the moments cached on them.
+
+    Returns:
+        pd.Series or pd.DataFrame:
+            The descriptors, with columns named as in `DESCRIPTORS` followed by
+            the lag.
+
+    Examples:
+        >>> import skchem
+        >>> ms = [skchem.Mol.from_smiles(smi) for smi in ('CCO', 'CC(O)CCO')]
+        >>> res = autocorrelation_descriptors(ms, prop_names=('atomic_mass',),
+        ...                                   ks=range(1, 3), block_size=2)
+        >>> res.shape
+        (2, 8)
+        >>> res.loc[1, ['ats_atomic_mass_1', 'ats_atomic_mass_2']].round(2)
+        ats_atomic_mass_1    817.12
+        ats_atomic_mass_2    865.02
+        Name: 1, dtype: float64
+    """
+
+    ks, prop_names = tuple(ks), tuple(prop_names)
+    single = not isinstance(mols, (pd.Series, list, tuple))
+    index = mols.index if isinstance(mols, pd.Series) else None
+    mols = [mols] if single else list(mols)
+
+    if block_size is None:
+        moments = [lag_moments(mol, prop_names=prop_names, c_scaled=c_scaled,
+                               ks=ks) for mol in mols]
+        blocks = [([i], LagMoments(*(np.asarray(v)[np.newaxis]
+                                     for v in m)))
+                  for i, m in enumerate(moments)]
+    else:
+        order = np.argsort([len(mol.atoms) for mol in mols], kind='mergesort')
+        blocks = []
+        for start in range(0, len(mols), block_size):
+            idx = order[start:start + block_size]
+            blocks.append((idx, _batch_moments([mols[i] for i in idx],
+                                               prop_names, c_scaled, ks)))
+
+    res = np.empty((len(mols), 4, len(ks), len(prop_names)))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for idx, moments in blocks:
+            res[idx] = np.stack([_ats(moments, ks), _ats(moments, ks, True),
+                                 _moran(moments), _geary(moments)], axis=1)
+
+    columns = ['{}_{}_{}'.format(name, prop_name, k)
+               for name in ('ats', 'ats_c', 'moran', 'geary')
+               for prop_name in prop_names for k in ks]
+    res = pd.DataFrame(res.transpose(0, 1, 3, 2).reshape(len(mols), -1),
+                       columns=columns, index=index)
+    return res.iloc[0] if single else res
 
 
 @cache
-@cache.inject(adjacency_matrix, distance_matrix)
+@cache.inject(distance_matrix, adjacency_matrix)
 def galvez_matrix(mol, dist_mat, adj_mat):
 
     """ The galvez matrix.
@@ -159,7 +369,7 @@ def galvez_matrix(mol, dist_mat, adj_mat):
 
     temp = dist_mat ** -2
     np.fill_diagonal(temp, 0)
-    galvez_mat = temp.dot(adj_mat) + np.diag(mol.atoms.valence_vertex_degree)
+    galvez_mat = temp.dot(adj_mat) + np.diag(mol.atoms.valence_degree)
     return galvez_mat
 
 
@@ -201,7 +411,7 @@ def topological_charge_index(mol, c_mat, dist_mat, ks=range(11)):
         np.array
 
     """
-    return np.array([0.5 * np.abs(c_mat)[dist_mat == k].sum() for i in ks])
+    return np.array([0.5 * np.abs(c_mat)[dist_mat == k].sum() for k in ks])
 
 
 @cache.inject(topological_charge_index)
@@ -229,18 +439,21 @@ def total_charge_index(mol, tci, ks=range(11)):
     return tci.sum() / (len(mol.atoms) - 1)
 
 
-PROPS = ['atomic_mass', 'van_der_waals_volume', 'sanderson_electronegativity',
-         'polarisability', 'ionisation_energy', 'intrinsic_state']
-
-KS = range(1, 9)
-
-DESCRIPTORS = [partial(moreau_broto_autocorrelation, k=k, prop=p, centered=c)
-               for k in KS for c in (False, True) for p in PROPS]
-
-FS = (moran_coefficient, geary_coefficient)
+DESCRIPTORS = OrderedDict(
+    ('{}_{}'.format(name, p), partial(f, prop_name=p, ks=KS, **kws))
+    for name, f, kws in (('ats', moreau_broto_autocorrelation, {}),
+                         ('ats_c', moreau_broto_autocorrelation,
+                          {'centred': True}),
+                         ('moran', moran_coefficient, {}),
+                         ('geary', geary_coefficient, {}))
+    for p in PROPS)
 
-DESCRIPTORS += [partial(f, k=k, prop=p) for f in FS for k in KS for p in PROPS]
+DESCRIPTORS.update((
+    ('galvez_tci', partial(topological_charge_index, ks=range(11))),
+    ('galvez_mtci', partial(mean_topological_charge_index, ks=range(11))),
+    ('galvez_gci', total_charge_index)))
 
 __all__ = ['moreau_broto_autocorrelation', 'moran_coefficient',
-           'geary_coefficient', 'topological_charge_index',
-           'mean_topological_charge_index', 'total_charge_index']
+           'geary_coefficient', 'lag_moments', 'autocorrelation_descriptors',
+           'topological_charge_index', 'mean_topological_charge_index',
+           'total_charge_index']
@@ -9,7 +9,8 @@
 Decorators for descriptors in scikit-chem.
 """
 import inspect
-from functools import wraps
+from contextlib import contextmanager
+from functools import wraps, partial
 from collections import OrderedDict, defaultdict
 
 import pandas as pd
@@ -108,6 +109,7 @@ class Cache(object):
         # get the key word arguments and the default values of the function
 
         kwds = self.extract_kwargs(func)
+        default_kw_to_save = tuple(sorted(kwds.items()))
 
         @wraps(func)
         def inner(mol, *args, **kwargs):
@@ -118,21 +120,21 @@ class Cache(object):
             self.setup_cache(mol)
 
             # get the full set of keywords to use, including defaults
-            kwds.update(kwargs)
-            kw_to_save = tuple(sorted(kwds.items()))
+            if kwargs:
+                kw_to_save = tuple(sorted(dict(kwds, **kwargs).items()))
+            else:
+                kw_to_save = default_kw_to_save
 
             # call function if it hasn't already been called
             # with required arguments, or if told to.
-            if force or name not in self.cached.keys() or \
-                    kw_to_save not in mol.cache.get(name, {}).keys():
-
-                res = func(mol, *args, **kwargs)
+            cached = mol.cache[name]
+            if force or kw_to_save not in cached:
 
                 # cache the value with the args used.
-                mol.cache[name].update({kw_to_save: res})
+                cached[kw_to_save] = func(mol, *args, **kwargs)
 
             # return the cached value
-            return mol.cache[name][kw_to_save]
+            return cached[kw_to_save]
 
         self.cached[name] = inner, tuple(kwds.keys())
 
@@ -156,7 +158,7 @@ class Cache(object):
             def inner(mol, *args, **kwargs):
 
                 # augment with the keywords from the function
-                kwds.update(kwargs)
+                call_kwds = dict(kwds, **kwargs) if kwargs else kwds
                 self.setup_cache(mol)
 
                 # look up cached values, or produce them if not.
@@ -169,8 +171,8 @@ class Cache(object):
                     inj_func, params = self.cached[arg.__name__]
 
                     # get the kwargs required
-                    inj_kwargs = {param: kwds[param] for param in params
-                                  if param in kwds.keys()}
+                    inj_kwargs = {param: call_kwds[param] for param in params
+                                  if param in call_kwds}
 
                     # get a hashable representation of the kwargs
                     immut = tuple(sorted(inj_kwargs.items()))
@@ -190,10 +192,57 @@ class Cache(object):
 
                 return func(mol, *args, **kwargs)
 
+            # record the dependencies, so that they may be resolved without
+            # calling the function (see `dependencies`)
+            inner.injected = args_to_inject
+            inner.injected_kwds = kwds
+
             return inner
 
         return outer
 
+    def dependencies(self, func, **kwargs):
+
+        """ Resolve the cached values a function depends on.
+
+        Args:
+            func (callable):
+                A function decorated with `inject`, or a `functools.partial` of
+                one.
+            **kwargs:
+                The keyword arguments the function will be called with.
+
+        Returns:
+            list<(str, tuple)>:
+                The names of the cached functions and the keyword arguments
+                they are called with, in an order in which they may be
+                calculated.
+
+        Examples:
+            >>> from skchem.features.descriptors.autocorrelation import (
+            ...     charge_matrix)
+            >>> [name for name, kws in cache.dependencies(charge_matrix)]
+            ['distance_matrix', 'adjacency_matrix', 'galvez_matrix']
+        """
+
+        if isinstance(func, partial):
+            kwargs = dict(func.keywords, **kwargs)
+            func = func.func
+
+        kwds = dict(getattr(func, 'injected_kwds', {}), **kwargs)
+
+        res = []
+        for arg in getattr(func, 'injected', ()):
+            inj_func, params = self.cached[arg.__name__]
+            inj_kwargs = {param: kwds[param] for param in params
+                          if param in kwds}
+
+            for step in self.dependencies(inj_func, **inj_kwargs) + \
+                    [(arg.__name__, tuple(sorted(inj_kwargs.items())))]:
+                if step not in res:
+                    res.append(step)
+        return res
+
     @staticmethod
     def setup_cache(mol):
 
@@ -210,4 +259,32 @@ class Cache(object):
         if hasattr(mol, 'cache'):
             del mol.cache
 
+    @contextmanager
+    def scope(self, mol):
+
+        """ Cache values on e.g. a `Mol` for the duration of a block.
+
+        The cache is torn down afterwards, unless it was set up already, so
+        that nested scopes share the outermost cache.
+
+        Examples:
+            >>> from skchem import Mol
+            >>> m = Mol.from_smiles('CCO')
+            >>> with cache.scope(m):
+            ...     with cache.scope(m):
+            ...         m.cache['key'][()] = 'value'
+            ...     'key' in m.cache
+            True
+            >>> hasattr(m, 'cache')
+            False
+        """
+
+        clean_up = not hasattr(mol, 'cache')
+        self.setup_cache(mol)
+        try:
+            yield mol
+        finally:
+            if clean_up:
+                self.teardown_cache(mol)
+
 cache = Cache()
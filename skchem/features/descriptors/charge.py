@@ -34,11 +34,11 @@ def gasteiger_charges(mol):
             The molecule for which to calculate the descriptors.
 
     Returns:
-        float
+        np.ndarray
     """
 
     rdPartialCharges.ComputeGasteigerCharges(mol)
-    return mol.atoms.props.pop('_GasteigerCharge')
+    return np.array([float(a.GetProp('_GasteigerCharge')) for a in mol.atoms])
 
 
 @cache.inject(gasteiger_charges)
@@ -566,12 +566,98 @@ def n_hba_lipinski(x):
     return rdMolDescriptors.CalcNumLipinskiHBA(x)
 
 
+MAX_PATH_LENGTH = 6
+
+
+def _count_paths(neighbours, max_length):
+
+    """ Count the bond paths of each length up to *max_length* in a single
+    depth first traversal.
+
+    Paths follow the semantics of `rdmolops.FindAllPathsOfLengthN`: they do
+    not reuse a bond, and visit each atom at most once, except that the last
+    bond may close onto an atom already in the path.
+
+    Each path is found once for each way it may be walked, so simple paths
+    are found twice (once from each end), rings (closing onto the first atom)
+    twice for each of their atoms, and paths closing onto another atom twice
+    (once in each direction around the ring they close).
+
+    Args:
+        neighbours (list<list<int>>):
+            The indices of the neighbours of each atom.
+        max_length (int):
+            The maximum length of path to count.
+
+    Returns:
+        list<int>:
+            The number of paths of length 1 to *max_length*.
+    """
+
+    simple = [0] * (max_length + 1)
+    rings = [0] * (max_length + 1)
+    closed = [0] * (max_length + 1)
+
+    def extend(atom, prev, start, visited, length):
+        for nbr in neighbours[atom]:
+            if nbr == prev:
+                continue
+            if visited >> nbr & 1:
+                if nbr == start:
+                    rings[length] += 1
+                else:
+                    closed[length] += 1
+            else:
+                simple[length] += 1
+                if length < max_length:
+                    extend(nbr, atom, start, visited | 1 << nbr, length + 1)
+
+    for start in range(len(neighbours)):
+        extend(start, -1, start, 1 << start, 1)
+
+    return [(simple[length] + closed[length]) // 2 +
+            rings[length] // (2 * length)
+            for length in range(1, max_length + 1)]
+
+
+@cache
 @requires_h_depleted
+def path_counts(mol, max_length=MAX_PATH_LENGTH):
+
+    """ The number of paths of each length up to *max_length*.
+
+    Args:
+        mol (skchem.Mol):
+            The molecule for which to count the paths.
+        max_length (int):
+            The maximum length of path to count.
+
+    Returns:
+        list<int>
+
+    Examples:
+        >>> import skchem
+        >>> path_counts(skchem.Mol.from_smiles('c1ccccc1'))
+        [6, 6, 6, 6, 6, 1]
+    """
+
+    neighbours = [[nbr.GetIdx() for nbr in atom.GetNeighbors()]
+                  for atom in mol.GetAtoms()]
+    return _count_paths(neighbours, max_length)
+
+
 def n_paths(mol, length=1):
 
-    """ The number of paths of length *l*. """
+    """ The number of paths of length *l*.
+
+    The paths of all lengths up to `MAX_PATH_LENGTH` are counted together,
+    and the counts cached on the molecule.
+    """
 
-    return len(rdmolops.FindAllPathsOfLengthN(mol, length))
+    if length < 1:
+        return 0
+    return path_counts(mol, max_length=max(length, MAX_PATH_LENGTH))[
+        length - 1]
 
 
 DESCRIPTORS = OrderedDict((
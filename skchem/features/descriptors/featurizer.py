@@ -0,0 +1,215 @@
+#! /usr/bin/env python
+#
+# Copyright (C) 2016 Rich Lewis <rl403@cam.ac.uk>
+# License: 3-clause BSD
+
+"""
+# skchem.features.descriptors.featurizer
+
+Featurizer calculating the scikit-chem descriptors.
+"""
+
+from collections import OrderedDict
+from functools import partial
+import multiprocessing
+import logging
+
+import numpy as np
+import pandas as pd
+
+from ...base import Transformer, Featurizer
+from .caching import cache
+from . import constitutional, charge, autocorrelation
+
+LOGGER = logging.getLogger(__name__)
+
+DESCRIPTORS = OrderedDict()
+DESCRIPTORS.update(constitutional.DESCRIPTORS)
+DESCRIPTORS.update(charge.all_feats)
+DESCRIPTORS.update(autocorrelation.DESCRIPTORS)
+
+
+def _lags(func):
+
+    """ The lags a descriptor is calculated for, or `None` if it is scalar.
+    """
+
+    if isinstance(func, partial) and 'ks' in func.keywords:
+        return list(func.keywords['ks'])
+
+
+class DescriptorFeaturizer(Transformer, Featurizer):
+
+    """ Featurizer calculating the scikit-chem descriptors.
+
+    The cached values that the requested descriptors depend on (such as the
+    distance matrix or the partial charges) are resolved into an execution
+    plan, which is run once per molecule before the descriptors themselves are
+    calculated.  If a step of the plan fails, the descriptors depending on it
+    are given as NaN without it being retried.
+
+    Descriptors given as a `functools.partial` with the lags `ks` produce a
+    column for each lag.
+
+    Args:
+        features (str or list or dict):
+            The descriptors to calculate.  Either 'all', a name or list of
+            names from `DESCRIPTORS`, or a dict of names to descriptor
+            functions.
+        dtype (np.dtype):
+            The dtype of the result.  This must be a floating point dtype, as
+            descriptors that fail to calculate are given as NaN.
+        n_jobs (int):
+            The number of processes to run the featurizer in.
+        verbose (bool):
+            Whether to output a progress bar.
+
+    Examples:
+        >>> import skchem
+        >>> df = skchem.features.DescriptorFeaturizer(
+        ...     ['n_atoms', 'galvez_gci'], verbose=False)
+        >>> [name for name, kwargs in df.plan]
+        ['distance_matrix', 'adjacency_matrix', 'galvez_matrix', \
+'charge_matrix', 'topological_charge_index']
+        >>> df.transform(skchem.Mol.from_smiles('CCO')).round(3)
+        descriptors
+        n_atoms       3.00
+        galvez_gci    1.25
+        Name: DescriptorFeaturizer, dtype: float64
+    """
+
+    def __init__(self, features='all', dtype=np.float64, n_jobs=1,
+                 verbose=True):
+        if not np.issubdtype(dtype, np.floating):
+            raise ValueError('dtype must be a floating point dtype to hold '
+                             'NaN for failed descriptors, not {}.'.format(
+                                 np.dtype(dtype)))
+        self.dtype = dtype
+        self.features = features
+        super(DescriptorFeaturizer, self).__init__(n_jobs=n_jobs,
+                                                   verbose=verbose)
+
+    @property
+    def name(self):
+        return 'descriptors'
+
+    @property
+    def features(self):
+        return self._features
+
+    @features.setter
+    def features(self, features):
+        if isinstance(features, str):
+            if features == 'all':
+                features = DESCRIPTORS
+            else:
+                features = {features: DESCRIPTORS[features]}
+        elif isinstance(features, list):
+            features = OrderedDict((feature, DESCRIPTORS[feature])
+                                   for feature in features)
+        elif not isinstance(features, (dict, pd.Series)):
+            raise NotImplementedError('Cannot use features {}'.format(
+                features))
+
+        self._features = pd.Series(features)
+        self._features.index.name = 'descriptors'
+        self._make_plan()
+
+    def _make_plan(self):
+
+        """ Resolve the columns and the execution plan for the features. """
+
+        columns, self._slices, self._requires = [], [], []
+        plan = OrderedDict()
+
+        for name, func in self.features.items():
+            lags = _lags(func)
+            if lags is None:
+                columns.append(name)
+                self._slices.append(len(columns) - 1)
+            else:
+                columns.extend('{}_{}'.format(name, k) for k in lags)
+                self._slices.append(slice(len(columns) - len(lags),
+                                          len(columns)))
+
+            steps = cache.dependencies(func)
+            self._requires.append(set(steps))
+            for step in steps:
+                if step not in plan:
+                    dep_name, dep_kwargs = step
+                    inj_func = cache.cached[dep_name][0]
+                    plan[step] = set(cache.dependencies(inj_func,
+                                                        **dict(dep_kwargs)))
+
+        self._columns = pd.Index(columns, name=self.features.index.name)
+        self._plan = plan
+
+    @property
+    def plan(self):
+
+        """ list<(str, tuple)>: the cached values to calculate for each
+        molecule, with their keyword arguments, in order. """
+
+        return list(self._plan)
+
+    @property
+    def columns(self):
+        return self._columns
+
+    def _transform_mol(self, mol):
+
+        # undefined values (e.g. for single atoms) are returned as NaN
+        with cache.scope(mol), np.errstate(divide='ignore', invalid='ignore'):
+            return self._run_plan(mol)
+
+    def _run_plan(self, mol):
+
+        """ Calculate the plan, then the features, for a molecule. """
+
+        res = np.full(len(self.columns), np.nan, dtype=self.dtype)
+        failed = set()
+
+        for step, requires in self._plan.items():
+            name, kwargs = step
+            if requires & failed:
+                failed.add(step)
+                continue
+            try:
+                cache.cached[name][0](mol, **dict(kwargs))
+            except (ValueError, ArithmeticError) as e:
+                LOGGER.debug('Failed to calculate %s: %s', name, e)
+                failed.add(step)
+
+        for func, idx, requires in zip(self.features.values, self._slices,
+                                       self._requires):
+            if requires & failed:
+                continue
+            try:
+                res[idx] = func(mol)
+            except (ValueError, ArithmeticError) as e:
+                LOGGER.debug('Failed to calculate %s: %s', func, e)
+
+        return res
+
+    def _transform_series(self, ser):
+
+        """ Transform a series of molecules to an np.ndarray. """
+
+        LOGGER.debug('Transforming series of length %s with %s jobs',
+                     len(ser), self.n_jobs)
+
+        bar = self.optional_bar(max_value=len(ser))
+        res = np.empty((len(ser), len(self.columns)), dtype=self.dtype)
+
+        if self.n_jobs == 1:
+            for i, mol in enumerate(bar(ser)):
+                res[i] = self._transform_mol(mol)
+        else:
+            cpy = self.copy()
+            # send the molecules to the workers in batches
+            chunksize = max(1, len(ser) // (4 * self.n_jobs))
+            with multiprocessing.Pool(processes=self.n_jobs) as pool:
+                for i, arr in enumerate(bar(pool.imap(cpy._transform_mol, ser,
+                                                      chunksize=chunksize))):
+                    res[i] = arr
+        return res
@@ -27,7 +27,7 @@ def atom_props(mol, prop_name='unweighted', c_scaled=False):
     else:
         props = getattr(mol.atoms, prop_name)
         if c_scaled:
-            props /= getattr(Mol.from_smiles('CC').atoms[0], prop_name)
+            props = props / getattr(Mol.from_smiles('CC').atoms[0], prop_name)
         return props
 
 
@@ -41,6 +41,54 @@ def distance_matrix(mol):
     return rdmolops.GetDistanceMatrix(mol)
 
 
+@cache
+@cache.inject(distance_matrix)
+def lag_matrix(mol, dist_mat, ks=(1, 2, 3, 4, 5, 6, 7, 8)):
+
+    """ The one-hot lag tensor of the topological distance matrix.
+
+    Args:
+        mol (skchem.Mol):
+            The molecule for which to calculate the tensor.
+        ks (tuple):
+            The lags.
+
+    Returns:
+        np.ndarray:
+            Array of shape `(len(ks), n_atoms, n_atoms)`, where element
+            `[k, i, j]` is 1 if atoms `i` and `j` are `ks[k]` bonds apart.
+    """
+
+    return lag_tensor(dist_mat, ks)
+
+
+def lag_tensor(dist_mat, ks):
+
+    """ Bin (a batch of) distance matrices into a one-hot lag tensor.
+
+    Args:
+        dist_mat (np.ndarray):
+            The distance matrices, of shape `(..., n_atoms, n_atoms)`.
+        ks (iterable):
+            The lags.
+
+    Returns:
+        np.ndarray:
+            Array of shape `(..., len(ks), n_atoms, n_atoms)`.
+
+    Examples:
+        >>> lag_tensor(np.array([[0, 1], [1, 0]]), ks=(0, 1)).astype(int)
+        array([[[1, 0],
+                [0, 1]],
+        <BLANKLINE>
+               [[0, 1],
+                [1, 0]]])
+    """
+
+    ks = np.asarray(tuple(ks)).reshape(-1, 1, 1)
+    return (dist_mat[..., np.newaxis, :, :] == ks).astype(float)
+
+
 @cache
 def adjacency_matrix(mol):
 
@@ -73,6 +121,6 @@ def molecular_matrix(mol, conformer=-1):
     return mol.conformers[conformer].positions
 
 
-__all__ = ['distance_matrix', 'adjacency_matrix',
+__all__ = ['distance_matrix', 'lag_matrix', 'lag_tensor', 'adjacency_matrix',
            'bond_order_adjacency_matrix', 'degrees', 'geometric_matrix',
            'molecular_matrix']
\ No newline at end of file
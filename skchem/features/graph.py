@@ -0,0 +1,429 @@
+#! /usr/bin/env python
+#
+# Copyright (C) 2016 Rich Lewis <rl403@cam.ac.uk>
+# License: 3-clause BSD
+
+"""
+## skchem.features.graph
+
+Module for featurizing molecules as graphs, for graph neural networks.
+"""
+
+import functools
+import multiprocessing
+import logging
+
+import numpy as np
+import pandas as pd
+
+from ..core import Mol
+from ..base import BaseTransformer, Featurizer
+from ..utils import iterable_to_series
+from .atom import AtomFeaturizer
+
+LOGGER = logging.getLogger(__name__)
+
+
+def bond_order(bonds):
+
+    """ Orders of the bonds """
+
+    return bonds.order
+
+
+def is_bond_order(bonds, order=1.):
+
+    """ Are the bonds of a given order """
+
+    return bonds.order == order
+
+
+def is_aromatic(bonds):
+
+    """ Booleans if the bonds are aromatic """
+
+    return bonds.is_aromatic
+
+
+def is_conjugated(bonds):
+
+    """ Booleans if the bonds are conjugated """
+
+    return bonds.is_conjugated
+
+
+def is_in_ring(bonds):
+
+    """ Whether the bonds are in a ring """
+
+    return bonds.is_in_ring
+
+
+# functions of a `skchem.core.BondView`, giving a value for each bond
+BOND_FEATURES = {
+    'order': bond_order,
+    'is_single': functools.partial(is_bond_order, order=1.),
+    'is_double': functools.partial(is_bond_order, order=2.),
+    'is_triple': functools.partial(is_bond_order, order=3.),
+    'is_aromatic': is_aromatic,
+    'is_conjugated': is_conjugated,
+    'is_in_ring': is_in_ring
+}
+
+
+def _decode(s):
+    return s.decode() if isinstance(s, bytes) else s
+
+
+class GraphBatch(object):
+
+    """ A batch of molecular graphs, as a single disjoint union graph.
+
+    The nodes (atoms) and edges (bonds) of all the graphs are concatenated, with
+    the edge index referring to the nodes of the union.  Each graph may be
+    recovered from the offsets, so no padding is required.
+
+    Args:
+        node_features (np.ndarray):
+            The features of the nodes, of shape `(n_nodes, n_node_features)`.
+        edge_index (np.ndarray):
+            The source and target nodes of each edge, of shape `(2, n_edges)`.
+        edge_features (np.ndarray):
+            The features of the edges, of shape `(n_edges, n_edge_features)`.
+        node_offsets (np.ndarray):
+            The first node of each graph, with the number of nodes appended.
+        edge_offsets (np.ndarray):
+            The first edge of each graph, with the number of edges appended.
+        index (pd.Index):
+            The index of the graphs.
+        node_columns (pd.Index):
+            The names of the node features.
+        edge_columns (pd.Index):
+            The names of the edge features.
+    """
+
+    _arrays = ('node_features', 'edge_index', 'edge_features',
+               'node_offsets', 'edge_offsets')
+
+    def __init__(self, node_features, edge_index, edge_features, node_offsets,
+                 edge_offsets, index=None, node_columns=None,
+                 edge_columns=None):
+        self.node_features = node_features
+        self.edge_index = edge_index
+        self.edge_features = edge_features
+        self.node_offsets = node_offsets
+        self.edge_offsets = edge_offsets
+        if index is None:
+            index = pd.RangeIndex(len(node_offsets) - 1, name='batch')
+        self.index = index
+        self.node_columns = node_columns
+        self.edge_columns = edge_columns
+
+    @classmethod
+    def from_graphs(cls, graphs, **kwargs):
+
+        """ Create a batch from individual graphs.
+
+        Args:
+            graphs (iterable<tuple>):
+                The `(node_features, edge_index, edge_features)` of each graph,
+                with the edge index referring to the nodes of the graph.
+            **kwargs:
+                Passed to the constructor.
+
+        Returns:
+            GraphBatch
+        """
+
+        nodes, edge_idxs, edges = zip(*graphs) if graphs else ((), (), ())
+        node_offsets = np.cumsum([0] + [len(n) for n in nodes])
+        edge_offsets = np.cumsum([0] + [len(e) for e in edges])
+        edge_index = [idx + offset
+                      for idx, offset in zip(edge_idxs, node_offsets)]
+
+        def concat(arrs, columns):
+            if arrs:
+                return np.concatenate(arrs)
+            return np.empty((0, 0 if columns is None else len(columns)))
+
+        return cls(concat(nodes, kwargs.get('node_columns')),
+                   np.concatenate(edge_index, axis=1) if edge_index
+                   else np.empty((2, 0), dtype=int),
+                   concat(edges, kwargs.get('edge_columns')),
+                   node_offsets, edge_offsets, **kwargs)
+
+    @property
+    def n_nodes(self):
+
+        """ np.ndarray: the number of nodes in each graph. """
+
+        return np.diff(self.node_offsets)
+
+    @property
+    def n_edges(self):
+
+        """ np.ndarray: the number of edges in each graph. """
+
+        return np.diff(self.edge_offsets)
+
+    @property
+    def node_graph(self):
+
+        """ np.ndarray: the graph each node belongs to, for pooling. """
+
+        return np.repeat(np.arange(len(self)), self.n_nodes)
+
+    def __len__(self):
+        return len(self.node_offsets) - 1
+
+    def __getitem__(self, i):
+
+        """ Get the `(node_features, edge_index, edge_features)` of a graph,
+        with the edge index referring to the nodes of the graph. """
+
+        n_start, n_stop = self.node_offsets[i:i + 2]
+        e_start, e_stop = self.edge_offsets[i:i + 2]
+        return (self.node_features[n_start:n_stop],
+                self.edge_index[:, e_start:e_stop] - n_start,
+                self.edge_features[e_start:e_stop])
+
+    def to_hdf(self, f, key='graphs', chunk_size=4096, compression=None):
+
+        """ Write the batch to an HDF5 file in a chunked layout.
+
+        Args:
+            f (str or h5py.Group):
+                The file path or h5py group to write to.
+            key (str):
+                The name of the group to write the batch to.
+            chunk_size (int):
+                The number of rows in each chunk.
+            compression (str):
+                The h5py compression filter to use, e.g. 'gzip' or 'lzf'.
+        """
+
+        import h5py
+
+        if not isinstance(f, h5py.Group):
+            with h5py.File(f, 'a') as f:
+                return self.to_hdf(f, key=key, chunk_size=chunk_size,
+                                   compression=compression)
+
+        grp = f.create_group(key)
+        for name in self._arrays:
+            arr = getattr(self, name)
+            chunks = [max(1, n) for n in arr.shape]
+            axis = 1 if name == 'edge_index' else 0
+            chunks[axis] = max(1, min(chunk_size, arr.shape[axis]))
+            grp.create_dataset(name, data=arr, chunks=tuple(chunks),
+                               compression=compression)
+        grp.create_dataset('index', data=self.index.astype(str).values
+                           .astype(bytes))
+        if self.index.name is not None:
+            grp.attrs['index_name'] = str(self.index.name)
+        for name in ('node_columns', 'edge_columns'):
+            cols = getattr(self, name)
+            if cols is not None:
+                grp.attrs[name] = [str(c).encode() for c in cols]
+                if cols.name is not None:
+                    grp.attrs[name + '_name'] = str(cols.name)
+
+    @classmethod
+    def from_hdf(cls, f, key='graphs', start=None, stop=None):
+
+        """ Read a contiguous slice of graphs from an HDF5 file.
+
+        Only the chunks holding the requested graphs are read.
+
+        Args:
+            f (str or h5py.Group):
+                The file path or h5py group to read from.
+            key (str):
+                The name of the group the batch was written to.
+            start (int):
+                The first graph to read.
+            stop (int):
+                The graph to stop reading at.
+
+        Returns:
+            GraphBatch
+        """
+
+        import h5py
+
+        if not isinstance(f, h5py.Group):
+            with h5py.File(f, 'r') as f:
+                return cls.from_hdf(f, key=key, start=start, stop=stop)
+
+        grp = f[key]
+        start, stop, _ = slice(start, stop).indices(len(grp['index']))
+        stop = max(start, stop)
+        node_offsets = grp['node_offsets'][start:stop + 1]
+        edge_offsets = grp['edge_offsets'][start:stop + 1]
+        n_start, n_stop = node_offsets[0], node_offsets[-1]
+        e_start, e_stop = edge_offsets[0], edge_offsets[-1]
+
+        index = pd.Index([_decode(i) for i in grp['index'][start:stop]],
+                         name=grp.attrs.get('index_name'))
+        cols = {name: pd.Index([_decode(c) for c in grp.attrs[name]],
+                               name=grp.attrs.get(name + '_name'))
+                for name in ('node_columns', 'edge_columns')
+                if name in grp.attrs}
+        return cls(grp['node_features'][n_start:n_stop],
+                   grp['edge_index'][:, e_start:e_stop] - n_start,
+                   grp['edge_features'][e_start:e_stop],
+                   node_offsets - n_start, edge_offsets - e_start,
+                   index=index, **cols)
+
+    def __repr__(self):
+        return '<{klass} n_graphs={n} n_nodes={nodes} n_edges={edges} ' \
+               'at {address}>'.format(klass=self.__class__.__name__,
+                                      n=len(self),
+                                      nodes=len(self.node_features),
+                                      edges=len(self.edge_features),
+                                      address=hex(id(self)))
+
+
+class GraphFeaturizer(BaseTransformer, Featurizer):
+
+    """ Featurize molecules as graphs, for graph neural networks.
+
+    Produces a `GraphBatch` of node (atom) features, edge (bond) features and
+    the edge index for a batch of molecules, concatenated as a disjoint union
+    with per graph offsets rather than padded to a maximum number of atoms.
+
+    Args:
+        atom_features (str or list or dict):
+            The atom features to use, as for `AtomFeaturizer`.
+        bond_features (str or list or dict):
+            The bond features to use.  Either 'all', a list of names from
+            `BOND_FEATURES` or a dict of names to functions of the bonds of a
+            molecule (a `skchem.core.BondView`), giving a value per bond.
+        bidirectional (bool):
+            Whether to include an edge in each direction for every bond.
+        n_jobs (int):
+            The number of processes to run the featurizer in.
+        verbose (bool):
+            Whether to output a progress bar.
+
+    Examples:
+        >>> import skchem
+        >>> gf = skchem.features.GraphFeaturizer(verbose=False)
+        >>> ms = [skchem.Mol.from_smiles(s) for s in ('CCO', 'c1ccccc1')]
+        >>> batch = gf.transform(ms)
+        >>> batch.node_offsets
+        array([0, 3, 9])
+        >>> batch.edge_index.shape
+        (2, 16)
+    """
+
+    def __init__(self, atom_features='all', bond_features='all',
+                 bidirectional=True, n_jobs=1, verbose=True):
+        self.atom_features = atom_features
+        self.bond_features = bond_features
+        self.bidirectional = bidirectional
+        self._atom_featurizer = AtomFeaturizer(features=atom_features,
+                                               verbose=False)
+        super(GraphFeaturizer, self).__init__(n_jobs=n_jobs, verbose=verbose)
+
+    @property
+    def name(self):
+        return 'graph'
+
+    @property
+    def bond_features(self):
+        return self._bond_features
+
+    @bond_features.setter
+    def bond_features(self, features):
+        if isinstance(features, str):
+            if features == 'all':
+                features = BOND_FEATURES
+            else:
+                features = {features: BOND_FEATURES[features]}
+        elif isinstance(features, list):
+            features = {feature: BOND_FEATURES[feature]
+                        for feature in features}
+        elif not isinstance(features, (dict, pd.Series)):
+            raise NotImplementedError('Cannot use features {}'.format(
+                features))
+
+        self._bond_features = pd.Series(features)
+        self._bond_features.index.name = 'bond_features'
+
+    @property
+    def node_columns(self):
+        """ pd.Index: the names of the node features. """
+        return self._atom_featurizer.minor_axis
+
+    @property
+    def edge_columns(self):
+        """ pd.Index: the names of the edge features. """
+        return self.bond_features.index
+
+    @property
+    def axes_names(self):
+        return 'node', self.node_columns.name
+
+    def _transform_mol(self, mol):
+
+        """ Transform a molecule to `(node_features, edge_index,
+        edge_features)`. """
+
+        nodes = np.array([self._atom_featurizer._transform_atom(a)
+                          for a in mol.atoms], dtype=float)
+        nodes = nodes.reshape(len(mol.atoms), len(self.node_columns))
+
+        bonds = mol.bonds
+        edge_index = np.array([b.atom_idxs for b in bonds],
+                              dtype=int).reshape(-1, 2).T
+        edges = np.array([f(bonds) for f in self.bond_features.values],
+                         dtype=float)
+        edges = edges.T.reshape(len(bonds), len(self.edge_columns))
+
+        if self.bidirectional:
+            edge_index = np.stack([edge_index, edge_index[::-1]],
+                                  axis=2).reshape(2, -1)
+            edges = np.repeat(edges, 2, axis=0)
+        return nodes, edge_index, edges
+
+    def _transform_series(self, ser):
+
+        """ Transform a series of molecules to a list of graphs. """
+
+        LOGGER.debug('Transforming series of length %s with %s jobs',
+                     len(ser), self.n_jobs)
+        bar = self.optional_bar(max_value=len(ser))
+        if self.n_jobs == 1:
+            return [self._transform_mol(mol) for mol in bar(ser)]
+        else:
+            cpy = self.copy()
+            with multiprocessing.Pool(processes=self.n_jobs) as pool:
+                return list(bar(pool.imap(cpy._transform_mol, ser)))
+
+    def transform(self, mols):
+
+        """ Featurize molecules as graphs.
+
+        Args:
+            mols (skchem.Mol or pd.Series or iterable):
+                The molecules to featurize.
+
+        Returns:
+            GraphBatch
+        """
+
+        if isinstance(mols, Mol):
+            mols = pd.Series([mols], index=[mols.name or 0])
+        elif not isinstance(mols, pd.Series):
+            mols = iterable_to_series(mols)
+
+        return self._assemble(self._transform_series(mols), mols.index)
+
+    def _assemble(self, results, index):
+
+        """ Assemble the results of `_transform_mol` for molecules. """
+
+        return GraphBatch.from_graphs(results, index=index,
+                                      node_columns=self.node_columns,
+                                      edge_columns=self.edge_columns)
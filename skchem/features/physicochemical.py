@@ -8,16 +8,196 @@
 
 Physicochemical descriptors and associated functions are defined.
 
+Many of the RDKit descriptors are derived from the same per atom
+contributions (Crippen logP and MR, Labute ASA, TPSA, Gasteiger charges and
+EState indices).  These intermediates are cached on the molecule, and the
+descriptors depending on them are calculated from the cached values, so that
+each intermediate is calculated at most once per molecule, and only if a
+requested descriptor requires it.  All other descriptors are calculated by
+RDKit directly.
 """
 
-from rdkit.Chem import Descriptors
+from functools import partial
+
+from rdkit import Chem
+from rdkit.Chem import Descriptors, MolSurf, rdMolDescriptors
+from rdkit.Chem.EState import EState, EState_VSA
 import pandas as pd
 import numpy as np
 
 from ..base import Transformer, Featurizer
 from ..utils import camel_to_snail
+from .descriptors.caching import cache
+from .descriptors.charge import gasteiger_charges
+
+
+@cache
+def crippen_contribs(mol):
+
+    """ The Crippen logP and MR contributions of the atoms of the h-filled
+    molecule.  The heavy atoms come first, so the first `len(mol.atoms)` rows
+    are the contributions of the atoms of the molecule.
+
+    Returns:
+        np.ndarray
+    """
+
+    contribs = rdMolDescriptors._CalcCrippenContribs(Chem.AddHs(mol))
+    return np.array(contribs, dtype=float).reshape(-1, 2)
+
+
+@cache
+def labute_asa_contribs(mol):
+
+    """ The Labute ASA contributions of the atoms, and of the hydrogens.
+
+    Returns:
+        tuple(np.ndarray, float)
+    """
+
+    atoms, hs = rdMolDescriptors._CalcLabuteASAContribs(mol)
+    return np.array(atoms, dtype=float), hs
+
+
+@cache
+def tpsa_contribs(mol):
+
+    """ The TPSA contributions of the atoms.
+
+    Returns:
+        np.ndarray
+    """
+
+    return np.array(rdMolDescriptors._CalcTPSAContribs(mol), dtype=float)
+
+
+@cache
+def estate_indices(mol):
+
+    """ The EState indices of the atoms.
+
+    Returns:
+        np.ndarray
+    """
+
+    return np.asarray(EState.EStateIndices(mol), dtype=float)
+
+
+def _binned(values, weights, bins):
+
+    """ Sum the weights of the values falling in each bin, as for the MOE-type
+    VSA descriptors. """
+
+    idx = np.searchsorted(bins, values, side='right')
+    return np.bincount(idx, weights=weights, minlength=len(bins) + 1)
+
+
+@cache
+@cache.inject(crippen_contribs, labute_asa_contribs)
+def slogp_vsa(mol, crippen, asa):
+    return _binned(crippen[:len(asa[0]), 0], asa[0], MolSurf.logpBins)
+
+
+@cache
+@cache.inject(crippen_contribs, labute_asa_contribs)
+def smr_vsa(mol, crippen, asa):
+    return _binned(crippen[:len(asa[0]), 1], asa[0], MolSurf.mrBins)
+
+
+@cache
+@cache.inject(gasteiger_charges, labute_asa_contribs)
+def peoe_vsa(mol, charges, asa):
+    return _binned(charges, asa[0], MolSurf.chgBins)
+
+
+@cache
+@cache.inject(estate_indices, labute_asa_contribs)
+def estate_vsa(mol, estate, asa):
+    return _binned(estate, asa[0], EState_VSA.estateBins)
+
+
+@cache
+@cache.inject(estate_indices, labute_asa_contribs)
+def vsa_estate(mol, estate, asa):
+    return _binned(asa[0], estate, EState_VSA.vsaBins)
+
+
+@cache
+@cache.inject(gasteiger_charges)
+def partial_charge_range(mol, charges):
+
+    """ The minimum and maximum partial charges, with the semantics of RDKit
+    for undefined charges. """
+
+    lo, hi = 500., -500.
+    for charge in charges:
+        lo, hi = min(charge, lo), max(charge, hi)
+    return lo, hi
+
+
+def _item(mol, func=None, i=0):
+
+    """ Get an item of the result of a function. """
+
+    return func(mol)[i]
+
+
+def _aggregate(mol, func=None, agg=max, absolute=False):
+
+    """ Aggregate the (absolute) values of the result of a function. """
+
+    return agg(abs(v) if absolute else v for v in func(mol))
+
+
+@cache.inject(crippen_contribs)
+def mol_log_p(mol, crippen):
+    return crippen[:, 0].sum()
+
+
+@cache.inject(crippen_contribs)
+def mol_m_r(mol, crippen):
+    return crippen[:, 1].sum()
+
+
+@cache.inject(labute_asa_contribs)
+def labute_asa(mol, asa):
+    return asa[0].sum() + asa[1]
+
+
+@cache.inject(tpsa_contribs)
+def tpsa(mol, contribs):
+    return contribs.sum()
+
+
+SHARED_DESCRIPTORS = {
+    'MolLogP': mol_log_p,
+    'MolMR': mol_m_r,
+    'LabuteASA': labute_asa,
+    'TPSA': tpsa,
+    'MaxEStateIndex': partial(_aggregate, func=estate_indices, agg=max),
+    'MinEStateIndex': partial(_aggregate, func=estate_indices, agg=min),
+    'MaxAbsEStateIndex': partial(_aggregate, func=estate_indices, agg=max,
+                                 absolute=True),
+    'MinAbsEStateIndex': partial(_aggregate, func=estate_indices, agg=min,
+                                 absolute=True),
+    'MaxPartialCharge': partial(_item, func=partial_charge_range, i=1),
+    'MinPartialCharge': partial(_item, func=partial_charge_range, i=0),
+    'MaxAbsPartialCharge': partial(_aggregate, func=partial_charge_range,
+                                   agg=max, absolute=True),
+    'MinAbsPartialCharge': partial(_aggregate, func=partial_charge_range,
+                                   agg=min, absolute=True),
+}
+for _name, _func, _bins in (('SlogP_VSA', slogp_vsa, MolSurf.logpBins),
+                            ('SMR_VSA', smr_vsa, MolSurf.mrBins),
+                            ('PEOE_VSA', peoe_vsa, MolSurf.chgBins),
+                            ('EState_VSA', estate_vsa, EState_VSA.estateBins),
+                            ('VSA_EState', vsa_estate, EState_VSA.vsaBins)):
+    SHARED_DESCRIPTORS.update({
+        '{}{}'.format(_name, i + 1): partial(_item, func=_func, i=i)
+        for i in range(len(_bins) + 1)})
 
-DESCRIPTORS = {camel_to_snail(s): f for (s, f) in Descriptors.descList}
+DESCRIPTORS = {camel_to_snail(s): SHARED_DESCRIPTORS.get(s, f)
+               for (s, f) in Descriptors.descList}
 
 
 class PhysicochemicalFeaturizer(Transformer, Featurizer):
@@ -65,11 +245,13 @@ class PhysicochemicalFeaturizer(Transformer, Featurizer):
         return self.features.index
 
     def _transform_mol(self, mol):
-        res = []
-        for (n, f) in self.features.iteritems():
-            try:
-                res.append(f(mol))
-            except ValueError:
-                return res.append(np.NaN)
-
-        return np.array(res)
+        # intermediates shared between descriptors are cached on the molecule
+        # whilst it is being transformed
+        res = np.full(len(self.features), np.nan)
+        with cache.scope(mol):
+            for i, f in enumerate(self.features.values):
+                try:
+                    res[i] = f(mol)
+                except ValueError:
+                    pass
+        return res
@@ -0,0 +1,168 @@
+#! /usr/bin/env python
+#
+# Copyright (C) 2016 Rich Lewis <rl403@cam.ac.uk>
+# License: 3-clause BSD
+
+"""
+# skchem.features.union
+
+Calculating several featurizers in a single pass over molecules.
+"""
+
+from collections import OrderedDict
+import multiprocessing
+import logging
+
+import pandas as pd
+
+from ..core import Mol
+from ..base import BaseTransformer, BatchTransformer, CLIWrapper
+from ..utils import iterable_to_series
+from .descriptors.caching import cache
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _shareable(fper):
+
+    """ Whether a featurizer can be run a molecule at a time in a union. """
+
+    return hasattr(fper, '_assemble') and \
+        not isinstance(fper, (BatchTransformer, CLIWrapper))
+
+
+class FeatureUnion(BaseTransformer):
+
+    """ Calculate several featurizers in a single pass over molecules.
+
+    Each molecule is featurized by all the featurizers in turn, in the same
+    process and within a single descriptor cache scope, so intermediate values
+    (such as distance matrices or hydrogen depleted graphs) are calculated
+    once and shared between them.  Featurizers that work on batches of
+    molecules (such as the external tool wrappers) are run separately on all
+    the molecules.
+
+    Args:
+        featurizers (list):
+            The featurizers, as featurizer objects or names (see
+            `skchem.features.get`), or `(name, featurizer)` pairs, or a dict
+            of featurizers by name.
+        n_jobs (int):
+            The number of processes to run the featurizers in.
+        verbose (bool):
+            Whether to output a progress bar.
+
+    Examples:
+        >>> import skchem
+        >>> fu = skchem.features.FeatureUnion(
+        ...     ['morgan', 'physicochemical'], verbose=False)
+        >>> ms = [skchem.Mol.from_smiles(s) for s in ('CCO', 'c1ccccc1')]
+        >>> list(fu.names)
+        ['morgan', 'physicochemical']
+        >>> res = fu.transform(ms)
+        >>> res['morgan'].shape
+        (2, 2048)
+    """
+
+    def __init__(self, featurizers, n_jobs=1, verbose=True):
+        self.featurizers = featurizers
+        super(FeatureUnion, self).__init__(n_jobs=n_jobs, verbose=verbose)
+
+    @property
+    def featurizers(self):
+        return self._featurizers
+
+    @featurizers.setter
+    def featurizers(self, featurizers):
+        from . import get
+
+        if isinstance(featurizers, dict):
+            featurizers = featurizers.items()
+
+        fpers = OrderedDict()
+        for fper in featurizers:
+            if isinstance(fper, tuple):
+                name, fper = fper
+            elif isinstance(fper, str):
+                name = fper
+            else:
+                name = fper.__class__.__name__
+            fper = get(fper)
+            if name in fpers:
+                raise ValueError('Featurizer names must be unique, but {} is '
+                                 'repeated.'.format(name))
+            fpers[name] = fper
+        self._featurizers = fpers
+
+    @property
+    def names(self):
+        """ pd.Index: the names of the featurizers. """
+        return pd.Index(list(self.featurizers), name='featurizers')
+
+    @property
+    def axes_names(self):
+        """ dict: the names of the axes of each featurizer's results. """
+        return OrderedDict((name, fper.axes_names)
+                           for name, fper in self.featurizers.items())
+
+    @property
+    def _shared(self):
+        return [fper for fper in self.featurizers.values() if _shareable(fper)]
+
+    def _transform_mol(self, mol):
+
+        """ Transform a molecule with each of the shareable featurizers. """
+
+        with cache.scope(mol):
+            return tuple(fper._transform_mol(mol) for fper in self._shared)
+
+    def _transform_series(self, ser):
+
+        """ Transform a series of molecules with each of the shareable
+        featurizers, returning a list of the results for each. """
+
+        LOGGER.debug('Transforming series of length %s with %s jobs',
+                     len(ser), self.n_jobs)
+
+        bar = self.optional_bar(max_value=len(ser))
+        if self.n_jobs == 1:
+            res = [self._transform_mol(mol) for mol in bar(ser)]
+        else:
+            cpy = self.copy()
+            chunksize = max(1, len(ser) // (4 * self.n_jobs))
+            with multiprocessing.Pool(processes=self.n_jobs) as pool:
+                res = list(bar(pool.imap(cpy._transform_mol, ser,
+                                         chunksize=chunksize)))
+        return [list(results) for results in zip(*res)] if res else \
+            [[] for _ in self._shared]
+
+    def transform(self, mols):
+
+        """ Featurize molecules with each of the featurizers.
+
+        Args:
+            mols (skchem.Mol or pd.Series or iterable):
+                The molecules to featurize.
+
+        Returns:
+            OrderedDict:
+                The result of each featurizer, by name, as returned by its
+                `transform`.
+        """
+
+        if isinstance(mols, Mol):
+            with cache.scope(mols):
+                return OrderedDict((name, fper.transform(mols)) for name, fper
+                                   in self.featurizers.items())
+
+        elif not isinstance(mols, pd.Series):
+            mols = iterable_to_series(mols)
+
+        shared = iter(self._transform_series(mols))
+        res = OrderedDict()
+        for name, fper in self.featurizers.items():
+            if _shareable(fper):
+                res[name] = fper._assemble(next(shared), mols.index)
+            else:
+                res[name] = fper.transform(mols)
+        return res
@@ -16,7 +16,7 @@ from collections import Counter
 import numpy as np
 import pandas as pd
 
-from ..resource import ORGANIC, PERIODIC_TABLE
+from ..resource import ELEMENTS, ORGANIC
 from .base import Filter
 
 
@@ -114,7 +114,7 @@ class ElementFilter(Filter):
     @elements.setter
     def elements(self, val):
         if val is None:
-            self._elements = PERIODIC_TABLE.symbol.tolist()
+            self._elements = ELEMENTS.symbol[1:].tolist()
         else:
             self._elements = val
 
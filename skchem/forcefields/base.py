@@ -12,7 +12,9 @@ import warnings
 from abc import ABCMeta, abstractmethod
 
 import pandas as pd
-from rdkit.Chem.rdDistGeom import EmbedMolecule
+from rdkit.Chem import Conformer
+from rdkit.Chem.AllChem import GetConformerRMS
+from rdkit.Chem.rdDistGeom import EmbedMolecule, EmbedMultipleConfs
 
 from ..utils import Suppressor
 from ..base import Transformer
@@ -20,32 +22,90 @@ from ..filters.base import TransformFilter
 
 
 class ForceField(Transformer, TransformFilter):
-    # TODO: Multiple conformer generation handling.
 
     """ Base forcefield class.
 
     Filter drops those that fail to be optimized.
 
+    If `n_conformers` is greater than one, that many conformers are embedded
+    in a single call and optimized together, using `n_threads` threads in
+    RDKit.  Conformers that fail to optimize are dropped, and the rest are
+    ordered by energy, pruned and truncated according to `prune_rms`,
+    `energy_window` and `n_keep`.
+
+    Args:
+        preembed (bool):
+            Whether to embed before optimizing.
+        warn_on_fail (bool):
+            Whether to warn if a molecule fails to optimise.
+        error_on_fail (bool):
+            Whether to raise an error if a molecule fails to optimise.
+        add_hs (bool):
+            Whether to automatically add hydrogens.
+        n_conformers (int):
+            The number of conformers to embed per molecule.
+        n_keep (int):
+            The maximum number of lowest energy conformers to keep.  If
+            `None`, keep all that survive pruning.
+        prune_rms (float):
+            The RMSD in angstroms below which conformers are considered
+            duplicates, both on embedding and after optimization.  If `None`,
+            do not prune.
+        energy_window (float):
+            Drop conformers with energy more than this above the lowest energy
+            conformer, in kcal/mol.  If `None`, do not drop any.
+        n_threads (int):
+            The number of threads RDKit uses to embed and optimize the
+            conformers of each molecule.  If `0`, use all available.
+        in_place (bool):
+            Whether to modify the molecules in place, rather than copying them
+            before they are embedded and optimized.  This avoids the copy if
+            the original molecules are not needed.
+        n_jobs (int):
+            The number of processes to run across molecules.
+        verbose (bool):
+            Whether to output a progress bar.
      """
 
     __metaclass__ = ABCMeta
 
     def __init__(self, preembed=True, warn_on_fail=True, error_on_fail=False,
-                 add_hs=True, n_jobs=1, verbose=True):
+                 add_hs=True, n_conformers=1, n_keep=None, prune_rms=None,
+                 energy_window=None, n_threads=1, in_place=False, n_jobs=1,
+                 verbose=True):
 
         self.add_hs = add_hs
         self.warn_on_fail = warn_on_fail
         self.error_on_fail = error_on_fail
         self.preembed = preembed
+        self.n_conformers = n_conformers
+        self.n_keep = n_keep
+        self.prune_rms = prune_rms
+        self.energy_window = energy_window
+        self.n_threads = n_threads
+        self.in_place = in_place
         super(ForceField, self).__init__(verbose=verbose, n_jobs=n_jobs)
 
     @property
     def columns(self):
         return pd.Index(['structure'])
 
+    @property
+    def multiple_conformers(self):
+        """ bool: whether multiple conformers are generated per molecule. """
+        return self.n_conformers > 1
+
     def embed(self, mol):
 
-        success = EmbedMolecule(mol)
+        if self.multiple_conformers:
+            prune_rms = -1 if self.prune_rms is None else self.prune_rms
+            ids = EmbedMultipleConfs(mol, numConfs=self.n_conformers,
+                                     pruneRmsThresh=prune_rms,
+                                     numThreads=self.n_threads)
+            success = 0 if len(ids) else -1
+        else:
+            success = EmbedMolecule(mol)
+
         if success == -1:
             msg = 'Failed to Embed Molecule {}'.format(mol.name)
             if self.error_on_fail:
@@ -61,7 +121,8 @@ class ForceField(Transformer, TransformFilter):
 
     def _transform_mol(self, mol):
 
-        mol = mol.copy()
+        if not self.in_place:
+            mol = mol.copy()
 
         with Suppressor():
             if self.preembed:
@@ -70,7 +131,11 @@ class ForceField(Transformer, TransformFilter):
             if mol is None:  # embedding failed
                 return None
 
-            res = self._optimize(mol)
+            if self.multiple_conformers:
+                res = self._select_conformers(
+                    mol, self._optimize_conformers(mol))
+            else:
+                res = self._optimize(mol)
 
         if res == -1:
             msg = 'Failed to optimize molecule \'{}\' using {}'.format(
@@ -83,11 +148,70 @@ class ForceField(Transformer, TransformFilter):
 
         return mol
 
+    def _select_conformers(self, mol, results):
+
+        """ Keep the best optimized conformers, in order of energy.
+
+        Args:
+            mol (skchem.Mol):
+                The molecule with optimized conformers.
+            results (list[(int, float)]):
+                The (status, energy) of each conformer, in conformer order.
+                A status of -1 means the optimization failed.
+
+        Returns:
+            int: -1 if no conformers were kept, 0 otherwise.
+        """
+
+        ids = [conf.GetId() for conf in mol.GetConformers()]
+        kept = sorted((energy, conf_id) for conf_id, (status, energy)
+                      in zip(ids, results) if status != -1)
+
+        if not kept:
+            return -1
+
+        if self.energy_window is not None:
+            kept = [(energy, conf_id) for energy, conf_id in kept
+                    if energy - kept[0][0] <= self.energy_window]
+
+        if self.prune_rms is not None:
+            unique = []
+            for energy, conf_id in kept:
+                if all(GetConformerRMS(mol, other, conf_id) > self.prune_rms
+                       for _, other in unique):
+                    unique.append((energy, conf_id))
+                    if self.n_keep and len(unique) == self.n_keep:
+                        break
+            kept = unique
+
+        kept = kept[:self.n_keep]
+
+        confs = [Conformer(mol.GetConformer(conf_id)) for _, conf_id in kept]
+        mol.RemoveAllConformers()
+        for conf in confs:
+            mol.AddConformer(conf, assignId=True)
+        return 0
+
     @abstractmethod
     def _optimize(self, mol):
         pass
 
+    @abstractmethod
+    def _optimize_conformers(self, mol):
+        """ Optimize all conformers of the molecule.
+
+        Returns:
+            list[(int, float)]:
+                The (status, energy) of each conformer, as returned by the
+                RDKit `*OptimizeMoleculeConfs` functions.
+        """
+        pass
+
 
 class RoughEmbedding(ForceField):
     def _optimize(self, mol):
         return mol
+
+    def _optimize_conformers(self, mol):
+        # energies are not calculated, so the embedding order is kept
+        return [(0, 0.)] * mol.GetNumConformers()
@@ -8,7 +8,8 @@
 
 Module specifying the universal force field.
 """
-from rdkit.Chem.rdForceFieldHelpers import UFFOptimizeMolecule
+from rdkit.Chem.rdForceFieldHelpers import (UFFOptimizeMolecule,
+                                             UFFOptimizeMoleculeConfs)
 
 from .base import ForceField
 
@@ -18,7 +19,9 @@ class UFF(ForceField):
     """ Universal Force Field transformer. """
 
     def __init__(self, preembed=True, warn_on_fail=True, error_on_fail=False,
-                 add_hs=True, n_jobs=1, verbose=True):
+                 add_hs=True, n_conformers=1, n_keep=None, prune_rms=None,
+                 energy_window=None, n_threads=1, in_place=False, n_jobs=1,
+                 verbose=True):
 
         """ Initialize a UFF object.
 
@@ -31,14 +34,41 @@ class UFF(ForceField):
                 Whether to raise an error if a molecule fails to optimise.
             add_hs (bool):
                 Whether to automatically add hydrogens.
+            n_conformers (int):
+                The number of conformers to embed per molecule.
+            n_keep (int):
+                The maximum number of lowest energy conformers to keep.
+            prune_rms (float):
+                The RMSD below which conformers are considered duplicates.
+            energy_window (float):
+                The energy window in kcal/mol of conformers to keep.
+            n_threads (int):
+                The number of threads to use for each molecule.
+            in_place (bool):
+                Whether to modify the molecules in place, rather than copies.
+            n_jobs (int):
+                The number of processes to run across molecules.
+            verbose (bool):
+                Whether to output a progress bar.
         """
 
         super(UFF, self).__init__(preembed=preembed, warn_on_fail=warn_on_fail,
                                   error_on_fail=error_on_fail, add_hs=add_hs,
-                                  verbose=verbose, n_jobs=n_jobs)
+                                  n_conformers=n_conformers, n_keep=n_keep,
+                                  prune_rms=prune_rms,
+                                  energy_window=energy_window,
+                                  n_threads=n_threads, in_place=in_place,
+                                  verbose=verbose,
+                                  n_jobs=n_jobs)
 
     def _optimize(self, mol):
         try:
             return UFFOptimizeMolecule(mol)
         except RuntimeError:
-            return None
\ No newline at end of file
+            return None
+
+    def _optimize_conformers(self, mol):
+        try:
+            return UFFOptimizeMoleculeConfs(mol, numThreads=self.n_threads)
+        except RuntimeError:
+            return []
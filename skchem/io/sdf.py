@@ -10,27 +10,16 @@ Defining input and output operations for sdf files.
 """
 
 from functools import wraps
+import io
+import multiprocessing
 import warnings
 
 from rdkit import Chem
 import pandas as pd
 
 from ..core import Mol
-from ..utils import Suppressor, squeeze
-
-
-def _drop_props(row):
-    for prop in row.structure.props.keys():
-        row.structure.ClearProp(prop)
-
-
-def _set_props(row, cols):
-    for i in cols:
-        row.structure.SetProp(str(i), str(row[i]))
-
-
-def _set_name(row):
-    row.structure.name = str(row.name)  # rdkit props can only be strs
+from ..core.base import PropertyView, extract_props
+from ..utils import Suppressor, squeeze, open_file
 
 
 def read_sdf(sdf, error_bad_mol=False, warn_bad_mol=True, nmols=None,
@@ -44,6 +33,8 @@ def read_sdf(sdf, error_bad_mol=False, warn_bad_mol=True, nmols=None,
     Args:
         sdf (str or file-like):
             The location of data to load as a file path, or a file-like object.
+            Compressed files are decompressed in a background thread while
+            they are parsed.
         error_bad_mol (bool):
             Whether an error should be raised if a molecule fails to parse.
             Default is False.
@@ -62,10 +53,17 @@ def read_sdf(sdf, error_bad_mol=False, warn_bad_mol=True, nmols=None,
         read_props (bool):
             Whether to read the properties into the data frame.
             Default is `True`.
+
+            The type of each property is inferred for the column as a whole:
+            it is numeric only if every value is.
         mol_props (bool):
             Whether to keep properties in the molecule dictionary after they
             are extracted to the DataFrame.
             Default is `False`.
+        compression (str):
+            The compression of the file if a path is given, one of 'gzip',
+            'bz2', 'xz', 'zstd' or `None`.  If 'infer', infer from the
+            extension.  Keyword only.
         args, kwargs:
             Arguments will be passed to RDKit ForwardSDMolSupplier.
 
@@ -78,69 +76,141 @@ def read_sdf(sdf, error_bad_mol=False, warn_bad_mol=True, nmols=None,
         skchem.read_smiles
     """
 
+    # keyword only, so positional arguments still go to the supplier
+    compression = kwargs.pop('compression', 'infer')
+
     # nmols is actually the index to cutoff.  If we skip some at start, we need
     # to add this number
     if skipmols:
         nmols += skipmols
 
-    if isinstance(sdf, str):
-        sdf = open(sdf, 'rb')  # use read bytes for python 3 compatibility
+    opened = isinstance(sdf, str)
+    if opened:
+        # use read bytes for python 3 compatibility, decompressing compressed
+        # files in the background while the molecules are parsed
+        sdf = open_file(sdf, 'rb', compression, background=True)
 
-    # use the suppression context manager to not pollute our stdout with rdkit
-    # errors and warnings.
-    # perhaps this should be captured better by Mol etc.
-    with Suppressor():
+    try:
+        # use the suppression context manager to not pollute our stdout with
+        # rdkit errors and warnings.
+        # perhaps this should be captured better by Mol etc.
+        with Suppressor():
 
-        mol_supp = Chem.ForwardSDMolSupplier(sdf, *args, **kwargs)
+            mol_supp = Chem.ForwardSDMolSupplier(sdf, *args, **kwargs)
 
-        mols = []
+            mols = []
 
-        # single loop through sdf
-        for i, mol in enumerate(mol_supp):
+            # single loop through sdf
+            for i, mol in enumerate(mol_supp):
 
-            if skipmols and i < skipmols:
-                continue
+                if skipmols and i < skipmols:
+                    continue
 
-            if nmols and i >= nmols:
-                break
+                if nmols and i >= nmols:
+                    break
 
-            if mol is None:
-                msg = 'Molecule {} could not be decoded.'.format(i + 1)
-                if error_bad_mol:
-                    raise ValueError(msg)
-                elif warn_bad_mol:
-                    warnings.warn(msg)
-                continue
+                if mol is None:
+                    msg = 'Molecule {} could not be decoded.'.format(i + 1)
+                    if error_bad_mol:
+                        raise ValueError(msg)
+                    elif warn_bad_mol:
+                        warnings.warn(msg)
+                    continue
 
-            mols.append(Mol(mol))
+                mols.append(Mol(mol))
 
-        if skipfooter:
-            mols = mols[:-skipfooter]
+            if skipfooter:
+                mols = mols[:-skipfooter]
+    finally:
+        if opened:
+            sdf.close()
 
     idx = pd.Index((m.name for m in mols), name='batch')
     data = pd.DataFrame(mols, columns=['structure'])
 
     if read_props:
-        props = pd.DataFrame([{k: v for (k, v) in mol.props.items()}
-                              for mol in mols])
+        # extract the props column-wise, deleting them in the same pass if
+        # required
+        props = extract_props(mols, clear=not mol_props)
         data = pd.concat([data, props], axis=1)
-        # now we have extracted the props, we can delete if required
-        if not mol_props:
-            data.apply(_drop_props, axis=1)
 
     data.index = idx
     return squeeze(data, axis=1)
 
 
+def _props_block(props, record):
+
+    """ Format the data items of an sdf record. """
+
+    return ''.join('>  <{}>  ({}) \n{}\n\n'.format(key, record, value)
+                   for key, value in props.items())
+
+
+def _sdf_records(args):
+
+    """ Format a chunk of molecules as sdf records, without modifying them. """
+
+    mols, names, cols, rows, mol_props, start, kwargs = args
+    res = []
+    for i, mol in enumerate(mols):
+        block = Chem.MolToMolBlock(mol, **kwargs)
+        if names is not None:
+            # the first line of the mol block is the name
+            block = names[i] + block[block.index('\n'):]
+        props = {}
+        if mol_props:
+            props.update(
+                (key, str(value)) for key, value in
+                mol.GetPropsAsDict(False, False, False).items()
+                if key not in PropertyView._reserved)
+        if rows is not None:
+            props.update(zip(cols, rows[i]))
+        res.append(block)
+        res.append(_props_block(props, start + i + 1))
+        res.append('$$$$\n')
+    return ''.join(res)
+
+
+def _sdf_tasks(data, write_cols, index_as_name, mol_props, start, n_tasks,
+               kwargs):
+
+    """ Split a chunk of data into tasks for `_sdf_records`. """
+
+    if isinstance(data, pd.Series):
+        data = data.to_frame(name='structure')
+
+    mols = list(data.structure)
+    names = [str(name) for name in data.index] if index_as_name else None
+
+    cols = list(data.columns.drop('structure'))
+    if write_cols and cols:
+        rows = data[cols].astype(str).values.tolist()
+    else:
+        cols, rows = None, None
+
+    size = max(1, -(-len(mols) // n_tasks))
+    return [(mols[i:i + size],
+             None if names is None else names[i:i + size],
+             cols,
+             None if rows is None else rows[i:i + size],
+             mol_props, start + i, kwargs)
+            for i in range(0, len(mols), size)]
+
+
 def write_sdf(data, sdf, write_cols=True, index_as_name=True, mol_props=False,
               *args, **kwargs):
 
     """ Write an sdf file from a dataframe.
 
+    The records are formatted in chunks, in parallel if requested, and
+    written through a buffered (and optionally compressed) stream.  The
+    molecules themselves are not modified.
+
     Args:
-        data (pandas.Series or pandas.DataFrame):
+        data (pandas.Series or pandas.DataFrame or iterable):
             Pandas data structure with a `structure` column containing
-            compounds to serialize.
+            compounds to serialize, or an iterable of these (such as chunks
+            from a reader), to be written one after the other.
         sdf (str or file-like):
             A file path or file-like object specifying where to write the
             compound data.
@@ -152,35 +222,64 @@ def write_sdf(data, sdf, write_cols=True, index_as_name=True, mol_props=False,
         mol_props (bool):
             Whether to write properties in the Mol dictionary in addition to
             fields in the frame.
-
-    Warn:
-        This function will change the names of the compounds if the
-        `index_as_name` argument is `True`, and will delete all properties in
-        the molecule dictionary if `mol_props` is `False`.
+        n_jobs (int):
+            The number of processes to format the records in.  If -1, use as
+            many as there are cpus.  Keyword only.
+        compression (str):
+            The compression to use if a path is given, one of 'gzip', 'bz2',
+            'xz', 'zstd' or `None`.  If 'infer', infer from the extension.
+            Keyword only.
+        args, kwargs:
+            Other keyword arguments are passed to `rdkit.Chem.MolToMolBlock`,
+            such as `forceV3000`.  Previously, arguments were passed to
+            `rdkit.Chem.SDWriter`, which takes none beyond the file, so
+            positional arguments still raise a `TypeError`.
     """
-    if isinstance(data, pd.Series):
-        data = data.to_frame(name='structure')
-
-    names = [m.name for m in data.structure]
-
-    writer = Chem.SDWriter(sdf, *args, **kwargs)
-
-    cols = list(data.columns.drop('structure'))
-
-    if not mol_props:
-        data.apply(_drop_props, axis=1)
-
-    if write_cols:
-        data.apply(_set_props, cols=cols, axis=1)
-
-    if index_as_name:
-        data.apply(_set_name, axis=1)
-
-    data.structure.apply(writer.write)
 
-    # rdkit writer changes names sometimes
-    for mol, name in zip(data.structure, names):
-        mol.name = name
+    if args:
+        raise TypeError('write_sdf takes at most 5 positional arguments, but '
+                        '{} were given.'.format(5 + len(args)))
+    n_jobs = kwargs.pop('n_jobs', 1)
+    compression = kwargs.pop('compression', 'infer')
+
+    if isinstance(data, (pd.Series, pd.DataFrame)):
+        data = [data]
+
+    n_jobs = multiprocessing.cpu_count() if n_jobs == -1 else n_jobs
+    n_tasks = 4 * n_jobs if n_jobs > 1 else 1
+
+    f = open_file(sdf, 'wt', compression) if isinstance(sdf, str) else sdf
+    if isinstance(f, io.TextIOBase):
+        write = f.write
+    else:
+        def write(text):
+            f.write(text.encode('utf-8'))
+
+    pool = multiprocessing.Pool(n_jobs) if n_jobs > 1 else None
+    try:
+        start = 0
+        pending = None
+        for chunk in data:
+            tasks = _sdf_tasks(chunk, write_cols, index_as_name, mol_props,
+                               start, n_tasks, kwargs)
+            start += len(chunk)
+            if pool is None:
+                for task in tasks:
+                    write(_sdf_records(task))
+            else:
+                # format the next chunk while writing the last
+                res = pool.map_async(_sdf_records, tasks)
+                if pending is not None:
+                    write(''.join(pending.get()))
+                pending = res
+        if pending is not None:
+            write(''.join(pending.get()))
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        if f is not sdf:
+            f.close()
 
 
 @wraps(write_sdf)
@@ -9,14 +9,20 @@
 Defining input and output operations for smiles files.
 """
 
+import os
 import warnings
 from functools import wraps
+from itertools import chain
+import multiprocessing
 
 import pandas as pd
+from rdkit import Chem
 
-from ..utils import Suppressor, squeeze
+from ..utils import Suppressor, squeeze, open_file, infer_compression
 from ..core import Mol
 
+CHUNK_SIZE = 65536
+
 
 def read_smiles(smiles_file, smiles_column=0, name_column=None, delimiter='\t',
                 title_line=False, error_bad_mol=False, warn_bad_mol=True,
@@ -29,7 +35,9 @@ def read_smiles(smiles_file, smiles_column=0, name_column=None, delimiter='\t',
     smiles_file (str, file-like):
         Location of data to load, specified as a string or passed directly as a
         file-like object.  URLs may also be used, see the pandas.read_csv
-        documentation.
+        documentation.  Compressed files (with the compression inferred from
+        the extension, or passed as `compression`) are decompressed in a
+        background thread while they are parsed.
     smiles_column (int):
         The column index at which SMILES are provided.
         Defaults to `0`.
@@ -79,9 +87,24 @@ def read_smiles(smiles_file, smiles_column=0, name_column=None, delimiter='\t',
         else:
             header = None
 
+        # decompress local files in the background while they are parsed
+        compression = kwargs.pop('compression', 'infer')
+        opened = isinstance(smiles_file, str) and \
+            os.path.isfile(smiles_file) and compression is not None and \
+            (compression != 'infer' or infer_compression(smiles_file))
+        if opened:
+            smiles_file = open_file(smiles_file, 'rb', compression,
+                                    background=True)
+            compression = None
+
         # read the smiles file
-        data = pd.read_csv(smiles_file, delimiter=delimiter, header=header,
-                           *args, **kwargs)
+        try:
+            data = pd.read_csv(smiles_file, delimiter=delimiter,
+                               header=header, compression=compression,
+                               *args, **kwargs)
+        finally:
+            if opened:
+                smiles_file.close()
 
         # replace the smiles column with the structure column
         lst = list(data.columns)
@@ -119,27 +142,101 @@ def read_smiles(smiles_file, smiles_column=0, name_column=None, delimiter='\t',
         return squeeze(data, axis=1)
 
 
-def write_smiles(data, smiles_path):
+def _smiles(mols):
 
-    """ Write a dataframe to a smiles file.
+    """ Canonical smiles for molecules, given as molecules or binaries. """
+
+    return [Chem.MolToSmiles(Chem.Mol(mol) if isinstance(mol, bytes) else mol)
+            if mol is not None else '' for mol in mols]
 
-    Args:
-        data (pd.Series or pd.DataFrame):
-            The dataframe to write.
-        smiles_path (str):
-            The path to write the dataframe to.
-    """
+
+def _smiles_rows(data, smiles):
+
+    """ The rows of a chunk to write, with the smiles first then the index.
+
+    The chunk is copied (by `reset_index`), so the data being written is not
+    modified. """
 
     if isinstance(data, pd.Series):
         data = data.to_frame(name='structure')
-    data = data.copy()
-    data['structure'] = data.structure.apply(lambda m: m.to_smiles())
     data = data.reset_index()
+    data['structure'] = smiles
     cols = list(data.columns)
     cols.insert(0, cols.pop(cols.index('structure')))
-    data = data.reindex(columns=cols)[cols]
-    data.to_csv(smiles_path, sep='\t', header=None, index=None)
-    del data
+    return data[cols]
+
+
+def _chunks(data, chunk_size):
+
+    """ Iterate over chunks of a pandas object or an iterable of them. """
+
+    if isinstance(data, (pd.Series, pd.DataFrame)):
+        data = [data]
+    for frame in data:
+        for i in range(0, len(frame), chunk_size):
+            yield frame.iloc[i:i + chunk_size]
+
+
+def write_smiles(data, smiles_path, n_jobs=1, chunk_size=CHUNK_SIZE,
+                 compression='infer'):
+
+    """ Write a dataframe to a smiles file.
+
+    The smiles are generated in chunks, in parallel if requested, and each
+    chunk is written as soon as it is ready.
+
+    Args:
+        data (pd.Series or pd.DataFrame or iterable):
+            The dataframe to write, or an iterable of these (such as chunks
+            from a reader), to be written one after the other.
+        smiles_path (str or file-like):
+            The path or file-like object to write the dataframe to.
+        n_jobs (int):
+            The number of processes to generate the smiles in.  If -1, use as
+            many as there are cpus.
+        chunk_size (int):
+            The number of molecules to process at once.
+        compression (str):
+            The compression to use if a path is given, one of 'gzip', 'bz2',
+            'xz', 'zstd' or `None`.  If 'infer', infer from the extension.
+    """
+
+    n_jobs = multiprocessing.cpu_count() if n_jobs == -1 else n_jobs
+
+    if isinstance(smiles_path, str):
+        f = open_file(smiles_path, 'wt', compression)
+    else:
+        f = smiles_path
+
+    def write(chunk, smiles):
+        _smiles_rows(chunk, smiles).to_csv(f, sep='\t', header=False,
+                                           index=False)
+
+    pool = multiprocessing.Pool(n_jobs) if n_jobs > 1 else None
+    try:
+        pending = None
+        for chunk in _chunks(data, chunk_size):
+            mols = chunk if isinstance(chunk, pd.Series) else chunk.structure
+            if pool is None:
+                write(chunk, _smiles(mols))
+                continue
+            # molecules are sent to the workers without their properties
+            mols = [None if mol is None else mol.ToBinary() for mol in mols]
+            size = max(1, -(-len(mols) // (4 * n_jobs)))
+            res = pool.map_async(_smiles, [mols[i:i + size] for i in
+                                           range(0, len(mols), size)])
+            # generate the smiles of the next chunk while writing the last
+            if pending is not None:
+                write(pending[0], list(chain(*pending[1].get())))
+            pending = chunk, res
+        if pending is not None:
+            write(pending[0], list(chain(*pending[1].get())))
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        if f is not smiles_path:
+            f.close()
 
 
 @classmethod
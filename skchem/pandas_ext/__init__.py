@@ -8,3 +8,6 @@
 Tools for better integration with pandas."""
 
 from .structure_methods import StructureMethods
+from .dedup import (canonical_keys, group_ids, first_occurrences,
+                    merge_duplicates)
+from .batch import map_chunks, map_mols
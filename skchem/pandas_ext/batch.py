@@ -0,0 +1,164 @@
+#! /usr/bin/env python
+#
+# Copyright (C) 2016 Rich Lewis <rl403@cam.ac.uk>
+# License: 3-clause BSD
+
+""" # skchem.pandas_ext.batch
+
+Applying per molecule operations to collections of molecules in chunks,
+optionally in parallel.
+
+Molecules are sent to worker processes in their binary serialization (see
+`skchem.Mol.to_binary`), a chunk at a time, so that the overhead of
+parallelism is paid per chunk rather than per molecule.
+"""
+
+from functools import partial
+from itertools import islice
+import multiprocessing
+import logging
+
+import pandas as pd
+
+LOGGER = logging.getLogger(__name__)
+
+CHUNK_SIZE = 65536
+
+
+def _split(chunk, n):
+
+    """ Split a chunk into *n* roughly equal parts. """
+
+    size = -(-len(chunk) // n)
+    return [chunk[i:i + size] for i in range(0, len(chunk), size)]
+
+
+def map_chunks(func, mols, n_jobs=1, chunk_size=CHUNK_SIZE):
+
+    """ Apply a function of lists of molecules to molecules in chunks.
+
+    Args:
+        func (callable):
+            A picklable function taking a list of molecules, and returning a
+            list of results of the same length.
+        mols (pd.Series or iterable<skchem.Mol>):
+            The molecules.  Iterables (such as generators reading a file) are
+            consumed in chunks, so that only one chunk of molecules need be
+            held in memory at once.
+        n_jobs (int):
+            The number of processes to apply the function in.  If -1, use as
+            many as there are cpus.
+        chunk_size (int):
+            The number of molecules to process at once.
+
+    Returns:
+        list:
+            The results for each molecule.
+    """
+
+    n_jobs = multiprocessing.cpu_count() if n_jobs == -1 else n_jobs
+
+    mols = iter(mols)
+    res = []
+    pool = multiprocessing.Pool(processes=n_jobs) if n_jobs > 1 else None
+    try:
+        while True:
+            chunk = list(islice(mols, chunk_size))
+            if not chunk:
+                break
+            if pool is None:
+                res.extend(func(chunk))
+            else:
+                for part in pool.map(func, _split(chunk, 4 * n_jobs)):
+                    res.extend(part)
+            LOGGER.debug('Processed %s molecules', len(res))
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    return res
+
+
+def _apply(func, kwargs, mols):
+
+    """ Apply a function of a molecule to a list of molecules. """
+
+    return [func(mol, **kwargs) for mol in mols]
+
+
+def map_mols(mols, func, n_jobs=1, chunk_size=CHUNK_SIZE, name=None,
+             dtype=None, **kwargs):
+
+    """ Apply a function of a molecule to molecules in chunks.
+
+    Args:
+        mols (pd.Series or iterable<skchem.Mol>):
+            The molecules.
+        func (callable):
+            A picklable function of a molecule.
+        n_jobs (int):
+            The number of processes to apply the function in.  If -1, use as
+            many as there are cpus.
+        chunk_size (int):
+            The number of molecules to process at once.
+        name (str):
+            The name of the resulting series.
+        dtype (np.dtype):
+            The dtype of the resulting series.  If `None`, it is inferred.
+        kwargs:
+            Arguments passed to the function.
+
+    Returns:
+        pd.Series:
+            The results, with the index of the molecules if they were a
+            series.
+
+    Examples:
+        >>> import skchem
+        >>> ms = pd.Series([skchem.Mol.from_smiles(smi) for smi in
+        ...                 ('OCC', 'c1ccccc1')], index=['a', 'b'])
+        >>> map_mols(ms, n_atoms, name='n_atoms')
+        a    3
+        b    6
+        Name: n_atoms, dtype: int64
+    """
+
+    index = mols.index if isinstance(mols, pd.Series) else None
+    res = map_chunks(partial(_apply, func, kwargs), mols, n_jobs=n_jobs,
+                     chunk_size=chunk_size)
+    return pd.Series(res, index=index, name=name, dtype=dtype)
+
+
+def to_smiles(mol, **kwargs):
+    """ The SMILES of a molecule. """
+    return mol.to_smiles(**kwargs)
+
+
+def to_inchi_key(mol):
+    """ The InChI key of a molecule. """
+    return mol.to_inchi_key()
+
+
+def to_formula(mol):
+    """ The formula of a molecule. """
+    return mol.to_formula()
+
+
+def mass(mol):
+    """ The exact mass of a molecule. """
+    return mol.mass
+
+
+def n_atoms(mol, heavy_only=False):
+    """ The number of atoms in a molecule, optionally only heavy atoms. """
+    return mol.GetNumHeavyAtoms() if heavy_only else mol.GetNumAtoms()
+
+
+def add_hs(mol, **kwargs):
+    """ A molecule with hydrogens added. """
+    return mol.add_hs(**kwargs)
+
+
+def remove_hs(mol, **kwargs):
+    """ A molecule with hydrogens removed. """
+    return mol.remove_hs(**kwargs)
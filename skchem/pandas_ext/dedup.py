@@ -0,0 +1,224 @@
+#! /usr/bin/env python
+#
+# Copyright (C) 2016 Rich Lewis <rl403@cam.ac.uk>
+# License: 3-clause BSD
+
+""" # skchem.pandas_ext.dedup
+
+Deduplication of collections of molecules by canonical identity.
+
+Canonical keys (by default InChI keys) are calculated in chunks, optionally
+in parallel, and then hashed into integer group IDs, numbered in order of
+first occurrence.  Molecules for which no key could be calculated are never
+considered duplicates.
+"""
+
+from functools import partial
+
+import numpy as np
+import pandas as pd
+from rdkit import Chem
+
+from ..utils import Defaults, Suppressor
+from .batch import CHUNK_SIZE, map_chunks
+
+
+def inchi_key(mol):
+    """ The InChI key of a molecule. """
+    return Chem.MolToInchiKey(mol)
+
+
+def smiles(mol):
+    """ The canonical SMILES of a molecule. """
+    return Chem.MolToSmiles(mol)
+
+
+KEYS = Defaults(defaults={
+    'inchi_key': inchi_key,
+    'smiles': smiles
+})
+
+
+def _keys(func, mols):
+
+    """ Calculate the keys of a chunk of molecules, `None` for those that
+    cannot be calculated. """
+
+    res = []
+    with Suppressor():
+        for mol in mols:
+            try:
+                key = func(mol)
+            except Exception:  # pylint: disable=broad-except
+                key = None
+            res.append(key if key else None)
+    return res
+
+
+def canonical_keys(mols, key='inchi_key', n_jobs=1, chunk_size=CHUNK_SIZE):
+
+    """ Calculate canonical keys for molecules.
+
+    Args:
+        mols (pd.Series or iterable<skchem.Mol>):
+            The molecules.  Iterables (such as generators reading a file) are
+            consumed in chunks, so that only one chunk of molecules need be
+            held in memory at once.
+        key (str or callable):
+            The key to use, either 'inchi_key', 'smiles', or a picklable
+            function of a molecule returning a hashable key.
+        n_jobs (int):
+            The number of processes to calculate the keys in.  If -1, use as
+            many as there are cpus.
+        chunk_size (int):
+            The number of molecules to process at once.
+
+    Returns:
+        pd.Series:
+            The keys, `None` where they could not be calculated.
+
+    Examples:
+        >>> import skchem
+        >>> ms = pd.Series([skchem.Mol.from_smiles(smi) for smi in
+        ...                 ('OCC', 'CCO', 'c1ccccc1')])
+        >>> canonical_keys(ms, key='smiles')
+        0        CCO
+        1        CCO
+        2   c1ccccc1
+        Name: smiles, dtype: object
+    """
+
+    index = mols.index if isinstance(mols, pd.Series) else None
+    name = key if isinstance(key, str) else getattr(key, '__name__', None)
+    keys = map_chunks(partial(_keys, KEYS.get(key)), mols, n_jobs=n_jobs,
+                      chunk_size=chunk_size)
+    return pd.Series(keys, index=index, name=name, dtype=object)
+
+
+def factorize(keys):
+
+    """ Hash keys into integer group IDs, in order of first occurrence.
+
+    Args:
+        keys (pd.Series):
+            The keys.  Missing keys are each given their own group.
+
+    Returns:
+        pd.Series:
+            The group IDs.
+
+    Examples:
+        >>> factorize(pd.Series(['a', 'b', None, 'a', None]))
+        0    0
+        1    1
+        2    2
+        3    0
+        4    3
+        Name: group, dtype: int64
+    """
+
+    values = keys.values.astype(object)
+    # missing keys are given unique sentinels, so they are never equal
+    for i in np.flatnonzero(pd.isnull(values)):
+        values[i] = object()
+    codes, _ = pd.factorize(values)
+    return pd.Series(codes.astype(np.int64), index=keys.index, name='group')
+
+
+def group_ids(mols, key='inchi_key', n_jobs=1, chunk_size=CHUNK_SIZE):
+
+    """ Group IDs of molecules by canonical identity.
+
+    Args:
+        mols (pd.Series or iterable<skchem.Mol>):
+            The molecules.
+        key (str or callable):
+            The key to use, see `canonical_keys`.
+        n_jobs (int):
+            The number of processes to calculate the keys in.
+        chunk_size (int):
+            The number of molecules to process at once.
+
+    Returns:
+        pd.Series:
+            The group IDs, in order of first occurrence.
+    """
+
+    return factorize(canonical_keys(mols, key=key, n_jobs=n_jobs,
+                                    chunk_size=chunk_size))
+
+
+def first_occurrences(mols, key='inchi_key', n_jobs=1,
+                      chunk_size=CHUNK_SIZE):
+
+    """ Mask of the first occurrence of each molecule.
+
+    Args:
+        mols (pd.Series or iterable<skchem.Mol>):
+            The molecules.
+        key (str or callable):
+            The key to use, see `canonical_keys`.
+        n_jobs (int):
+            The number of processes to calculate the keys in.
+        chunk_size (int):
+            The number of molecules to process at once.
+
+    Returns:
+        pd.Series:
+            Boolean mask, `True` for the first occurrence of each molecule.
+    """
+
+    ids = group_ids(mols, key=key, n_jobs=n_jobs, chunk_size=chunk_size)
+    return ~ids.duplicated().rename(None)
+
+
+def merge_duplicates(data, structure='structure', agg='first',
+                     key='inchi_key', n_jobs=1, chunk_size=CHUNK_SIZE):
+
+    """ Merge the records of duplicate molecules.
+
+    Args:
+        data (pd.DataFrame):
+            The records, with a column of molecules.
+        structure (str):
+            The name of the column of molecules.
+        agg (str or callable or dict):
+            How to aggregate the other columns over duplicates, as accepted by
+            `pd.core.groupby.GroupBy.agg`.
+        key (str or callable):
+            The key to use, see `canonical_keys`.
+        n_jobs (int):
+            The number of processes to calculate the keys in.
+        chunk_size (int):
+            The number of molecules to process at once.
+
+    Returns:
+        pd.DataFrame:
+            One record for each molecule, indexed and ordered by the first
+            occurrence, with the molecule of the first occurrence.
+
+    Examples:
+        >>> import skchem
+        >>> df = pd.DataFrame({
+        ...     'structure': [skchem.Mol.from_smiles(smi) for smi in
+        ...                   ('OCC', 'c1ccccc1', 'CCO')],
+        ...     'activity': [1., 2., 3.]}, index=['a', 'b', 'c'])
+        >>> merge_duplicates(df, agg='mean', key='smiles').activity
+        a    2.0
+        b    2.0
+        Name: activity, dtype: float64
+    """
+
+    ids = group_ids(data[structure], key=key, n_jobs=n_jobs,
+                    chunk_size=chunk_size)
+    first = ~ids.duplicated().values
+
+    props = data.drop(structure, axis=1)
+    res = props.groupby(ids.values, sort=True).agg(agg)
+    res.index = data.index[first]
+    res.insert(0, structure, data[structure].values[first])
+    return res[data.columns]
+
+
+__all__ = ['canonical_keys', 'factorize', 'group_ids', 'first_occurrences',
+           'merge_duplicates']
@@ -7,9 +7,7 @@
 
  Tools for adding a default attribute to pandas objects."""
 
-
-from sklearn.manifold import TSNE, MDS
-from sklearn.decomposition import PCA
+import importlib
 
 import pandas as pd
 
@@ -19,11 +17,14 @@ from pandas.core.index import Index
 
 from .. import core
 from .. import features
+from . import dedup
+from . import batch
 
+# scikit-learn is only imported when a dimensionality reduction is used
 DIM_RED = {
-    'tsne': TSNE,
-    'pca': PCA,
-    'mds': MDS
+    'tsne': ('sklearn.manifold', 'TSNE'),
+    'pca': ('sklearn.decomposition', 'PCA'),
+    'mds': ('sklearn.manifold', 'MDS')
 }
 
 
@@ -34,11 +35,65 @@ class StructureMethods(NoNewAttributesMixin):
     def __init__(self, data):
         self._data = data
 
-    def add_hs(self, **kwargs):
-        return self._data.apply(lambda m: m.add_hs(**kwargs))
+    def _map(self, func, n_jobs, chunk_size, name=None, dtype=None,
+             **kwargs):
+        return batch.map_mols(self._data, func, n_jobs=n_jobs,
+                              chunk_size=chunk_size, name=name, dtype=dtype,
+                              **kwargs)
+
+    def add_hs(self, n_jobs=1, chunk_size=batch.CHUNK_SIZE, **kwargs):
+
+        """ The molecules with hydrogens added.  Arguments are passed to
+        `skchem.Mol.add_hs`. """
+
+        return self._map(batch.add_hs, n_jobs, chunk_size,
+                         name=self._data.name, dtype=object, **kwargs)
+
+    def remove_hs(self, n_jobs=1, chunk_size=batch.CHUNK_SIZE, **kwargs):
+
+        """ The molecules with hydrogens removed.  Arguments are passed to
+        `skchem.Mol.remove_hs`. """
+
+        return self._map(batch.remove_hs, n_jobs, chunk_size,
+                         name=self._data.name, dtype=object, **kwargs)
+
+    def to_smiles(self, n_jobs=1, chunk_size=batch.CHUNK_SIZE, **kwargs):
+
+        """ The SMILES of the molecules.  Arguments are passed to
+        `skchem.Mol.to_smiles`. """
+
+        return self._map(batch.to_smiles, n_jobs, chunk_size, name='smiles',
+                         dtype=object, **kwargs)
+
+    def to_inchi_key(self, n_jobs=1, chunk_size=batch.CHUNK_SIZE):
+
+        """ The InChI keys of the molecules. """
+
+        return self._map(batch.to_inchi_key, n_jobs, chunk_size,
+                         name='inchi_key', dtype=object)
+
+    def to_formula(self, n_jobs=1, chunk_size=batch.CHUNK_SIZE):
+
+        """ The formulae of the molecules. """
+
+        return self._map(batch.to_formula, n_jobs, chunk_size,
+                         name='formula', dtype=object)
+
+    def mass(self, n_jobs=1, chunk_size=batch.CHUNK_SIZE):
 
-    def remove_hs(self, **kwargs):
-        return self._data.apply(lambda m: m.remove_hs(**kwargs))
+        """ The exact masses of the molecules. """
+
+        return self._map(batch.mass, n_jobs, chunk_size, name='mass',
+                         dtype=float)
+
+    def n_atoms(self, heavy_only=False, n_jobs=1,
+                chunk_size=batch.CHUNK_SIZE):
+
+        """ The number of atoms in the molecules, optionally only counting
+        heavy atoms. """
+
+        return self._map(batch.n_atoms, n_jobs, chunk_size, name='n_atoms',
+                         dtype=int, heavy_only=heavy_only)
 
     def visualize(self, fper='morgan', dim_red='tsne', dim_red_kw=None,
                   **kwargs):
@@ -47,7 +102,8 @@ class StructureMethods(NoNewAttributesMixin):
             dim_red_kw = {}
 
         if isinstance(dim_red, str):
-            dim_red = DIM_RED.get(dim_red.lower())(**dim_red_kw)
+            mod, kls = DIM_RED[dim_red.lower()]
+            dim_red = getattr(importlib.import_module(mod), kls)(**dim_red_kw)
 
         fper = features.get(fper)
         fper.verbose = False
@@ -64,22 +120,64 @@ class StructureMethods(NoNewAttributesMixin):
     def atoms(self):
         return self._data.apply(lambda m: m.atoms)
 
+    def keys(self, key='inchi_key', n_jobs=1, chunk_size=dedup.CHUNK_SIZE):
+
+        """ Canonical keys of the molecules.  See
+        `skchem.pandas_ext.dedup.canonical_keys`. """
+
+        return dedup.canonical_keys(self._data, key=key, n_jobs=n_jobs,
+                                    chunk_size=chunk_size)
+
+    def group_ids(self, key='inchi_key', n_jobs=1,
+                  chunk_size=dedup.CHUNK_SIZE):
+
+        """ IDs grouping the molecules by canonical identity.  See
+        `skchem.pandas_ext.dedup.group_ids`. """
+
+        return dedup.group_ids(self._data, key=key, n_jobs=n_jobs,
+                               chunk_size=chunk_size)
+
+    def duplicated(self, key='inchi_key', n_jobs=1,
+                   chunk_size=dedup.CHUNK_SIZE):
+
+        """ Mask of molecules that have occurred before, by canonical
+        identity. """
+
+        return ~dedup.first_occurrences(self._data, key=key, n_jobs=n_jobs,
+                                        chunk_size=chunk_size)
+
+    def drop_duplicates(self, key='inchi_key', n_jobs=1,
+                        chunk_size=dedup.CHUNK_SIZE):
+
+        """ The first occurrence of each molecule, by canonical identity. """
+
+        return self._data[dedup.first_occurrences(
+            self._data, key=key, n_jobs=n_jobs, chunk_size=chunk_size)]
+
 
 def only_contains_mols(ser):
-    return ser.apply(lambda s: isinstance(s, core.Mol)).all()
+    return all(isinstance(s, core.Mol) for s in ser.values)
 
 
 class StructureAccessorMixin(object):
 
-    """ Mixin to bind chemical methods to objects. """
+    """ Mixin to bind chemical methods to objects.
+
+    Whether a series only contains molecules is checked on first use of the
+    accessor, and remembered for as long as the series holds the same values
+    array.  Assigning non-molecules into a series in place after using the
+    accessor is therefore not detected. """
 
     def _make_structure_accessor(self):
         if isinstance(self, Index):
             raise AttributeError('Can only use .mol accessor with molecules,'
                                  'which use np.object_ in scikit-chem.')
-        if not only_contains_mols(self):
-            raise AttributeError('Can only use .mol accessor with '
-                                 'Series that only contain mols.')
+        if self.__dict__.get('_mols_checked') is not self._values:
+            if not only_contains_mols(self):
+                raise AttributeError('Can only use .mol accessor with '
+                                     'Series that only contain mols.')
+            # bypass pandas, which may treat the name as a label
+            object.__setattr__(self, '_mols_checked', self._values)
 
         return StructureMethods(self)
     mol = AccessorProperty(StructureMethods, _make_structure_accessor)
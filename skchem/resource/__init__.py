@@ -1,6 +1,8 @@
 
 import os
-import pandas as pd
+
+from .elements import ElementTable
+from ..utils.lazy import make_lazy
 
 
 def resource(*args):
@@ -9,9 +11,18 @@ def resource(*args):
 
     return os.path.join(os.path.dirname(__file__), *args)
 
-PERIODIC_TABLE = pd.read_csv(resource('atom_data.csv'), index_col=0)
+# compiled from atom_data.csv by scripts/compile_elements.py
+ELEMENTS = ElementTable.load(resource('atom_data.npz'))
 ORGANIC = ['H', 'B', 'C', 'N', 'O', 'F', 'P', 'S', 'Cl', 'Br', 'I']
 
+
+def _read_periodic_table():
+    import pandas as pd
+    return pd.read_csv(resource('atom_data.csv'), index_col=0)
+
 __all__ = [
-    'resource', 'PERIODIC_TABLE', 'ORGANIC'
+    'resource', 'PERIODIC_TABLE', 'ELEMENTS', 'ElementTable', 'ORGANIC'
 ]
+
+# the periodic table is only read when first used
+make_lazy(__name__, {'PERIODIC_TABLE': _read_periodic_table})
@@ -0,0 +1,98 @@
+#! /usr/bin/env python
+#
+# Copyright (C) 2016 Rich Lewis <rl403@cam.ac.uk>
+# License: 3-clause BSD
+
+"""
+# skchem.resource.elements
+
+Element data held in arrays indexed by atomic number.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+
+
+class ElementTable(object):
+
+    """ Element data, as an array per column indexed by atomic number.
+
+    Looking up a value is a single array access, for one atomic number or an
+    array of them.  Position 0 (the dummy atom) is missing: `nan` for float
+    columns, `0` for integer columns and `''` for string columns.
+
+    Args:
+        columns (dict or iterable):
+            The arrays of each column, by name, or `(name, array)` pairs.
+
+    Examples:
+        >>> from skchem.resource import ELEMENTS
+        >>> ELEMENTS.symbol[[1, 6, 8]].tolist()
+        ['H', 'C', 'O']
+        >>> ELEMENTS.van_der_waals_radius[[1, 6, 8]].tolist()
+        [1.17, 1.75, 1.4]
+        >>> ELEMENTS['period'][[1, 6, 17]].tolist()
+        [1, 2, 3]
+    """
+
+    def __init__(self, columns):
+        self._data = OrderedDict(columns)
+        self.columns = list(self._data)
+        self.__dict__.update(self._data)
+
+    def __getitem__(self, column):
+        return self._data[column]
+
+    def __len__(self):
+        return len(self._data[self.columns[0]]) if self.columns else 0
+
+    @classmethod
+    def from_frame(cls, df):
+
+        """ Create a table from a DataFrame indexed by atomic number, such as
+        `skchem.resource.PERIODIC_TABLE`. """
+
+        size = df.index.max() + 1
+        columns = {}
+        for name, col in df.items():
+            if col.dtype.kind == 'f':
+                arr = np.full(size, np.nan)
+            elif col.dtype.kind in 'iu':
+                arr = np.zeros(size, dtype=col.dtype)
+            else:
+                col = col.fillna('').astype(str)
+                arr = np.full(size, '', dtype='U{}'.format(
+                    max(1, col.str.len().max())))
+            arr[df.index.values] = col.values
+            columns[name] = arr
+        return cls((name, columns[name]) for name in df.columns)
+
+    @classmethod
+    def from_csv(cls, path):
+
+        """ Create a table from a csv file with an `atomic_number` first
+        column. """
+
+        import pandas as pd
+        return cls.from_frame(pd.read_csv(path, index_col=0))
+
+    @classmethod
+    def load(cls, path):
+
+        """ Load a table saved with `save`. """
+
+        with np.load(path, allow_pickle=False) as f:
+            names = f['_columns'].tolist()
+            return cls((name, f[name]) for name in names)
+
+    def save(self, path):
+
+        """ Save the table as an uncompressed `.npz` file. """
+
+        np.savez(path, _columns=np.array(self.columns), **self._data)
+
+    def __repr__(self):
+        return '<{klass} n_elements={n} n_columns={c} at {address}>'.format(
+            klass=self.__class__.__name__, n=len(self) - 1,
+            c=len(self.columns), address=hex(id(self)))
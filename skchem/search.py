@@ -0,0 +1,352 @@
+#! /usr/bin/env python
+#
+# Copyright (C) 2016 Rich Lewis <rl403@cam.ac.uk>
+# License: 3-clause BSD
+
+"""
+# skchem.search
+
+Indexed substructure search over collections of molecules.
+
+Each molecule is given a pattern (screening) fingerprint, stored packed into
+an array of 64 bit words.  As the bits set in the fingerprint of a
+substructure are a subset of those of any molecule containing it, a query
+is first screened against all the molecules with bitwise operations, and only
+the candidates passing the screen are verified with a full substructure
+match.
+"""
+
+import binascii
+from itertools import islice
+import multiprocessing
+import logging
+
+import numpy as np
+import pandas as pd
+from rdkit import Chem, DataStructs
+
+from .core import Mol
+
+LOGGER = logging.getLogger(__name__)
+
+CHUNK_SIZE = 65536
+
+
+def pattern_fingerprint(mol, fp_size=2048):
+
+    """ The packed pattern fingerprint of a molecule.
+
+    Args:
+        mol (rdkit.Chem.Mol):
+            The molecule (or query molecule).
+        fp_size (int):
+            The number of bits of the fingerprint, a multiple of 64.
+
+    Returns:
+        np.ndarray:
+            The fingerprint, as `fp_size // 64` words.
+    """
+
+    fp = Chem.PatternFingerprint(mol, fpSize=fp_size)
+    packed = binascii.unhexlify(DataStructs.BitVectToFPSText(fp))
+    return np.frombuffer(packed, dtype=np.uint64)
+
+
+def _fingerprint_chunk(args):
+
+    """ Fingerprint and serialize a chunk of molecules. """
+
+    mols, fp_size = args
+    fps = np.empty((len(mols), fp_size // 64), dtype=np.uint64)
+    binaries = []
+    for i, mol in enumerate(mols):
+        fps[i] = pattern_fingerprint(mol, fp_size)
+        binaries.append(mol.to_binary())
+    return fps, binaries
+
+
+def _to_query(query):
+
+    """ Parse a query, given as a SMARTS string or molecule. """
+
+    return Mol.from_smarts(query) if isinstance(query, str) else query
+
+
+def _verify_chunk(args):
+
+    """ Verify the candidates of a chunk against a query. """
+
+    query, binaries = args
+    query = _to_query(query)
+    return np.array([Chem.Mol(binary).HasSubstructMatch(query)
+                     for binary in binaries], dtype=bool)
+
+
+class SubstructureIndex(object):
+
+    """ A substructure search index.
+
+    Args:
+        fingerprints (np.ndarray):
+            The packed pattern fingerprints, of shape `(n_mols, fp_size // 64)`
+            and dtype `np.uint64`.
+        binaries (np.ndarray):
+            The serialized molecules, concatenated, of dtype `np.uint8`.
+        offsets (np.ndarray):
+            The start of each serialized molecule in `binaries`, with the end
+            of the last appended.
+        index (pd.Index):
+            The index of the molecules.
+        n_jobs (int):
+            The number of processes to verify candidates in.
+
+    Examples:
+        >>> import skchem
+        >>> ms = pd.Series([skchem.Mol.from_smiles(smi) for smi in
+        ...                 ('CCO', 'c1ccccc1O', 'c1ccccc1N', 'CCN')],
+        ...                index=['a', 'b', 'c', 'd'])
+        >>> idx = skchem.search.SubstructureIndex.from_mols(ms)
+        >>> idx.search('c1ccccc1').index.tolist()
+        ['b', 'c']
+        >>> idx.search(skchem.Mol.from_smiles('CO')).index.tolist()
+        ['a', 'b']
+    """
+
+    def __init__(self, fingerprints, binaries, offsets, index=None,
+                 n_jobs=1):
+        self.fingerprints = fingerprints
+        self.binaries = binaries
+        self.offsets = np.asarray(offsets)
+        if index is None:
+            index = pd.RangeIndex(len(fingerprints))
+        self.index = index
+        self.n_jobs = multiprocessing.cpu_count() if n_jobs == -1 else n_jobs
+
+    @classmethod
+    def from_mols(cls, mols, fp_size=2048, n_jobs=1, chunk_size=CHUNK_SIZE):
+
+        """ Build an index from molecules.
+
+        Args:
+            mols (pd.Series or iterable<skchem.Mol>):
+                The molecules to index.  Iterables are consumed in chunks.
+            fp_size (int):
+                The number of bits of the fingerprints, a multiple of 64.
+            n_jobs (int):
+                The number of processes to fingerprint in, and to verify
+                candidates in.
+            chunk_size (int):
+                The number of molecules to process at once.
+
+        Returns:
+            SubstructureIndex
+        """
+
+        if fp_size % 64:
+            raise ValueError('fp_size must be a multiple of 64, not '
+                             '{}.'.format(fp_size))
+
+        index = mols.index if isinstance(mols, pd.Series) else None
+        n_procs = multiprocessing.cpu_count() if n_jobs == -1 else n_jobs
+        mols = iter(mols)
+
+        fps, binaries = [], []
+        pool = multiprocessing.Pool(n_procs) if n_procs > 1 else None
+        try:
+            while True:
+                chunk = list(islice(mols, chunk_size))
+                if not chunk:
+                    break
+                if pool is None:
+                    results = [_fingerprint_chunk((chunk, fp_size))]
+                else:
+                    size = -(-len(chunk) // (4 * n_procs))
+                    results = pool.map(_fingerprint_chunk, [
+                        (chunk[i:i + size], fp_size)
+                        for i in range(0, len(chunk), size)])
+                for chunk_fps, chunk_binaries in results:
+                    fps.append(chunk_fps)
+                    binaries.extend(chunk_binaries)
+                LOGGER.debug('Indexed %s molecules', len(binaries))
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+        fps = np.concatenate(fps) if fps else np.empty(
+            (0, fp_size // 64), dtype=np.uint64)
+        offsets = np.concatenate(([0], np.cumsum([len(b) for b in binaries])))
+        binaries = np.frombuffer(b''.join(binaries), dtype=np.uint8)
+        return cls(fps, binaries, offsets, index=index, n_jobs=n_jobs)
+
+    @property
+    def fp_size(self):
+
+        """ int: the number of bits of the fingerprints. """
+
+        return self.fingerprints.shape[1] * 64
+
+    @property
+    def nbytes(self):
+
+        """ int: the number of bytes used by the index. """
+
+        return (self.fingerprints.nbytes + self.binaries.nbytes +
+                self.offsets.nbytes)
+
+    def __len__(self):
+        return len(self.fingerprints)
+
+    def _binary(self, i):
+        return self.binaries[self.offsets[i]:self.offsets[i + 1]].tobytes()
+
+    def mol(self, i):
+
+        """ Get the molecule at a position in the index.
+
+        Args:
+            i (int):
+                The position of the molecule.
+
+        Returns:
+            skchem.Mol
+        """
+
+        return Mol.from_binary(self._binary(i))
+
+    def screen(self, query, chunk_size=CHUNK_SIZE):
+
+        """ Screen the molecules for those that may contain a query.
+
+        Args:
+            query (str or skchem.Mol):
+                The query, as a SMARTS string or molecule.
+            chunk_size (int):
+                The number of fingerprints to screen at once.
+
+        Returns:
+            np.ndarray:
+                The positions of the candidates in the index.
+        """
+
+        query = pattern_fingerprint(_to_query(query), self.fp_size)
+        # only the words set in the query need be compared
+        words = np.flatnonzero(query)
+        query = query[words]
+        res = []
+        for start in range(0, len(self), chunk_size):
+            block = self.fingerprints[start:start + chunk_size, words]
+            mask = ((block & query) == query).all(axis=1)
+            res.append(np.flatnonzero(mask) + start)
+        return np.concatenate(res) if res else np.empty(0, dtype=int)
+
+    def verify(self, query, candidates):
+
+        """ Verify which candidates contain a query with a full substructure
+        match.
+
+        Args:
+            query (str or skchem.Mol):
+                The query, as a SMARTS string or molecule.
+            candidates (np.ndarray):
+                The positions of the candidates in the index.
+
+        Returns:
+            np.ndarray:
+                The positions of the candidates containing the query.
+        """
+
+        candidates = np.asarray(candidates, dtype=int)
+        # SMARTS strings are sent to the workers as they are, molecules
+        # serialized
+        query_arg = query if isinstance(query, str) else query.ToBinary()
+        binaries = [self._binary(i) for i in candidates]
+
+        if self.n_jobs > 1 and len(candidates) > 1:
+            size = -(-len(candidates) // (4 * self.n_jobs))
+            chunks = [(query_arg, binaries[i:i + size])
+                      for i in range(0, len(binaries), size)]
+            with multiprocessing.Pool(self.n_jobs) as pool:
+                mask = np.concatenate(pool.map(_verify_chunk, chunks))
+        else:
+            mask = _verify_chunk((_to_query(query), binaries))
+        return candidates[mask] if len(candidates) else candidates
+
+    def search(self, query):
+
+        """ Find the molecules containing a query.
+
+        Args:
+            query (str or skchem.Mol):
+                The query, as a SMARTS string or molecule.
+
+        Returns:
+            pd.Series:
+                The molecules containing the query.
+        """
+
+        candidates = self.screen(query)
+        LOGGER.debug('%s of %s molecules passed the screen', len(candidates),
+                     len(self))
+
+        if self.n_jobs > 1:
+            hits = self.verify(query, candidates)
+            mols = [self.mol(i) for i in hits]
+        else:
+            # decode each candidate only once
+            query = _to_query(query)
+            hits, mols = [], []
+            for i in candidates:
+                mol = self.mol(i)
+                if mol.HasSubstructMatch(query):
+                    hits.append(i)
+                    mols.append(mol)
+        return pd.Series(mols, index=self.index[hits], name='structure')
+
+    def save(self, path):
+
+        """ Save the index to an `.npz` file.
+
+        Object (e.g. string) indices are saved as strings.
+
+        Args:
+            path (str):
+                The path of the file.
+        """
+
+        # object indices are saved as strings, so they may be loaded without
+        # unpickling
+        index = np.asarray(self.index)
+        if index.dtype == object:
+            index = index.astype(str)
+        np.savez(path, fingerprints=self.fingerprints, binaries=self.binaries,
+                 offsets=self.offsets, index=index,
+                 index_name=np.array(self.index.name or ''))
+
+    @classmethod
+    def load(cls, path, n_jobs=1):
+
+        """ Load an index saved with `save`.
+
+        Args:
+            path (str):
+                The path of the file.
+            n_jobs (int):
+                The number of processes to verify candidates in.
+
+        Returns:
+            SubstructureIndex
+        """
+
+        with np.load(path) as f:
+            index = pd.Index(f['index'], name=str(f['index_name']) or None)
+            return cls(f['fingerprints'], f['binaries'], f['offsets'],
+                       index=index, n_jobs=n_jobs)
+
+    def __repr__(self):
+        return '<{klass} n={n} fp_size={fp_size} at {address}>'.format(
+            klass=self.__class__.__name__, n=len(self), fp_size=self.fp_size,
+            address=hex(id(self)))
+
+
+__all__ = ['SubstructureIndex', 'pattern_fingerprint']
@@ -0,0 +1,170 @@
+#! /usr/bin/env python
+#
+# Copyright (C) 2016 Rich Lewis <rl403@cam.ac.uk>
+# License: 3-clause BSD
+
+"""
+# skchem.test.test_base
+
+Tests for the base transformer classes.
+"""
+
+import os
+
+import pytest
+import pandas as pd
+
+from ..base import CLIWrapper, BatchTransformer, Transformer
+from ..core import Mol
+from .. import io
+
+
+class CatWrapper(CLIWrapper, BatchTransformer, Transformer):
+
+    """ Wrap `cat`, which returns the molecules it is given. """
+
+    def __init__(self, **kwargs):
+        super(CatWrapper, self).__init__(**kwargs)
+
+    @property
+    def columns(self):
+        return pd.Index(['structure'])
+
+    @staticmethod
+    def validate_install():
+        return True
+
+    def _cli_args(self, infile, outfile):
+        return ['sh', '-c', 'cat {} > {}'.format(infile, outfile)]
+
+    def monitor_progress(self, filename):
+        return 0
+
+    def _parse_outfile(self, outfile):
+        return io.read_sdf(outfile, read_props=False)
+
+    def _parse_errors(self, errs):
+        return []
+
+
+posix_only = pytest.mark.skipif(not hasattr(os, 'mkfifo'),
+                                reason='named pipes not available.')
+
+
+@pytest.fixture(name='ser')
+def series():
+    return pd.Series([Mol.from_smiles('C' * (i % 5 + 1)) for i in range(50)],
+                     index=['mol{}'.format(i) for i in range(50)])
+
+
+@posix_only
+@pytest.mark.parametrize('streaming', [False, True])
+def test_cli_wrapper(ser, streaming):
+    res = CatWrapper(streaming=streaming, verbose=False).transform(ser)
+    assert len(res) == len(ser)
+    assert res.index.equals(ser.index)
+    assert [m.to_smiles() for m in res] == [m.to_smiles() for m in ser]
+
+
+@posix_only
+def test_streaming_does_not_modify_input(ser):
+    names = [m.name for m in ser]
+    CatWrapper(streaming=True, verbose=False).transform(ser)
+    assert [m.name for m in ser] == names
+
+
+class MissingToolWrapper(CatWrapper):
+
+    """ Wrap a tool that is not installed. """
+
+    def _cli_args(self, infile, outfile):
+        return ['skchem-missing-tool', infile, outfile]
+
+
+@posix_only
+@pytest.mark.skipif(not os.path.isdir('/proc/self/fd'),
+                    reason='open file descriptors cannot be listed.')
+def test_streaming_missing_tool_closes_pipes(ser):
+    before = len(os.listdir('/proc/self/fd'))
+    with pytest.raises(OSError) as excinfo:
+        MissingToolWrapper(streaming=True, verbose=False).transform(ser)
+    # closed explicitly, rather than when the traceback is collected
+    assert excinfo.tb is not None
+    assert len(os.listdir('/proc/self/fd')) == before
+
+
+class IgnoringWrapper(CatWrapper):
+
+    """ Wrap a tool that exits without reading its input. """
+
+    def _cli_args(self, infile, outfile):
+        return ['sh', '-c', 'echo failed >&2; : > {}'.format(outfile)]
+
+
+@posix_only
+def test_streaming_tool_ignores_input():
+    # more than fills the input pipe, so the writer blocks until stopped
+    ser = pd.Series([Mol.from_smiles('C' * 10)] * 1000)
+    res, errs = IgnoringWrapper(streaming=True,
+                                verbose=False)._run_streaming(ser)
+    assert len(res) == 0
+    assert errs == 'failed\n'
+
+
+class CountingTransformer(BatchTransformer, Transformer):
+
+    """ Return the number of atoms, recording the size of each batch. """
+
+    def __init__(self, verbose=False):
+        super(CountingTransformer, self).__init__(verbose=verbose)
+        self.batches = []
+
+    @property
+    def columns(self):
+        return pd.Index(['n_atoms'])
+
+    def _transform_series(self, ser):
+        self.batches.append(len(ser))
+        return [len(m.atoms) for m in ser]
+
+
+def test_coalescer_threads(ser):
+    from concurrent.futures import ThreadPoolExecutor
+
+    t = CountingTransformer()
+    with t.coalescer(batch_size=16, timeout=0.1) as coalescer:
+        with ThreadPoolExecutor(8) as executor:
+            res = list(executor.map(coalescer.transform, ser))
+
+    assert res == [len(m.atoms) for m in ser]
+    assert sum(t.batches) == len(ser)
+    assert len(t.batches) < len(ser)
+    assert max(t.batches) <= 16
+
+
+def test_coalescer_asyncio(ser):
+    import asyncio
+
+    t = CountingTransformer()
+    coalescer = t.coalescer(batch_size=len(ser), timeout=0.5)
+    loop = asyncio.new_event_loop()
+    try:
+        futures = [coalescer.atransform(m, loop=loop) for m in ser]
+        res = loop.run_until_complete(asyncio.gather(*futures))
+    finally:
+        loop.close()
+        coalescer.close()
+
+    assert list(res) == [len(m.atoms) for m in ser]
+    assert t.batches == [len(ser)]
+
+
+def test_coalescer_error():
+
+    class Failing(CountingTransformer):
+        def _transform_series(self, ser):
+            raise ValueError('failed')
+
+    with Failing().coalescer() as coalescer:
+        with pytest.raises(ValueError):
+            coalescer.transform(Mol.from_smiles('C'))
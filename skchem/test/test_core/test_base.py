@@ -5,6 +5,7 @@
 
 import pytest
 import numpy as np
+import pandas as pd
 from ...core import Mol, Atom
 
 @pytest.fixture
@@ -150,3 +151,55 @@ def test_av_len(ma):
 def test_av_del(ma):
     del ma.atoms.props['test']
     assert len(ma.atoms.props) == 0
+
+
+def test_extract_props(ma):
+    from ...core.base import extract_props
+    ma.atoms[0].props['num'] = 1
+    ma.atoms[1].props['num'] = 2.5
+    res = extract_props(ma.atoms, clear=True)
+    assert list(res.columns) == ['test', 'num']
+    assert res.num.dtype == 'float64'
+    assert res.test.tolist() == ['spam', 'eggs']
+    assert len(ma.atoms.props.keys()) == 0
+
+
+def test_av_set_typed(m):
+    m.atoms.props['shift'] = np.array([1.5, 2.5])
+    m.atoms.props['n'] = [1, 2]
+    assert m.atoms.props['shift'].dtype == np.float64
+    assert m.atoms.props['n'].dtype == np.int64
+    assert m.atoms[1].props['shift'] == 2.5
+    assert list(m.atoms.props.to_frame().columns) == ['shift', 'n']
+
+
+def test_av_set_dict(m):
+    m.atoms.props['test'] = {1: 'eggs'}
+    assert m.atoms.props['test'].tolist() == [None, 'eggs']
+    assert m.atoms.props.get('test', 'spam').tolist() == ['spam', 'eggs']
+
+
+def test_av_set_series(m):
+    m.atoms.props['shift'] = pd.Series([2.5], index=[1])
+    assert m.atoms.props.get('shift').tolist()[1] == 2.5
+    assert m.atoms[1].props['shift'] == 2.5
+    assert not m.atoms[0].props.keys()
+
+
+def test_av_set_warns_once(m):
+    with pytest.warns(UserWarning) as record:
+        m.atoms.props[4] = ['spam', 1.5]
+    assert len(record) == 1
+    assert m.atoms.props['4'].tolist() == ['spam', '1.5']
+
+
+def test_av_set_private_warns(m):
+    with pytest.warns(UserWarning):
+        m.atoms.props['_test'] = [1, 2]
+
+
+def test_bv_props(m):
+    m.bonds.props['test'] = ['single']
+    assert m.bonds.props.to_dict() == {'test': ['single']}
+    del m.bonds.props['test']
+    assert len(m.bonds.props) == 0
@@ -204,3 +204,21 @@ def test_positions(m):
 
 def test_is_3d(m):
     assert np.array_equal(m.conformers.is_3d, [False] + [True] * 10)
+
+
+def test_set_view_positions(m):
+    pos = np.random.randn(len(m.conformers), len(m.atoms), 3)
+    m.conformers.positions = pos
+    assert np.allclose(m.conformers.positions, pos)
+
+
+def test_view_canonicalize(m):
+    expected = Mol(m)
+    for conf in expected.conformers:
+        conf.canonicalize()
+    m.conformers.canonicalize()
+    # principal axes are only defined up to sign
+    assert np.allclose(np.abs(m.conformers.positions),
+                       np.abs(expected.conformers.positions))
+    for conf in m.conformers:
+        assert np.allclose(conf.centre_of_mass, (0, 0, 0))
@@ -5,6 +5,7 @@
 
 import pytest
 import json
+import pickle
 
 from ...core import Mol
 
@@ -142,6 +143,67 @@ def test_copy(m):
     assert m_copy == m
 
 
+def test_copy_independent(m_f):
+    from rdkit.Chem.AllChem import EmbedMolecule
+    EmbedMolecule(m_f)
+    m_f.name = 'ethane'
+    m_f.props['key'] = 'value'
+    m_copy = m_f.copy()
+    assert m_copy.name == 'ethane'
+    assert m_copy.props['key'] == 'value'
+    assert len(m_copy.conformers) == 1
+    assert m_copy.atoms.owner is m_copy
+    m_copy.props['key'] = 'other'
+    m_copy.RemoveAllConformers()
+    assert m_f.props['key'] == 'value'
+    assert len(m_f.conformers) == 1
+
+
+def test_copy_cache(m):
+    m.cache = {'n_atoms': {(): 2}}
+    assert not hasattr(m.copy(), 'cache')
+    m_copy = m.copy(cache=True)
+    assert m_copy.cache == m.cache
+    m_copy.cache['n_atoms'][()] = 3
+    assert m.cache['n_atoms'][()] == 2
+
+
+def test_pickle(m_f):
+    from rdkit.Chem.AllChem import EmbedMolecule
+    EmbedMolecule(m_f)
+    m_f.name = 'ethane'
+    m_f.props['key'] = 'value'
+    m_f.atoms[0].props['label'] = 'alpha'
+    m_f.bonds[0].props['order'] = 'single'
+    m_f.atoms.props  # pylint: disable=pointless-statement
+    res = pickle.loads(pickle.dumps(m_f))
+    assert isinstance(res, Mol)
+    assert res == m_f
+    assert res.name == 'ethane'
+    assert res.props['key'] == 'value'
+    assert res.atoms[0].props['label'] == 'alpha'
+    assert res.bonds[0].props['order'] == 'single'
+    assert len(res.conformers) == 1
+    assert res.atoms.owner is res
+
+
+def test_pickle_drops_cache(m):
+    m.cache = {'n_atoms': {(): 2}}
+    m._h_enriched = m.add_hs()
+    m.custom = 'kept'
+    res = pickle.loads(pickle.dumps(m))
+    assert not hasattr(res, 'cache')
+    assert not hasattr(res, '_h_enriched')
+    assert res.custom == 'kept'
+    assert m.cache == {'n_atoms': {(): 2}}
+
+
+def test_to_binary_props(m):
+    m.name = 'ethane'
+    assert Mol.from_binary(m.to_binary()).name == 'ethane'
+    assert Mol.from_binary(m.to_binary(props=False)).name is None
+
+
 def test_contains_miss(m):
     with pytest.raises(NotImplementedError):
         'test' in m
@@ -0,0 +1,101 @@
+#! /usr/bin/env python
+#
+# Copyright (C) 2016 Rich Lewis <rl403@cam.ac.uk>
+# License: 3-clause BSD
+
+""" Tests for converting datasets. """
+
+from collections import OrderedDict
+
+import pytest
+import numpy as np
+import pandas as pd
+
+h5py = pytest.importorskip('h5py')
+pytest.importorskip('fuel')
+
+from ...data.converters import base  # noqa: E402
+from ...core import Mol  # noqa: E402
+from ... import features  # noqa: E402
+
+SMILES = ['CCO', 'c1ccccc1', 'CC(=O)O', 'CN', 'OCC(O)CO']
+
+FEATURES = {
+    '2d': base.Feature(fper=features.MorganFeaturizer(n_feats=64),
+                       key='X_morg', axis_names=['batch', 'features']),
+    '3d': base.Feature(fper=features.GraphDistanceTransformer(),
+                       key='G', axis_names=['batch', 'atom_idx', 'atom_idx'])
+}
+
+
+@pytest.fixture
+def ms():
+    return pd.Series([Mol.from_smiles(smi) for smi in SMILES],
+                     index=pd.Index(SMILES, name='smiles'), name='structure')
+
+
+def save_features(path, ms, feats, chunk_size=None, codec='gzip-1'):
+
+    """ Save features with a converter, returning them as read back. """
+
+    conv = base.Converter.__new__(base.Converter)
+    conv.output_path = path
+    conv.pytables_kws = base.DEFAULT_PYTABLES_KW
+    conv.chunk_size = chunk_size
+    conv.codec = codec
+    conv.batch_size = 2
+    conv.features = feats
+    with conv.create_file(path):
+        conv.save_features(ms)
+    with h5py.File(path, 'r') as f:
+        return {feat.key: f[feat.key][()] for feat in feats}
+
+
+@pytest.mark.parametrize('codec', ['gzip-1', 'lzf', None])
+def test_chunked(tmpdir, ms, codec):
+    feat = FEATURES['2d']
+    res = save_features(str(tmpdir.join('chunked.h5')), ms, [feat],
+                        chunk_size=2, codec=codec)[feat.key]
+    assert res.shape == (len(ms), 64)
+    assert (res == feat.fper.transform(ms).values).all()
+
+
+@pytest.mark.parametrize('ndim', ['2d', '3d'])
+def test_chunked_matches_in_memory(tmpdir, ms, ndim):
+    pytest.importorskip('tables')
+    feat = FEATURES[ndim]
+    chunked = save_features(str(tmpdir.join('chunked.h5')), ms, [feat],
+                            chunk_size=2)[feat.key]
+    in_memory = save_features(str(tmpdir.join('memory.h5')), ms,
+                              [feat])[feat.key]
+    assert chunked.shape == in_memory.shape
+    np.testing.assert_array_equal(chunked, in_memory)
+
+
+def test_chunked_dropped_rows(tmpdir, ms):
+
+    class DroppingUnion(object):
+        def transform(self, chunk):
+            return OrderedDict([('X', pd.DataFrame(np.ones((1, 3))))])
+
+    conv = base.Converter.__new__(base.Converter)
+    conv.output_path = str(tmpdir.join('dropped.h5'))
+    conv.chunk_size, conv.codec, conv.batch_size = 2, 'gzip-1', 2
+    conv.features = [base.Feature(fper=None, key='X',
+                                  axis_names=['batch', 'features'])]
+    with conv.create_file(conv.output_path):
+        with pytest.raises(ValueError):
+            conv._save_features_chunked(ms, DroppingUnion())
+
+
+@pytest.mark.parametrize('codec, kws', [
+    (None, {}),
+    ('gzip-1', {'compression': 'gzip', 'compression_opts': 1}),
+    ('lzf', {'compression': 'lzf'})])
+def test_codec_kws(codec, kws):
+    assert base.codec_kws(codec) == kws
+
+
+def test_codec_kws_unknown():
+    with pytest.raises(ValueError):
+        base.codec_kws('bzip2')
@@ -0,0 +1,174 @@
+#! /usr/bin/env python
+#
+# Copyright (C) 2016 Rich Lewis <rl403@cam.ac.uk>
+# License: 3-clause BSD
+
+""" Tests for lazily reading datasets. """
+
+import threading
+
+import pytest
+import numpy as np
+import pandas as pd
+
+h5py = pytest.importorskip('h5py')
+pytest.importorskip('fuel')
+
+from ...data.datasets import base  # noqa: E402
+
+N_ROWS = 50
+TRAIN = np.array([0, 1, 2, 5, 7, 8, 9, 20, 21, 22, 23, 30, 41, 49])
+
+
+@pytest.fixture
+def dataset(tmpdir, monkeypatch):
+
+    """ A dataset class reading a small file with a `train` set. """
+
+    path = str(tmpdir.join('test.h5'))
+    with h5py.File(path, 'w') as f:
+        f['X'] = np.arange(N_ROWS * 3).reshape(N_ROWS, 3)
+        f['y'] = np.arange(N_ROWS)
+        # stored out of order, as set indices are sorted when read
+        f['train_indices'] = TRAIN[::-1]
+    monkeypatch.setattr(base, 'find_in_data_path',
+                        lambda filename: str(tmpdir.join(filename)))
+
+    class TestDataset(base.Dataset):
+        filename = 'test.h5'
+
+    return TestDataset
+
+
+def collect(batches):
+    return [np.concatenate(s) for s in zip(*batches)]
+
+
+def test_read_rows_contiguous(dataset):
+    with h5py.File(base.find_in_data_path(dataset.filename), 'r') as f:
+        res = base._read_rows(f['y'], np.array([3, 4, 5]))
+    assert res.tolist() == [3, 4, 5]
+
+
+def test_read_rows_non_contiguous(dataset):
+    with h5py.File(base.find_in_data_path(dataset.filename), 'r') as f:
+        res = base._read_rows(f['X'], np.array([1, 4, 5, 9]))
+    assert res[:, 0].tolist() == [3, 12, 15, 27]
+
+
+def test_set_indices(dataset):
+    assert dataset.set_indices('train').tolist() == TRAIN.tolist()
+
+
+def test_iter_batches(dataset):
+    batches = list(dataset.iter_batches('train', sources=('X', 'y'),
+                                        batch_size=4, chunk_size=8))
+    # 14 rows in chunks of 8, 6: batches do not span chunks
+    assert [len(y) for _, y in batches] == [4, 4, 4, 2]
+    X, y = collect(batches)
+    assert y.tolist() == TRAIN.tolist()
+    assert (X[:, 0] == 3 * TRAIN).all()
+
+
+def test_iter_batches_shuffle(dataset):
+    kws = dict(sources=('X', 'y'), batch_size=4, chunk_size=4, shuffle=True)
+    batches = list(dataset.iter_batches('train', random_state=0, **kws))
+    X, y = collect(batches)
+    assert sorted(y.tolist()) == TRAIN.tolist()
+    assert y.tolist() != TRAIN.tolist()
+    # rows stay together
+    assert (X[:, 0] == 3 * y).all()
+    # rows are only shuffled within chunks, each a batch here
+    chunks = [sorted(TRAIN[i:i + 4]) for i in range(0, len(TRAIN), 4)]
+    assert sorted(sorted(b[1].tolist()) for b in batches) == sorted(chunks)
+    # reproducible
+    again = collect(dataset.iter_batches('train', random_state=0, **kws))[1]
+    assert again.tolist() == y.tolist()
+
+
+def test_iter_batches_early_close(dataset):
+    before = threading.active_count()
+    it = dataset.iter_batches('train', sources=('y',), batch_size=1,
+                              chunk_size=1, n_prefetch=1)
+    assert next(it)[0].tolist() == [0]
+    it.close()
+    assert threading.active_count() == before
+
+
+def test_prefetch():
+    assert list(base._prefetch(iter(range(10)), 2)) == list(range(10))
+
+
+def test_prefetch_reads_ahead():
+    read = []
+
+    def gen():
+        for i in range(5):
+            read.append(i)
+            yield i
+
+    it = base._prefetch(gen(), 2)
+    assert next(it) == 0
+    # the thread continues to fill the buffer while the consumer waits
+    for _ in range(100):
+        if len(read) >= 3:
+            break
+        threading.Event().wait(0.01)
+    assert len(read) >= 3
+    assert list(it) == [1, 2, 3, 4]
+
+
+def test_prefetch_error():
+
+    def gen():
+        yield 1
+        raise KeyError('bad chunk')
+
+    it = base._prefetch(gen(), 2)
+    assert next(it) == 1
+    with pytest.raises(KeyError):
+        next(it)
+
+
+def test_prefetch_break():
+    before = threading.active_count()
+    for i in base._prefetch(iter(range(1000)), 1):
+        if i == 2:
+            break
+    # breaking out of the loop closes the generator, joining the thread
+    assert threading.active_count() == before
+
+
+@pytest.fixture
+def frames(tmpdir, monkeypatch):
+
+    """ A dataset class reading a file of dataframes. """
+
+    pytest.importorskip('tables')
+    path = str(tmpdir.join('frames.h5'))
+    df = pd.DataFrame({'a': np.arange(N_ROWS), 'b': -np.arange(N_ROWS)})
+    df.to_hdf(path, key='table', format='table')
+    df.to_hdf(path, key='fixed', format='fixed')
+    monkeypatch.setattr(base, 'find_in_data_path',
+                        lambda filename: str(tmpdir.join(filename)))
+
+    class FrameDataset(base.Dataset):
+        filename = 'frames.h5'
+
+    return FrameDataset
+
+
+def test_read_frame_rows(frames):
+    assert frames.read_frame('table', start=5, stop=8).a.tolist() == [5, 6, 7]
+
+
+@pytest.mark.parametrize('key', ['table', 'fixed'])
+def test_read_frame_columns(frames, key):
+    df = frames.read_frame(key, columns=['b'])
+    assert df.columns.tolist() == ['b']
+    assert len(df) == N_ROWS
+
+
+def test_read_frame_positional(frames):
+    # positional arguments are passed on to `pd.read_hdf`, as before
+    assert len(frames.read_frame('table', 'r')) == N_ROWS
@@ -13,13 +13,17 @@ Tests for autocorrelation descriptors.
 import pytest
 import numpy as np
 
-from . import phenethylamine
+from . import ATS, phenethylamine
+from ... import Mol
 
 from ...features.descriptors.autocorrelation import (
     moreau_broto_autocorrelation,
     moran_coefficient,
-    geary_coefficient
+    geary_coefficient,
+    autocorrelation_descriptors,
+    PROPS
 )
+from ...features.descriptors.caching import cache
 
 ats_data = [(('H', 'H'), [2.952, 3.313, 3.473, 3.554]),
         (('H', 'F'), [3.032, 3.422, 3.567, 3.598]),
@@ -116,3 +120,29 @@ def test_geary(atoms, expected):
                             c_scaled=False, ks=range(1, 5))
     assert np.allclose(ans, expected, atol=0.05)
 
+
+def test_descriptors_match_functions():
+    mol = phenethylamine('Cl', 'Br')
+    res = autocorrelation_descriptors(mol, ks=range(1, 5))
+    for prop_name in PROPS[:5]:
+        cols = ['geary_{}_{}'.format(prop_name, k) for k in range(1, 5)]
+        exp = geary_coefficient(phenethylamine('Cl', 'Br'),
+                                prop_name=prop_name, ks=range(1, 5))
+        assert np.allclose(res[cols].values, exp)
+
+
+@pytest.mark.parametrize('block_size', [1, 3, 64])
+def test_descriptors_batched(block_size):
+    mols = [phenethylamine(*atoms) for atoms in ATS[:7]]
+    mols.insert(3, Mol.from_smiles('CCO'))
+    exp = autocorrelation_descriptors(mols)
+    res = autocorrelation_descriptors(mols, block_size=block_size)
+    assert np.allclose(res.values, exp.values, equal_nan=True)
+
+
+@pytest.mark.parametrize('func', [moreau_broto_autocorrelation,
+                                  moran_coefficient, geary_coefficient])
+def test_dependencies(func):
+    steps = cache.dependencies(func)
+    assert [name for name, kws in steps] == ['distance_matrix', 'lag_matrix',
+                                             'lag_moments']
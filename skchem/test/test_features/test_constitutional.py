@@ -0,0 +1,41 @@
+#! /usr/bin/env python
+#
+# Copyright (C) 2016 Rich Lewis <rl403@cam.ac.uk>
+# License: 3-clause BSD
+
+"""
+# skchem.test.test_features.test_constitutional
+
+Tests for constitutional descriptors.
+"""
+
+import pytest
+from rdkit.Chem import rdmolops
+
+from ... import Mol
+from ...features.descriptors import constitutional
+
+SMILES = ['C', 'CC.CC', 'C1CC1', 'c1ccc2ccccc2c1', 'C1CC2CCC1C2',
+          'C12C3C4C1C5C2C3C45', 'CN1C=NC2=C1C(=O)N(C(=O)N2C)C',
+          'C1CCC23CCCCC2(C1)CCCC3', 'CN(C)CC(Br)c1ccccc1']
+
+
+@pytest.mark.parametrize('smiles', SMILES)
+def test_n_paths(smiles):
+    mol = Mol.from_smiles(smiles)
+    for length in range(9):
+        exp = len(rdmolops.FindAllPathsOfLengthN(mol, length))
+        assert constitutional.n_paths(mol, length=length) == exp
+
+
+def test_n_paths_h_filled():
+    mol = Mol.from_smiles('CCO').add_hs()
+    assert constitutional.n_paths(mol, length=2) == 1
+
+
+def test_path_counts_shared():
+    mol = Mol.from_smiles('c1ccccc1')
+    for length in range(1, 7):
+        constitutional.n_paths(mol, length=length)
+    assert list(mol.cache['path_counts']) == [
+        (('max_length', constitutional.MAX_PATH_LENGTH),)]
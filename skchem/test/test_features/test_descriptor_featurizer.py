@@ -0,0 +1,91 @@
+#! /usr/bin/env python
+#
+# Copyright (C) 2016 Rich Lewis <rl403@cam.ac.uk>
+# License: 3-clause BSD
+
+"""
+# skchem.test.test_features.test_descriptor_featurizer
+
+Tests for the descriptor featurizer.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from ...features import DescriptorFeaturizer
+from ...features.descriptors import autocorrelation
+from . import ATS, phenethylamine
+
+
+@pytest.fixture(name='mols')
+def mols_fixture():
+    return pd.Series([phenethylamine(x, y) for x, y in ATS[:8]])
+
+
+def test_plan_deduplicated():
+    df = DescriptorFeaturizer(['galvez_tci', 'galvez_mtci', 'galvez_gci'],
+                              verbose=False)
+    steps = df.plan
+    assert len(steps) == len(set(steps))
+    assert [name for name, kws in steps] == [
+        'distance_matrix', 'adjacency_matrix', 'galvez_matrix',
+        'charge_matrix', 'topological_charge_index']
+
+
+def test_plan_dependencies_first():
+    df = DescriptorFeaturizer(verbose=False)
+    done = set()
+    for step, requires in df._plan.items():
+        assert requires <= done
+        done.add(step)
+
+
+def test_lagged_columns():
+    df = DescriptorFeaturizer(['n_atoms', 'ats_atomic_mass'], verbose=False)
+    lags = list(autocorrelation.KS)
+    assert list(df.columns) == ['n_atoms'] + [
+        'ats_atomic_mass_{}'.format(k) for k in lags]
+
+
+def test_matches_functions():
+    mol = phenethylamine()
+    df = DescriptorFeaturizer(['n_atoms', 'moran_polarisability'],
+                              verbose=False)
+    res = df.transform(mol)
+    exp = autocorrelation.DESCRIPTORS['moran_polarisability'](
+        phenethylamine())
+    assert res['n_atoms'] == len(mol.atoms)
+    assert np.allclose(res.iloc[1:].values, exp, equal_nan=True)
+    assert not hasattr(mol, 'cache')
+
+
+def test_failed_dependency():
+    # no conformer, so the geometric matrix cannot be calculated
+    df = DescriptorFeaturizer(['n_atoms', 'topographic_electronic_descriptor'],
+                              verbose=False)
+    res = df.transform(phenethylamine())
+    assert res['n_atoms'] > 0
+    assert np.isnan(res['topographic_electronic_descriptor'])
+
+
+def test_on_ser(mols):
+    df = DescriptorFeaturizer(verbose=False)
+    res = df.transform(mols)
+    assert res.shape == (len(mols), len(df.columns))
+    assert (res.index == mols.index).all()
+
+
+def test_parallel(mols):
+    df = DescriptorFeaturizer(dtype=np.float32, verbose=False)
+    res = df.transform(mols)
+    df.n_jobs = 2
+    res_par = df.transform(mols)
+    assert (res.dtypes == np.float32).all()
+    assert res.equals(res_par)
+
+
+@pytest.mark.parametrize('dtype', [np.int64, np.uint8, bool])
+def test_non_float_dtype(dtype):
+    with pytest.raises(ValueError):
+        DescriptorFeaturizer(dtype=dtype, verbose=False)
@@ -0,0 +1,77 @@
+#! /usr/bin/env python
+#
+# Copyright (C) 2016 Rich Lewis <rl403@cam.ac.uk>
+# License: 3-clause BSD
+
+"""
+# skchem.test.test_features.test_graph
+
+Tests for the graph featurizer.
+"""
+
+import pytest
+import numpy as np
+
+from ...features import GraphFeaturizer, GraphBatch
+from . import PHENS
+
+
+@pytest.fixture(name='gf')
+def graph_featurizer():
+    return GraphFeaturizer(verbose=False)
+
+
+@pytest.fixture(name='batch')
+def batch_fixture(gf):
+    return gf.transform(PHENS)
+
+
+def test_offsets(batch):
+    assert len(batch) == len(PHENS)
+    assert np.array_equal(batch.n_nodes, [len(m.atoms) for m in PHENS])
+    assert np.array_equal(batch.n_edges, [2 * len(m.bonds) for m in PHENS])
+    assert len(batch.node_features) == batch.node_offsets[-1]
+    assert batch.edge_index.shape == (2, batch.edge_offsets[-1])
+
+
+def test_edges_in_graph(batch):
+    graphs = batch.node_graph
+    assert np.array_equal(graphs[batch.edge_index[0]],
+                          graphs[batch.edge_index[1]])
+
+
+def test_getitem(gf, batch):
+    m = PHENS[3]
+    for res, exp in zip(batch[3], gf._transform_mol(m)):
+        assert np.array_equal(res, exp)
+
+
+def test_undirected(batch):
+    nodes, edge_index, edges = batch[0]
+    assert np.array_equal(edge_index[:, ::2], edge_index[::-1, 1::2])
+
+
+def test_parallel(batch):
+    res = GraphFeaturizer(n_jobs=2, verbose=False).transform(PHENS)
+    assert np.array_equal(res.node_features, batch.node_features)
+    assert np.array_equal(res.edge_index, batch.edge_index)
+
+
+def test_hdf(tmpdir, batch):
+    path = str(tmpdir.join('graphs.h5'))
+    batch.to_hdf(path, chunk_size=16)
+    res = GraphBatch.from_hdf(path, start=5, stop=9)
+    assert len(res) == 4
+    assert res.node_columns.equals(batch.node_columns)
+    for i in range(4):
+        for arr, exp in zip(res[i], batch[i + 5]):
+            assert np.array_equal(arr, exp)
+
+
+def test_edges_match_bonds(gf, batch):
+    _, _, edges = batch[0]
+    bonds = PHENS[0].bonds
+    cols = list(gf.edge_columns)
+    for name in ('order', 'is_aromatic', 'is_conjugated', 'is_in_ring'):
+        assert np.array_equal(edges[::2, cols.index(name)],
+                              getattr(bonds, name))
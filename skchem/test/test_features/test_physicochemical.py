@@ -0,0 +1,58 @@
+#! /usr/bin/env python
+#
+# Copyright (C) 2016 Rich Lewis <rl403@cam.ac.uk>
+# License: 3-clause BSD
+
+"""
+# skchem.test.test_features.test_physicochemical
+
+Tests for the physicochemical featurizer.
+"""
+
+import pytest
+import numpy as np
+from rdkit.Chem import Descriptors
+
+from ...features import physicochemical
+from ...features import PhysicochemicalFeaturizer
+from . import ATS, phenethylamine
+
+
+RDKIT_DESCRIPTORS = dict(Descriptors.descList)
+
+
+@pytest.mark.parametrize('name', sorted(physicochemical.SHARED_DESCRIPTORS))
+def test_shared_descriptors(name):
+    func = physicochemical.SHARED_DESCRIPTORS[name]
+    for x, y in ATS[:5]:
+        exp = RDKIT_DESCRIPTORS[name](phenethylamine(x, y))
+        res = func(phenethylamine(x, y))
+        assert np.isclose(res, exp, rtol=1e-9, atol=1e-9)
+
+
+def test_only_required_intermediates():
+    mol = phenethylamine()
+    physicochemical.mol_log_p(mol)
+    physicochemical.slogp_vsa(mol)
+    assert set(mol.cache) == {'crippen_contribs', 'labute_asa_contribs',
+                              'slogp_vsa'}
+
+
+def test_featurizer_cleans_cache():
+    mol = phenethylamine()
+    res = PhysicochemicalFeaturizer(verbose=False).transform(mol)
+    assert not hasattr(mol, 'cache')
+    assert np.isclose(res['mol_log_p'], Descriptors.MolLogP(mol))
+
+
+def test_shares_gasteiger_charges():
+    from ...features.descriptors.caching import cache
+    from ...features.descriptors.charge import max_partial_charge
+    mol = phenethylamine()
+    with cache.scope(mol):
+        PhysicochemicalFeaturizer(verbose=False).transform(mol)
+        charges = mol.cache['gasteiger_charges'][()]
+        max_partial_charge(mol)
+        # calculated once, under the key the charge descriptors use
+        assert mol.cache['gasteiger_charges'][()] is charges
+    assert not hasattr(mol, 'cache')
@@ -0,0 +1,65 @@
+#! /usr/bin/env python
+#
+# Copyright (C) 2016 Rich Lewis <rl403@cam.ac.uk>
+# License: 3-clause BSD
+
+"""
+# skchem.test.test_features.test_union
+
+Tests for the feature union.
+"""
+
+import pytest
+import pandas as pd
+
+from ...features import (FeatureUnion, MorganFeaturizer,
+                         PhysicochemicalFeaturizer, DescriptorFeaturizer)
+from . import PHENS
+
+
+@pytest.fixture(name='mols')
+def mols_fixture():
+    return pd.Series(PHENS[:6], index=['m{}'.format(i) for i in range(6)])
+
+
+@pytest.fixture(name='fpers')
+def fpers_fixture():
+    return [('morgan', MorganFeaturizer(verbose=False)),
+            ('physicochemical', PhysicochemicalFeaturizer(verbose=False)),
+            ('descriptors', DescriptorFeaturizer(
+                features=['galvez_tci', 'ats_atomic_mass'], verbose=False))]
+
+
+def test_union_matches_featurizers(mols, fpers):
+    res = FeatureUnion(fpers, verbose=False).transform(mols)
+    assert list(res) == ['morgan', 'physicochemical', 'descriptors']
+    for name, fper in fpers:
+        pd.testing.assert_frame_equal(res[name], fper.transform(mols))
+
+
+def test_union_parallel(mols, fpers):
+    # the physicochemical featurizer cannot be pickled
+    fpers = [fpers[0], fpers[2]]
+    res = FeatureUnion(fpers, n_jobs=2, verbose=False).transform(mols)
+    for name, fper in fpers:
+        pd.testing.assert_frame_equal(res[name], fper.transform(mols))
+
+
+def test_union_mol(mols, fpers):
+    res = FeatureUnion(fpers, verbose=False).transform(mols.iloc[0])
+    for name, fper in fpers:
+        pd.testing.assert_series_equal(res[name], fper.transform(mols.iloc[0]))
+
+
+def test_union_tears_down_cache(mols, fpers):
+    FeatureUnion(fpers, verbose=False).transform(mols)
+    assert not any(hasattr(mol, 'cache') for mol in mols)
+
+
+def test_union_names():
+    fu = FeatureUnion(['morgan', MorganFeaturizer(radius=3)])
+    assert list(fu.names) == ['morgan', 'MorganFeaturizer']
+    assert fu.copy().featurizers['MorganFeaturizer'].radius == 3
+
+    with pytest.raises(ValueError):
+        FeatureUnion(['morgan', 'morgan'])
@@ -53,4 +53,43 @@ def test_on_ser(af, s):
     feats = af.transform(s)
     assert np.array_equal(feats.shape, (len(s), af.max_atoms, len(af.minor_axis)))
     assert feats.ix[1, 0, 'is_C'] == True
-    assert feats.ix[2, 2, 'is_O'] == True
\ No newline at end of file
+    assert feats.ix[2, 2, 'is_O'] == True
+
+
+def test_on_ser_ragged(af, s):
+    feats = af.transform(s, ragged=True)
+    assert feats.values.shape == (2 * 3, len(af.minor_axis))
+    assert np.array_equal(feats.offsets, [0, 3, 6])
+    assert feats.index.equals(s.index)
+    padded = feats.to_padded((af.max_atoms, len(af.minor_axis)))
+    assert np.array_equal(padded, af._transform_series(s), equal_nan=True)
+
+
+def test_distance_ragged():
+    from ..features import GraphDistanceTransformer
+    gdt = GraphDistanceTransformer(verbose=False)
+    ser = pd.Series([Mol.from_smiles('CCO'), Mol.from_smiles('CCCCC')])
+    feats = gdt.transform(ser, ragged=True)
+    assert feats.values.shape == (3 * 3 + 5 * 5,)
+    assert feats[1].shape == (5, 5)
+    assert feats[1][0, 4] == 4
+    padded = feats.to_padded()
+    assert padded.shape == (2, 5, 5)
+    assert np.isnan(padded[0, 3, 3])
+
+
+def test_distance_ragged_equal_sizes():
+    from ..features import GraphDistanceTransformer
+    gdt = GraphDistanceTransformer(verbose=False)
+    ser = pd.Series([Mol.from_smiles('CCO'), Mol.from_smiles('CCN')])
+    feats = gdt.transform(ser, ragged=True)
+    assert feats.packed
+    assert feats.values.shape == (2 * 3 * 3,)
+    assert np.array_equal(feats.offsets, [0, 9, 18])
+    assert feats[1].shape == (3, 3)
+
+
+def test_ragged_unpacked_differing_shapes():
+    from ..utils import RaggedArray
+    with pytest.raises(ValueError):
+        RaggedArray.from_arrays([np.ones((2, 2)), np.ones((3, 3))])
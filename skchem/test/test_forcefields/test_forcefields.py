@@ -0,0 +1,114 @@
+#! /usr/bin/env python
+#
+# Copyright (C) 2016 Rich Lewis <rl403@cam.ac.uk>
+# License: 3-clause BSD
+
+""" Tests for forcefields generating multiple conformers. """
+
+import warnings
+from itertools import combinations
+
+import pytest
+import numpy as np
+import pandas as pd
+from rdkit.Chem.AllChem import GetConformerRMS
+from rdkit.Chem.rdDistGeom import EmbedMultipleConfs
+from rdkit.Chem.rdForceFieldHelpers import UFFGetMoleculeForceField
+
+from ...core import Mol
+from ...forcefields import UFF
+from ...forcefields.base import RoughEmbedding
+
+# flexible, so has many distinct low energy conformers
+FLEXIBLE = 'CCCCCCCCO'
+
+
+@pytest.fixture
+def mol():
+    return Mol.from_smiles(FLEXIBLE)
+
+
+def energies(mol):
+    return [UFFGetMoleculeForceField(mol, confId=conf.GetId()).CalcEnergy()
+            for conf in mol.GetConformers()]
+
+
+class FailingEmbedding(RoughEmbedding):
+    def _optimize_conformers(self, mol):
+        return [(-1, 0.)] * mol.GetNumConformers()
+
+
+def test_single_conformer(mol):
+    res = UFF(verbose=False).transform(mol)
+    assert res.GetNumConformers() == 1
+
+
+def test_n_keep(mol):
+    res = UFF(n_conformers=10, n_keep=3, verbose=False).transform(mol)
+    assert res.GetNumConformers() == 3
+
+
+def test_ordered_by_energy(mol):
+    res = UFF(n_conformers=10, verbose=False).transform(mol)
+    assert res.GetNumConformers() > 1
+    assert np.all(np.diff(energies(res)) >= -1e-6)
+
+
+def test_n_keep_lowest_energy(mol):
+    uff = UFF(n_conformers=10, in_place=True, verbose=False)
+    res = uff.embed(mol)
+    results = uff._optimize_conformers(res)
+    lowest = min(energy for status, energy in results if status != -1)
+    uff.n_keep = 1
+    assert uff._select_conformers(res, results) == 0
+    assert res.GetNumConformers() == 1
+    assert energies(res)[0] == pytest.approx(lowest, abs=1e-3)
+
+
+def test_prune(mol):
+    res = UFF(n_conformers=20, prune_rms=0.5, verbose=False).transform(mol)
+    ids = [conf.GetId() for conf in res.GetConformers()]
+    assert len(ids) > 1
+    assert all(GetConformerRMS(res, i, j) > 0.5
+               for i, j in combinations(ids, 2))
+
+
+def test_energy_window(mol):
+    EmbedMultipleConfs(mol, numConfs=4)
+    coords = [conf.GetPositions() for conf in mol.GetConformers()]
+    rough = RoughEmbedding(preembed=False, energy_window=1.5, verbose=False)
+    results = [(0, 3.), (0, 1.), (0, 2.), (0, 2.5)]
+    assert rough._select_conformers(mol, results) == 0
+    # conformers within the window of the lowest, lowest first
+    kept = [conf.GetPositions() for conf in mol.GetConformers()]
+    assert len(kept) == 3
+    assert all(np.allclose(k, coords[i]) for k, i in zip(kept, [1, 2, 3]))
+
+
+def test_select_failed_conformers_dropped(mol):
+    EmbedMultipleConfs(mol, numConfs=3)
+    coords = mol.GetConformer(1).GetPositions()
+    rough = RoughEmbedding(preembed=False, verbose=False)
+    assert rough._select_conformers(mol, [(-1, 0.), (0, 1.), (-1, 0.)]) == 0
+    assert mol.GetNumConformers() == 1
+    assert np.allclose(mol.GetConformer().GetPositions(), coords)
+
+
+def test_select_all_failed(mol):
+    EmbedMultipleConfs(mol, numConfs=3)
+    rough = RoughEmbedding(preembed=False, verbose=False)
+    assert rough._select_conformers(mol, [(-1, 0.)] * 3) == -1
+
+
+def test_all_conformers_failed(mol):
+    ff = FailingEmbedding(n_conformers=3, verbose=False)
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter('always')
+        assert pd.isnull(ff.transform(mol))
+    assert any('Failed to optimize' in str(msg.message) for msg in w)
+
+
+def test_all_conformers_failed_error(mol):
+    ff = FailingEmbedding(n_conformers=3, error_on_fail=True, verbose=False)
+    with pytest.raises(RuntimeError):
+        ff.transform(mol)
@@ -0,0 +1,65 @@
+#! /usr/bin/env python
+#
+# Copyright (C) 2016 Rich Lewis <rl403@cam.ac.uk>
+# License: 3-clause BSD
+
+"""
+# skchem.test.test_import
+
+Tests that importing scikit-chem stays light.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+HEAVY = ['h5py', 'fuel', 'matplotlib', 'sklearn', 'ipywidgets', 'IPython']
+
+# the subpackages that have always been available as attributes after
+# `import skchem`
+SUBPACKAGES = ['base', 'core', 'cross_validation', 'data', 'features',
+               'filters', 'forcefields', 'interact', 'io', 'pandas_ext',
+               'pipeline', 'resource', 'standardizers', 'utils', 'vis']
+
+
+def run(code):
+    return subprocess.check_output([sys.executable, '-c', code],
+                                   universal_newlines=True).split()
+
+
+def test_heavy_dependencies_not_imported():
+    code = ('import sys, skchem; '
+            'print(" ".join(m for m in {!r} if m in sys.modules))'.format(
+                HEAVY))
+    assert run(code) == []
+
+
+def test_periodic_table_not_read():
+    code = "import skchem; print('PERIODIC_TABLE' in vars(skchem.resource))"
+    assert run(code) == ['False']
+
+
+@pytest.mark.parametrize('name', ['vis', 'cross_validation'])
+def test_lazy_subpackage(name):
+    import skchem
+    assert getattr(skchem, name).__name__ == 'skchem.' + name
+    assert name in dir(skchem)
+
+
+@pytest.mark.parametrize('name', SUBPACKAGES)
+def test_subpackage_attribute(name):
+    import skchem
+    assert getattr(skchem, name).__name__ == 'skchem.' + name
+
+
+def test_lazy_periodic_table():
+    from .. import resource
+    assert resource.PERIODIC_TABLE.loc[6, 'symbol'] == 'C'
+    assert 'PERIODIC_TABLE' in dir(resource)
+
+
+def test_missing_attribute():
+    import skchem
+    with pytest.raises(AttributeError):
+        skchem.not_a_subpackage
@@ -9,7 +9,7 @@ import pandas as pd
 import pytest
 
 from ...resource import resource
-from ...io import read_sdf
+from ...io import read_sdf, write_sdf
 
 SINGLE_MOLECULE_PROPS = {
     'PUBCHEM_IUPAC_INCHIKEY', 'PUBCHEM_COMPOUND_CANONICALIZED',
@@ -148,3 +148,119 @@ class TestSDF(object):
 
         with pytest.raises(ValueError):
             read_sdf(resource('test_sdf', 'multi_molecule-bad_structure.sdf'), error_bad_mol=True)
+
+    def test_properties_typed(self):
+
+        """ Are property columns typed as a whole? """
+
+        df = read_sdf(resource('test_sdf', 'multi_molecule-properties.sdf'))
+        assert df.PUBCHEM_COMPOUND_CID.dtype == 'int64'
+        assert df.PUBCHEM_EXACT_MASS.dtype == 'float64'
+        assert df.PUBCHEM_IUPAC_INCHIKEY.tolist()[0].startswith('VNWKTOKETHGBQD')
+
+    def test_properties_dropped(self):
+
+        """ Are properties removed from the molecules unless requested? """
+
+        path = resource('test_sdf', 'multi_molecule-properties.sdf')
+        assert all(len(m.props) == 0 for m in read_sdf(path).structure)
+        df = read_sdf(path, mol_props=True)
+        assert df.structure.iloc[0].props['PUBCHEM_COMPOUND_CID'] == 297
+
+    def test_write_round_trip(self, tmpdir):
+
+        """ Are written frames read back the same, without the molecules
+        being modified? """
+
+        df = read_sdf(resource('test_sdf', 'multi_molecule-properties.sdf'),
+                      mol_props=True)
+        df.index = ['a', 'b', 'c']
+        path = str(tmpdir.join('out.sdf'))
+        write_sdf(df, path)
+        res = read_sdf(path)
+        assert res.index.tolist() == ['a', 'b', 'c']
+        assert res.PUBCHEM_COMPOUND_CID.tolist() == \
+            df.PUBCHEM_COMPOUND_CID.tolist()
+        assert df.structure.iloc[0].name == MULTI_MOLECULE_NAMES[0]
+        assert len(df.structure.iloc[0].props) > 0
+
+    @pytest.mark.parametrize('n_jobs', [1, 2])
+    def test_write_chunks_compressed(self, tmpdir, n_jobs):
+
+        """ Can an iterable of chunks be written in parallel, compressed? """
+
+        import gzip
+
+        ser = read_sdf(resource('test_sdf', 'multi_molecule-simple.sdf'))
+        ser = ser.structure if isinstance(ser, pd.DataFrame) else ser
+        path = str(tmpdir.join('out.sdf.gz'))
+        write_sdf((ser.iloc[i:i + 2] for i in range(0, len(ser), 2)), path,
+                  n_jobs=n_jobs)
+        with gzip.open(path) as f:
+            res = read_sdf(f)
+        assert res.index.tolist() == MULTI_MOLECULE_NAMES
+
+    @pytest.mark.parametrize('ext', ['.gz', '.bz2', '.xz'])
+    def test_read_compressed(self, tmpdir, ext):
+
+        """ Can compressed files be read from a path? """
+
+        from ...utils import open_file
+
+        path = str(tmpdir.join('multi.sdf' + ext))
+        with open(resource('test_sdf', 'multi_molecule-simple.sdf'), 'rb') as f:
+            with open_file(path, 'wb') as out:
+                out.write(f.read())
+        df = read_sdf(path)
+        assert df.index.tolist() == MULTI_MOLECULE_NAMES
+
+    def test_read_positional_supplier_args(self, tmpdir):
+
+        """ Are positional arguments after the options passed to the
+        supplier, with the compression given by keyword? """
+
+        import gzip
+
+        path = str(tmpdir.join('multi.sdf.gz'))
+        with open(resource('test_sdf', 'multi_molecule-simple.sdf'), 'rb') as f:
+            with gzip.open(path, 'wb') as out:
+                out.write(f.read())
+        # sanitize=True, removeHs=False
+        df = read_sdf(path, False, True, None, None, None, True, False, True,
+                      False, compression='gzip')
+        ser = df.structure if isinstance(df, pd.DataFrame) else df
+        assert [len(m.atoms) for m in ser] == [5, 8, 11]
+
+    def test_write_mol_block_kwargs(self, tmpdir):
+
+        """ Are keyword arguments passed to MolToMolBlock? """
+
+        ser = read_sdf(resource('test_sdf', 'multi_molecule-simple.sdf'))
+        ser = ser.structure if isinstance(ser, pd.DataFrame) else ser
+        path = str(tmpdir.join('out.sdf'))
+        write_sdf(ser, path, forceV3000=True)
+        with open(path) as f:
+            assert 'V3000' in f.read()
+
+    def test_write_positional_args(self, tmpdir):
+
+        """ Are extra positional arguments rejected, as by SDWriter? """
+
+        ser = read_sdf(resource('test_sdf', 'multi_molecule-simple.sdf'))
+        with pytest.raises(TypeError):
+            write_sdf(ser, str(tmpdir.join('out.sdf')), True, True, False, 1)
+
+    @pytest.mark.parametrize('ext', ['.gz', '.bz2'])
+    def test_write_compressed_text(self, tmpdir, ext):
+
+        """ Can compressed files be written and read back as text? """
+
+        from ...utils import open_file
+
+        ser = read_sdf(resource('test_sdf', 'multi_molecule-simple.sdf'))
+        ser = ser.structure if isinstance(ser, pd.DataFrame) else ser
+        path = str(tmpdir.join('out.sdf' + ext))
+        write_sdf(ser, path)
+        with open_file(path) as f:
+            assert f.read().count('$$$$') == len(ser)
+        assert read_sdf(path).index.tolist() == MULTI_MOLECULE_NAMES
@@ -9,7 +9,7 @@
 import pytest
 
 #required for test
-from ...io import read_smiles
+from ...io import read_smiles, write_smiles
 from ...core import Mol
 from ...resource import resource
 
@@ -97,3 +97,28 @@ class TestSmiles(object):
 
         df = read_smiles(resource('test_smiles', 'multi_molecule-bad_chemistry.smiles'), name_column=1, title_line=False)
         assert len(df) == 5
+
+    @pytest.mark.parametrize('n_jobs', [1, 2])
+    def test_write_round_trip(self, tmpdir, n_jobs):
+
+        """ Are written smiles read back in order, compressed and in
+        chunks? """
+
+        ser = read_smiles(resource('test_smiles', 'multi_molecule-simple.smiles'))
+        path = str(tmpdir.join('out.smiles.gz'))
+        write_smiles(ser, path, n_jobs=n_jobs, chunk_size=2)
+        res = read_smiles(path, name_column=1, compression='gzip')
+        assert [m.to_smiles() for m in res] == [m.to_smiles() for m in ser]
+        assert res.index.tolist() == ser.index.tolist()
+
+    def test_read_compressed(self, tmpdir):
+
+        """ Can compressed files be read from a path? """
+
+        from ...utils import open_file
+
+        path = str(tmpdir.join('multi.smiles.bz2'))
+        with open(resource('test_smiles', 'multi_molecule-simple.smiles'), 'rb') as f:
+            with open_file(path, 'wb') as out:
+                out.write(f.read())
+        assert len(read_smiles(path)) == 3
@@ -0,0 +1,4 @@
+#! /usr/bin/env python
+#
+# Copyright (C) 2015-2016 Rich Lewis <rl403@cam.ac.uk>
+# License: 3-clause BSD
@@ -0,0 +1,68 @@
+#! /usr/bin/env python
+#
+# Copyright (C) 2016 Rich Lewis <rl403@cam.ac.uk>
+# License: 3-clause BSD
+
+"""
+# skchem.test.test_pandas_ext.test_dedup
+
+Tests for deduplication of molecules.
+"""
+
+import pytest
+import pandas as pd
+
+from ... import Mol
+from ...pandas_ext import dedup
+
+SMILES = ['CCO', 'c1ccccc1', 'OCC', 'C1=CC=CC=C1', 'CCN', 'C(O)C']
+
+
+@pytest.fixture(name='mols')
+def mols_fixture():
+    return pd.Series([Mol.from_smiles(smi) for smi in SMILES],
+                     index=list('abcdef'))
+
+
+@pytest.mark.parametrize('key', ['inchi_key', 'smiles'])
+def test_group_ids(mols, key):
+    ids = dedup.group_ids(mols, key=key)
+    assert list(ids) == [0, 1, 0, 1, 2, 0]
+    assert (ids.index == mols.index).all()
+
+
+def test_first_occurrences(mols):
+    mask = dedup.first_occurrences(mols)
+    assert list(mask) == [True, True, False, False, True, False]
+
+
+def test_chunked_parallel(mols):
+    exp = dedup.canonical_keys(mols)
+    res = dedup.canonical_keys(iter(list(mols)), n_jobs=2, chunk_size=4)
+    assert list(res) == list(exp)
+
+
+def test_missing_keys_not_merged(mols):
+
+    def failing(mol):
+        raise ValueError('no key')
+
+    keys = dedup.canonical_keys(mols, key=failing)
+    assert keys.isnull().all()
+    assert dedup.factorize(keys).is_unique
+
+
+def test_merge_duplicates(mols):
+    df = pd.DataFrame({'structure': mols,
+                       'activity': range(len(mols))})
+    res = dedup.merge_duplicates(df, agg='max')
+    assert list(res.index) == ['a', 'b', 'e']
+    assert list(res.columns) == ['structure', 'activity']
+    assert list(res.activity) == [5, 3, 4]
+    assert res.structure['a'] is mols['a']
+
+
+def test_accessor(mols):
+    assert list(mols.mol.duplicated()) == [False, False, True, True, False,
+                                           True]
+    assert list(mols.mol.drop_duplicates().index) == ['a', 'b', 'e']
@@ -0,0 +1,71 @@
+#! /usr/bin/env python
+#
+# Copyright (C) 2016 Rich Lewis <rl403@cam.ac.uk>
+# License: 3-clause BSD
+
+"""
+# skchem.test.test_pandas_ext.test_structure_methods
+
+Tests for the `.mol` accessor.
+"""
+
+import pytest
+import pandas as pd
+
+from ... import Mol
+from ...pandas_ext import structure_methods
+
+SMILES = ['CCO', 'c1ccccc1', 'CC(=O)O', 'CCN', 'ClCCl', 'C1CC1']
+
+
+@pytest.fixture(name='mols')
+def mols_fixture():
+    return pd.Series([Mol.from_smiles(smi) for smi in SMILES],
+                     index=list('abcdef'), name='structure')
+
+
+@pytest.mark.parametrize('n_jobs,chunk_size', [(1, 4), (2, 4)])
+def test_batch_operations(mols, n_jobs, chunk_size):
+    kws = dict(n_jobs=n_jobs, chunk_size=chunk_size)
+    for name, exp in [
+            ('to_smiles', [m.to_smiles() for m in mols]),
+            ('to_inchi_key', [m.to_inchi_key() for m in mols]),
+            ('to_formula', [m.to_formula() for m in mols]),
+            ('mass', [m.mass for m in mols]),
+            ('n_atoms', [len(m.atoms) for m in mols])]:
+        res = getattr(mols.mol, name)(**kws)
+        assert res.tolist() == exp
+        assert (res.index == mols.index).all()
+
+    assert mols.mol.n_atoms(heavy_only=True, **kws).tolist() == \
+        mols.mol.n_atoms().tolist()
+
+
+@pytest.mark.parametrize('n_jobs', [1, 2])
+def test_add_remove_hs(mols, n_jobs):
+    mols.iloc[0].props['source'] = 'test'
+    res = mols.mol.add_hs(n_jobs=n_jobs, chunk_size=4)
+    assert res.name == 'structure'
+    assert res.map(lambda m: len(m.atoms)).tolist() == \
+        [len(m.add_hs().atoms) for m in mols]
+    assert res.iloc[0].props['source'] == 'test'
+    assert res.mol.remove_hs(n_jobs=n_jobs).mol.to_smiles().tolist() == \
+        mols.mol.to_smiles().tolist()
+
+
+def test_check_cached(mols, monkeypatch):
+    calls = []
+
+    def counting(ser):
+        calls.append(ser)
+        return True
+
+    monkeypatch.setattr(structure_methods, 'only_contains_mols', counting)
+    mols.mol
+    mols.mol
+    assert len(calls) == 1
+
+
+def test_only_mols():
+    with pytest.raises(AttributeError):
+        pd.Series([Mol.from_smiles('C'), 'C']).mol
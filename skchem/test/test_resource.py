@@ -0,0 +1,47 @@
+#! /usr/bin/env python
+#
+# Copyright (C) 2016 Rich Lewis <rl403@cam.ac.uk>
+# License: 3-clause BSD
+
+"""
+# skchem.test.test_resource
+
+Tests for the packaged resources.
+"""
+
+import numpy as np
+import pandas as pd
+
+from ..resource import resource, ELEMENTS, ElementTable, PERIODIC_TABLE
+
+
+def test_elements_compiled():
+    """ The compiled element table must be regenerated with
+    `scripts/compile_elements.py` when `atom_data.csv` changes. """
+
+    exp = ElementTable.from_csv(resource('atom_data.csv'))
+    assert ELEMENTS.columns == exp.columns
+    for col in exp.columns:
+        np.testing.assert_array_equal(ELEMENTS[col], exp[col])
+
+
+def test_elements_match_periodic_table():
+    for col in ('van_der_waals_radius', 'period', 'symbol'):
+        pd.testing.assert_series_equal(
+            pd.Series(ELEMENTS[col][1:], index=PERIODIC_TABLE.index,
+                      name=col),
+            PERIODIC_TABLE[col], check_dtype=False)
+
+
+def test_elements_vectorized():
+    res = ELEMENTS.pauling_electronegativity[np.array([6, 7, 6])]
+    assert res.tolist() == [2.55, 3.04, 2.55]
+    assert np.isnan(ELEMENTS.pauling_electronegativity[0])
+
+
+def test_elements_round_trip(tmpdir):
+    path = str(tmpdir.join('elements.npz'))
+    ELEMENTS.save(path)
+    res = ElementTable.load(path)
+    assert res.columns == ELEMENTS.columns
+    np.testing.assert_array_equal(res.hexcode, ELEMENTS.hexcode)
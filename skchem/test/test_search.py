@@ -0,0 +1,77 @@
+#! /usr/bin/env python
+#
+# Copyright (C) 2016 Rich Lewis <rl403@cam.ac.uk>
+# License: 3-clause BSD
+
+"""
+# skchem.test.test_search
+
+Tests for the substructure search index.
+"""
+
+import pytest
+import pandas as pd
+
+from .. import Mol
+from ..search import SubstructureIndex
+
+SMILES = ['CCO', 'c1ccccc1O', 'c1ccccc1N', 'CCN', 'c1ccncc1', 'CC(=O)O',
+          'CC(=O)Oc1ccccc1C(=O)O', 'C1CCCCC1', 'O=C(O)c1ccccc1', 'CCCCN']
+
+QUERIES = ['c1ccccc1', 'C(=O)O', '[#7]', 'CC', 'C1CCCCC1', '[Cl]']
+
+
+@pytest.fixture(name='mols')
+def mols_fixture():
+    return pd.Series([Mol.from_smiles(smi) for smi in SMILES],
+                     index=['mol_{}'.format(i) for i in range(len(SMILES))])
+
+
+@pytest.fixture(name='index')
+def index_fixture(mols):
+    return SubstructureIndex.from_mols(mols, fp_size=1024)
+
+
+def expected(mols, query):
+    query = Mol.from_smarts(query)
+    return [i for i, mol in mols.items() if mol.HasSubstructMatch(query)]
+
+
+@pytest.mark.parametrize('query', QUERIES)
+def test_search(mols, index, query):
+    res = index.search(query)
+    assert res.index.tolist() == expected(mols, query)
+    assert all(isinstance(mol, Mol) for mol in res)
+
+
+@pytest.mark.parametrize('query', QUERIES)
+def test_screen_no_false_negatives(mols, index, query):
+    candidates = set(index.index[index.screen(query)])
+    assert set(expected(mols, query)) <= candidates
+
+
+def test_parallel(mols, index):
+    index.n_jobs = 2
+    assert index.search('c1ccccc1').index.tolist() == expected(
+        mols, 'c1ccccc1')
+
+
+def test_chunked_build(mols, index):
+    res = SubstructureIndex.from_mols(iter(list(mols)), fp_size=1024,
+                                      chunk_size=3)
+    assert (res.fingerprints == index.fingerprints).all()
+    assert (res.binaries == index.binaries).all()
+
+
+def test_save_load(tmpdir, mols, index):
+    path = str(tmpdir.join('index.npz'))
+    index.save(path)
+    res = SubstructureIndex.load(path)
+    assert res.index.tolist() == index.index.tolist()
+    assert res.fp_size == 1024
+    assert res.search('[#7]').index.tolist() == expected(mols, '[#7]')
+
+
+def test_bad_fp_size(mols):
+    with pytest.raises(ValueError):
+        SubstructureIndex.from_mols(mols, fp_size=1000)
@@ -12,13 +12,16 @@ Module providing utility functions for scikit-chem
 from .suppress import Suppressor
 from .string import camel_to_snail, free_to_snail
 from .progress import NamedProgressBar, DummyProgressBar
-from .io import line_count, sdf_count, json_dump, yaml_dump
+from .io import (line_count, sdf_count, json_dump, yaml_dump, open_file,
+                 infer_compression)
 from .helpers import (iterable_to_series, nanarray, squeeze,
                       optional_second_method, Defaults)
+from .ragged import RaggedArray
 
 __all__ = [
     'Suppressor', 'camel_to_snail', 'free_to_snail', 'NamedProgressBar',
     'DummyProgressBar', 'json_dump', 'yaml_dump', 'line_count', 'sdf_count',
+    'open_file', 'infer_compression',
     'iterable_to_series', 'nanarray', 'squeeze', 'optional_second_method',
-    'Defaults'
+    'Defaults', 'RaggedArray'
 ]
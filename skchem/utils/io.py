@@ -9,8 +9,206 @@
 IO helper functions for skchem.
 """
 
-import yaml
+import bz2
+import gzip
+import io
 import json
+import os
+import threading
+try:
+    import queue
+except ImportError:  # py2 compat
+    import Queue as queue
+
+import yaml
+
+BUFFER_SIZE = 1024 * 1024
+
+COMPRESSIONS = {
+    '.gz': 'gzip',
+    '.bz2': 'bz2',
+    '.xz': 'xz',
+    '.zst': 'zstd'
+}
+
+
+def infer_compression(path):
+
+    """ Infer the compression of a file from its extension.
+
+    Args:
+        path (str):
+            The path of the file.
+
+    Returns:
+        str:
+            One of 'gzip', 'bz2', 'xz' or 'zstd', or `None` if the file is not
+            compressed.
+
+    Examples:
+        >>> infer_compression('mols.sdf.gz')
+        'gzip'
+        >>> infer_compression('mols.sdf') is None
+        True
+    """
+
+    return COMPRESSIONS.get(os.path.splitext(path)[1].lower())
+
+
+class BackgroundReader(io.RawIOBase):
+
+    """ A binary stream reading ahead from a file in a background thread.
+
+    Blocks are read (and so decompressed, for compressed files) by the thread
+    into a bounded queue, so that reading overlaps with whatever is done with
+    the data.
+
+    Args:
+        f (file-like):
+            The binary file to read from, which is closed with the reader.
+        block_size (int):
+            The number of bytes to read at once.
+        n_blocks (int):
+            The maximum number of blocks to read ahead.
+    """
+
+    def __init__(self, f, block_size=BUFFER_SIZE, n_blocks=8):
+        super(BackgroundReader, self).__init__()
+        self._f = f
+        self._queue = queue.Queue(maxsize=n_blocks)
+        self._stop = threading.Event()
+        self._block = memoryview(b'')
+        self._pos = 0
+        self._done = False
+        self._thread = threading.Thread(target=self._fill, args=(block_size,))
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _put(self, item):
+        # time out periodically, so the thread stops if the reader is closed
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _fill(self, block_size):
+        try:
+            while not self._stop.is_set():
+                block = self._f.read(block_size)
+                self._put(block)  # an empty block marks the end
+                if not block:
+                    return
+        except Exception as e:  # pylint: disable=broad-except
+            # raised in the reading thread instead
+            self._put(e)
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        if self._pos >= len(self._block):
+            if self._done:
+                return 0
+            item = self._queue.get()
+            if isinstance(item, Exception):
+                self._done = True
+                raise item
+            if not item:
+                self._done = True
+                return 0
+            self._block, self._pos = memoryview(item), 0
+        n = min(len(b), len(self._block) - self._pos)
+        b[:n] = self._block[self._pos:self._pos + n]
+        self._pos += n
+        return n
+
+    def close(self):
+        if not self.closed:
+            self._stop.set()
+            self._thread.join()
+            self._f.close()
+        super(BackgroundReader, self).close()
+
+
+def _binary(mode):
+
+    """ The binary version of a file mode. """
+
+    return mode.replace('t', '') + ('' if 'b' in mode else 'b')
+
+
+def _text(f, mode):
+
+    """ Wrap a binary file for text modes (`gzip.open` and `bz2.open` do this
+    on Python 3 only). """
+
+    return f if 'b' in mode else io.TextIOWrapper(f)
+
+
+def open_file(path, mode='rt', compression='infer', buffer_size=BUFFER_SIZE,
+              background=False):
+
+    """ Open a file, which may be compressed.
+
+    Args:
+        path (str):
+            The path of the file.
+        mode (str):
+            The mode to open the file in, as for `open`.
+        compression (str):
+            The compression of the file, one of 'gzip', 'bz2', 'xz' (which
+            requires `backports.lzma` on Python 2), 'zstd' (which requires
+            `zstandard`) or `None`.  If 'infer', infer from the extension of
+            the file.
+        buffer_size (int):
+            The size in bytes of the buffer for uncompressed files.
+        background (bool):
+            Whether to decompress in a background thread, when reading a
+            compressed file.
+
+    Returns:
+        file-like:
+            The opened file.
+    """
+
+    if compression == 'infer':
+        compression = infer_compression(path)
+
+    if background and compression is not None and 'r' in mode:
+        f = open_file(path, 'rb', compression)
+        f = io.BufferedReader(BackgroundReader(f, buffer_size), buffer_size)
+        return f if 'b' in mode else io.TextIOWrapper(f)
+
+    if compression is None:
+        return open(path, mode, buffering=buffer_size)
+    elif compression == 'gzip':
+        # the default level of 9 is much slower, for little reduction in size
+        return _text(gzip.GzipFile(path, _binary(mode), compresslevel=6),
+                     mode)
+    elif compression == 'bz2':
+        return _text(bz2.BZ2File(path, _binary(mode)), mode)
+    elif compression == 'xz':
+        try:
+            import lzma
+        except ImportError:  # py2 compat
+            try:
+                from backports import lzma
+            except ImportError:
+                raise ImportError('backports.lzma is required for xz '
+                                  'compression on Python 2.')
+        return lzma.open(path, mode)
+    elif compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError('zstandard is required for zstd compression.')
+        return zstandard.open(path, mode)
+    else:
+        raise ValueError('Compression {} not recognized.  Use one of '
+                         '{}.'.format(compression,
+                                      sorted(COMPRESSIONS.values())))
 
 
 def line_count(filename):
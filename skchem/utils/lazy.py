@@ -0,0 +1,71 @@
+#! /usr/bin/env python
+#
+# Copyright (C) 2016 Rich Lewis <rl403@cam.ac.uk>
+# License: 3-clause BSD
+
+"""
+## skchem.utils.lazy
+
+Module attributes that are only loaded when first accessed.
+"""
+
+import sys
+import types
+
+
+class LazyModule(types.ModuleType):
+
+    """ A module, some attributes of which are loaded on first access.
+
+    Rather than being created directly, a module is made lazy from within
+    itself with `make_lazy`, which replaces it in `sys.modules`.
+
+    Args:
+        module (types.ModuleType):
+            The module to copy.
+        loaders (dict):
+            Functions taking no arguments returning the lazy attributes, by
+            name.
+    """
+
+    def __init__(self, module, loaders):
+        super(LazyModule, self).__init__(module.__name__, module.__doc__)
+        self.__dict__.update(module.__dict__)
+        self.__dict__['_lazy_loaders'] = dict(loaders)
+
+    def __getattr__(self, name):
+        # only called if the attribute is not (yet) set on the module
+        loaders = self.__dict__.get('_lazy_loaders', {})
+        if name not in loaders:
+            raise AttributeError('module {!r} has no attribute {!r}'.format(
+                self.__name__, name))
+        value = loaders[name]()
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        return sorted(set(self.__dict__) | set(self._lazy_loaders))
+
+
+def make_lazy(name, loaders):
+
+    """ Make a module load some of its attributes on first access.
+
+    This should be called at the end of the module's code.  It works on all
+    supported Python versions, unlike a module level `__getattr__`.
+
+    Args:
+        name (str):
+            The name of the module, i.e. `__name__`.
+        loaders (dict):
+            Functions taking no arguments returning the lazy attributes, by
+            name.
+
+    Returns:
+        LazyModule:
+            The module that replaces it in `sys.modules`.
+    """
+
+    module = LazyModule(sys.modules[name], loaders)
+    sys.modules[name] = module
+    return module
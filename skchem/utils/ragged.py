@@ -0,0 +1,197 @@
+#! /usr/bin/env python
+#
+# Copyright (C) 2016 Rich Lewis <rl403@cam.ac.uk>
+# License: 3-clause BSD
+
+"""
+# skchem.utils.ragged
+
+Ragged arrays, for batches of differently sized per-molecule arrays.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class RaggedArray(object):
+
+    """ A batch of arrays of differing shapes, stored contiguously.
+
+    The layout of `values` is chosen explicitly, never from the data:
+
+    - by default, arrays sharing their trailing dimensions (e.g. per-atom
+      features of shape `(n_atoms, n_features)`) are stored as concatenated
+      rows, so `values` is of shape `(sum(n_atoms), n_features)`, and
+      `offsets` count rows.
+    - if `packed`, each array (e.g. a distance matrix of shape
+      `(n_atoms, n_atoms)`) is flattened and the blocks are packed into a one
+      dimensional `values`, and `offsets` count elements.
+
+    Args:
+        values (np.ndarray):
+            The concatenated data.
+        offsets (np.ndarray):
+            The start of each array along the first axis of `values`, with the
+            end of the last array appended.
+        shapes (np.ndarray):
+            The shape of each array.
+        index (pd.Index):
+            The index of the batch.
+        packed (bool):
+            Whether the arrays are stored as flattened blocks.
+
+    Examples:
+        >>> import numpy as np
+        >>> r = RaggedArray.from_arrays([np.ones((2, 3)), np.zeros((1, 3))])
+        >>> r.values.shape
+        (3, 3)
+        >>> r.offsets
+        array([0, 2, 3])
+        >>> r[1].shape
+        (1, 3)
+        >>> r.to_padded().shape
+        (2, 2, 3)
+
+        Square arrays are packed as blocks, whatever their sizes:
+
+        >>> r = RaggedArray.from_arrays([np.ones((2, 2)), np.zeros((2, 2))],
+        ...                             packed=True)
+        >>> r.values.shape
+        (8,)
+        >>> r.offsets
+        array([0, 4, 8])
+    """
+
+    def __init__(self, values, offsets, shapes, index=None, packed=False):
+        self.values = values
+        self.offsets = np.asarray(offsets)
+        self.shapes = np.asarray(shapes)
+        if index is None:
+            index = pd.RangeIndex(len(self.shapes), name='batch')
+        self.index = index
+        self.packed = packed
+
+    @classmethod
+    def from_arrays(cls, arrays, index=None, dtype=float, packed=False):
+
+        """ Create a ragged array from an iterable of arrays.
+
+        Args:
+            arrays (iterable<np.ndarray>):
+                The arrays, with the same number of dimensions.
+            index (pd.Index):
+                The index of the batch.
+            dtype (np.dtype):
+                The dtype of the values.  If `None`, infer from the arrays.
+            packed (bool):
+                Whether to store the arrays as flattened blocks, rather than
+                as concatenated rows.
+
+        Returns:
+            RaggedArray
+
+        Raises:
+            ValueError:
+                If not `packed` and the trailing dimensions of the arrays
+                differ.
+        """
+
+        arrays = [np.asarray(arr, dtype=dtype) for arr in arrays]
+        if not len(arrays):
+            return cls(np.empty(0, dtype=dtype), np.zeros(1, dtype=int),
+                       np.empty((0, 1), dtype=int), index=index,
+                       packed=packed)
+
+        shapes = np.array([arr.shape for arr in arrays])
+        if packed:
+            values = np.concatenate([arr.ravel() for arr in arrays])
+            lengths = shapes.prod(axis=1)
+        else:
+            if len({arr.shape[1:] for arr in arrays}) > 1:
+                raise ValueError('Arrays with differing trailing dimensions '
+                                 'must be packed.')
+            values = np.concatenate(arrays)
+            lengths = shapes[:, 0]
+        offsets = np.concatenate(([0], np.cumsum(lengths)))
+        return cls(values, offsets, shapes, index=index, packed=packed)
+
+    @classmethod
+    def from_padded(cls, padded, lengths, index=None, dtype=float,
+                    packed=False):
+
+        """ Create a ragged array from a padded array.
+
+        Args:
+            padded (np.ndarray):
+                The padded array, of shape `(n, max_length, ...)`.
+            lengths (iterable<int>):
+                The number of valid rows of each item.
+            index (pd.Index):
+                The index of the batch.
+            dtype (np.dtype):
+                The dtype of the values.  If `None`, infer from the arrays.
+            packed (bool):
+                Whether to store the arrays as flattened blocks, see
+                `from_arrays`.
+
+        Returns:
+            RaggedArray
+        """
+
+        return cls.from_arrays((arr[:length]
+                                for arr, length in zip(padded, lengths)),
+                               index=index, dtype=dtype, packed=packed)
+
+    @property
+    def lengths(self):
+
+        """ np.ndarray: the length of the first axis of each array. """
+
+        return self.shapes[:, 0]
+
+    @property
+    def nbytes(self):
+
+        """ int: the number of bytes used by the data. """
+
+        return self.values.nbytes + self.offsets.nbytes + self.shapes.nbytes
+
+    def __len__(self):
+        return len(self.shapes)
+
+    def __getitem__(self, i):
+        return self.values[self.offsets[i]:self.offsets[i + 1]].reshape(
+            self.shapes[i])
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def to_padded(self, shape=None, fill_value=np.nan):
+
+        """ Return the data as a dense, padded array.
+
+        Args:
+            shape (tuple<int>):
+                The shape to pad each array to.  If `None`, use the maximum
+                size of each dimension.
+            fill_value (float):
+                The value to pad with.
+
+        Returns:
+            np.ndarray:
+                An array of shape `(len(self),) + shape`.
+        """
+
+        if shape is None:
+            shape = tuple(self.shapes.max(axis=0)) if len(self) else (0,)
+        dtype = np.result_type(self.values.dtype, np.asarray(fill_value))
+        res = np.full((len(self),) + tuple(shape), fill_value, dtype=dtype)
+        for i, arr in enumerate(self):
+            res[(i,) + tuple(slice(0, d) for d in arr.shape)] = arr
+        return res
+
+    def __repr__(self):
+        return '<{klass} n={n} nbytes={nbytes} packed={packed} at ' \
+            '{address}>'.format(klass=self.__class__.__name__, n=len(self),
+                                nbytes=self.nbytes, packed=self.packed,
+                                address=hex(id(self)))